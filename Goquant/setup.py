@@ -12,7 +12,7 @@ setup(
         "fastapi>=0.104.1",
         "uvicorn[standard]>=0.24.0",
         "websockets>=12.0",
-        "sortedcontainers>=2.4.0",
+        "numpy>=1.26.0",
         "pydantic>=2.5.0",
         "pydantic-settings>=2.1.0",
         "structlog>=23.2.0",
@@ -23,6 +23,7 @@ setup(
             "pytest>=7.4.3",
             "pytest-asyncio>=0.21.1",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "httpx>=0.25.2",
         ],
     },
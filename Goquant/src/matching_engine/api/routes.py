@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException, status
 
 from .schemas import OrderRequest, OrderResponse, OrderBookResponse
 from .dependencies import MatchingEngineDep, LoggerDep
-from ..core.models import Order, OrderStatus
+from ..core.models import OrderStatus, QTY_SCALE, to_ticks
 from ..core.exceptions import (
     OrderValidationError,
     InsufficientLiquidityError,
@@ -41,23 +41,31 @@ async def submit_order(
         # Generate order ID
         order_id = engine.generate_order_id()
         
-        # Create order object
-        order = Order(
+        # Create order object from the engine's pool
+        qty_lots = to_ticks(order_request.quantity, QTY_SCALE)
+        order = engine.order_pool.acquire(
             order_id=order_id,
             symbol=order_request.symbol,
             order_type=order_request.order_type,
             side=order_request.side,
-            quantity=order_request.quantity,
-            price=order_request.price,
+            qty_lots=qty_lots,
+            price_ticks=to_ticks(order_request.price) if order_request.price is not None else None,
             timestamp=datetime.utcnow(),
-            remaining_quantity=order_request.quantity,
+            remaining_lots=qty_lots,
             status=OrderStatus.NEW,
-            stop_price=order_request.stop_price
+            stop_price_ticks=(
+                to_ticks(order_request.stop_price) if order_request.stop_price is not None else None
+            )
         )
         
         # Process order
         result = engine.process_order(order)
         
+        # Orders that finished without resting are not referenced anywhere
+        # else, so their slot can be reused
+        if order.status in (OrderStatus.FILLED, OrderStatus.CANCELLED):
+            engine.order_pool.release(order)
+        
         return OrderResponse(
             order_id=result.order_id,
             status=result.status,
@@ -1,11 +1,15 @@
 """Core matching engine implementation."""
 
+from collections import deque
 from decimal import Decimal
 from datetime import datetime
 from typing import List, Optional
 import asyncio
 
-from .models import Order, Trade, OrderType, Side, OrderStatus, OrderResult
+from .models import (
+    Order, OrderPool, Trade, OrderType, Side, OrderStatus, OrderResult,
+    QTY_SCALE, from_ticks
+)
 from .order_book import OrderBook, PriceLevel
 from .exceptions import OrderValidationError, InsufficientLiquidityError
 
@@ -45,11 +49,19 @@ class MatchingEngine:
         # Stop orders waiting to be triggered
         self.stop_orders: dict[str, list[Order]] = {}  # symbol -> list of stop orders
         
+        # Reusable Order instances for bulk construction (e.g. snapshot restore)
+        self.order_pool = OrderPool()
+        
         # Persistence
         self.enable_persistence = enable_persistence
         self.snapshot_interval = snapshot_interval
         self.last_snapshot_time = None
         self.snapshot_manager = None
+        # Book mutations since the last snapshot, consumed by delta snapshots
+        self._dirty_events: deque[tuple] = deque()
+        # Set while process_orders runs; defers per-order publishing and
+        # snapshot checks to the end of the batch
+        self._batching = False
         
         if enable_persistence:
             from ..persistence.snapshot import OrderBookSnapshot
@@ -122,13 +134,13 @@ class MatchingEngine:
         self.trade_id_counter += 1
         return f"TRD-{self.trade_id_counter:010d}"
     
-    def check_stop_orders(self, symbol: str, last_trade_price: Decimal):
+    def check_stop_orders(self, symbol: str, last_trade_ticks: int):
         """
         Check if any stop orders should be triggered based on last trade price.
         
         Args:
             symbol: Trading symbol
-            last_trade_price: Price of last trade execution
+            last_trade_ticks: Price of last trade execution in ticks
         """
         if symbol not in self.stop_orders:
             return
@@ -142,29 +154,31 @@ class MatchingEngine:
                 # Stop-loss buy triggers when price goes above stop_price
                 # Stop-loss sell triggers when price goes below stop_price
                 if stop_order.side == Side.BUY:
-                    should_trigger = last_trade_price >= stop_order.stop_price
+                    should_trigger = last_trade_ticks >= stop_order.stop_price_ticks
                 else:
-                    should_trigger = last_trade_price <= stop_order.stop_price
+                    should_trigger = last_trade_ticks <= stop_order.stop_price_ticks
             
             elif stop_order.order_type == OrderType.STOP_LIMIT:
                 # Same trigger logic as stop-loss
                 if stop_order.side == Side.BUY:
-                    should_trigger = last_trade_price >= stop_order.stop_price
+                    should_trigger = last_trade_ticks >= stop_order.stop_price_ticks
                 else:
-                    should_trigger = last_trade_price <= stop_order.stop_price
+                    should_trigger = last_trade_ticks <= stop_order.stop_price_ticks
             
             elif stop_order.order_type == OrderType.TAKE_PROFIT:
                 # Take-profit buy triggers when price goes below stop_price
                 # Take-profit sell triggers when price goes above stop_price
                 if stop_order.side == Side.BUY:
-                    should_trigger = last_trade_price <= stop_order.stop_price
+                    should_trigger = last_trade_ticks <= stop_order.stop_price_ticks
                 else:
-                    should_trigger = last_trade_price >= stop_order.stop_price
+                    should_trigger = last_trade_ticks >= stop_order.stop_price_ticks
             
             if should_trigger:
                 stop_order.is_triggered = True
                 triggered_orders.append(stop_order)
                 self.stop_orders[symbol].remove(stop_order)
+                if self.enable_persistence:
+                    self._dirty_events.append(("unstop", symbol, stop_order.order_id))
                 
                 if self.logger:
                     self.logger.info(
@@ -172,7 +186,7 @@ class MatchingEngine:
                         order_id=stop_order.order_id,
                         order_type=stop_order.order_type.value,
                         stop_price=str(stop_order.stop_price),
-                        trigger_price=str(last_trade_price)
+                        trigger_price=str(from_ticks(last_trade_ticks))
                     )
         
         # Process triggered orders (convert and match directly to avoid recursion)
@@ -182,22 +196,22 @@ class MatchingEngine:
             if original_type == OrderType.STOP_LOSS:
                 # Convert to market order
                 triggered_order.order_type = OrderType.MARKET
-                triggered_order.price = None
+                triggered_order.price_ticks = None
             elif original_type == OrderType.STOP_LIMIT:
                 # Convert to limit order
                 triggered_order.order_type = OrderType.LIMIT
             elif original_type == OrderType.TAKE_PROFIT:
                 # Convert to limit order at stop_price
                 triggered_order.order_type = OrderType.LIMIT
-                if triggered_order.price is None:
-                    triggered_order.price = triggered_order.stop_price
+                if triggered_order.price_ticks is None:
+                    triggered_order.price_ticks = triggered_order.stop_price_ticks
             
             # Match the triggered order directly
             order_book = self.get_or_create_order_book(triggered_order.symbol)
             trades = self.match_order(triggered_order, order_book)
             
             # Handle remaining quantity
-            if triggered_order.remaining_quantity > 0 and triggered_order.can_rest_on_book():
+            if triggered_order.remaining_lots > 0 and triggered_order.can_rest_on_book():
                 self.add_to_book(triggered_order, order_book)
     
     def process_order(self, order: Order) -> OrderResult:
@@ -230,8 +244,8 @@ class MatchingEngine:
                 order_type=order.order_type.value,
                 side=order.side.value,
                 quantity=str(order.quantity),
-                price=str(order.price) if order.price else None,
-                stop_price=str(order.stop_price) if order.stop_price else None
+                price=str(order.price) if order.price_ticks else None,
+                stop_price=str(order.stop_price) if order.stop_price_ticks else None
             )
         
         # Handle stop orders - add to stop order list
@@ -239,6 +253,8 @@ class MatchingEngine:
             if order.symbol not in self.stop_orders:
                 self.stop_orders[order.symbol] = []
             self.stop_orders[order.symbol].append(order)
+            if self.enable_persistence:
+                self._dirty_events.append(("stop", order))
             
             return OrderResult(
                 order_id=order.order_id,
@@ -272,13 +288,13 @@ class MatchingEngine:
         # Determine final status
         if order.is_filled():
             status = "filled"
-        elif order.remaining_quantity < order.quantity:
+        elif order.remaining_lots < order.qty_lots:
             status = "partial"
         else:
             status = "new"
         
         # Handle remaining quantity based on order type
-        if order.remaining_quantity > 0:
+        if order.remaining_lots > 0:
             if order.order_type == OrderType.LIMIT:
                 # Limit order: rest remainder on book
                 self.add_to_book(order, order_book)
@@ -303,11 +319,48 @@ class MatchingEngine:
         )
         
         # Check if snapshot is needed
-        if self.enable_persistence:
+        if self.enable_persistence and not self._batching:
             self._check_snapshot()
         
         return result
     
+    def process_orders(self, orders: List[Order]) -> List[OrderResult]:
+        """
+        Process a batch of orders in submission order.
+        
+        Each order is handled exactly as by process_order, but BBO and
+        order book updates are published once per touched symbol, and the
+        snapshot check runs once, at the end of the batch.
+        
+        Args:
+            orders: Orders to process, in priority order
+            
+        Returns:
+            OrderResult for each order, in the same order
+        """
+        old_bbos = {
+            symbol: self.get_or_create_order_book(symbol).calculate_bbo()
+            for symbol in {order.symbol for order in orders}
+        }
+        
+        self._batching = True
+        try:
+            return [self.process_order(order) for order in orders]
+        finally:
+            self._batching = False
+            
+            # Publish BBO updates for symbols whose BBO changed
+            if self.market_data_publisher:
+                for symbol, old_bbo in old_bbos.items():
+                    order_book = self.order_books[symbol]
+                    new_bbo = order_book.calculate_bbo()
+                    if self._bbo_changed(old_bbo, new_bbo):
+                        asyncio.create_task(self.market_data_publisher.publish_bbo_update(symbol, new_bbo))
+                        asyncio.create_task(self.market_data_publisher.publish_orderbook_update(symbol, order_book))
+            
+            if self.enable_persistence:
+                self._check_snapshot()
+    
     def _can_fill_fok(self, order: Order, order_book: OrderBook) -> bool:
         """
         Check if FOK order can be completely filled.
@@ -319,30 +372,7 @@ class MatchingEngine:
         Returns:
             True if order can be completely filled
         """
-        # Get opposite side of book
-        if order.side == Side.BUY:
-            price_levels = order_book.asks
-        else:
-            price_levels = order_book.bids
-        
-        available_quantity = Decimal("0")
-        remaining_to_fill = order.quantity
-        
-        # Check available liquidity at acceptable prices
-        for price, level in price_levels.items():
-            # Check if we can match at this price
-            if not self._can_match(order, price):
-                break
-            
-            # Add available quantity at this level
-            fillable = min(remaining_to_fill, level.total_quantity)
-            available_quantity += fillable
-            remaining_to_fill -= fillable
-            
-            if remaining_to_fill == 0:
-                return True
-        
-        return remaining_to_fill == 0
+        return order_book.can_fill_fok(order.side, order.price_ticks, order.qty_lots)
     
     def match_order(self, order: Order, order_book: OrderBook) -> List[Trade]:
         """
@@ -358,66 +388,77 @@ class MatchingEngine:
         trades = []
         
         # Get opposite side of book
-        if order.side == Side.BUY:
-            price_levels = order_book.asks
-        else:
-            price_levels = order_book.bids
+        is_buy = order.side == Side.BUY
+        price_levels = order_book.asks if is_buy else order_book.bids
         
         # Store BBO before matching for comparison
         old_bbo = order_book.calculate_bbo()
         
+        # Market orders may cross any level; limit-priced orders stop at
+        # their limit (trade-through prevention)
+        limit_ticks = None if order.order_type == OrderType.MARKET else order.price_ticks
+        
+        # Hoist per-fill lookups out of the loop; the taker's remaining
+        # quantity is tracked locally and written back once at the end
+        remaining = order.remaining_lots
+        order_index = order_book.order_index
+        dirty_events = self._dirty_events if self.enable_persistence else None
+        logger = self.logger
+        trade_publisher = self.trade_publisher
+        create_trade = self._create_trade
+        
         # Iterate through price levels in priority order
-        while order.remaining_quantity > 0 and price_levels:
-            # Get best price
-            if order.side == Side.BUY:
-                best_price = price_levels.keys()[0]  # Lowest ask
-            else:
-                best_price = price_levels.keys()[0]  # Highest bid
+        while remaining > 0 and price_levels:
+            # Get best price (lowest ask / highest bid)
+            best_price = price_levels.best()
             
             # Check if order can match at this price
-            if not self._can_match(order, best_price):
+            if limit_ticks is not None and (
+                best_price > limit_ticks if is_buy else best_price < limit_ticks
+            ):
                 break
             
             price_level = price_levels[best_price]
+            last_trade_ticks = best_price
             
             # Match against orders at this price level (FIFO)
-            while order.remaining_quantity > 0 and price_level.orders:
-                resting_order = price_level.orders[0]
-                
+            resting_order = price_level.head
+            while remaining > 0 and resting_order is not None:
                 # Calculate fill quantity
-                fill_qty = min(order.remaining_quantity, resting_order.remaining_quantity)
+                fill_lots = resting_order.remaining_lots
+                if fill_lots > remaining:
+                    fill_lots = remaining
                 
                 # Create trade
-                trade = self._create_trade(
+                trade = create_trade(
                     taker_order=order,
                     maker_order=resting_order,
-                    price=best_price,
-                    quantity=fill_qty
+                    price_ticks=best_price,
+                    qty_lots=fill_lots
                 )
                 trades.append(trade)
                 
                 # Update quantities
-                old_taker_qty = order.remaining_quantity
-                order.remaining_quantity -= fill_qty
-                order.update_status()
-                
-                old_maker_qty = resting_order.remaining_quantity
-                resting_order.remaining_quantity -= fill_qty
+                remaining -= fill_lots
+                resting_order.remaining_lots -= fill_lots
                 resting_order.update_status()
+                if dirty_events is not None:
+                    dirty_events.append(
+                        ("fill", order.symbol, resting_order.order_id, resting_order.remaining_lots)
+                    )
                 
                 # Update price level quantity
-                price_level.update_quantity(old_maker_qty, resting_order.remaining_quantity)
+                price_level.total_lots -= fill_lots
                 
-                # Remove filled order from queue
-                if resting_order.is_filled():
-                    price_level.orders.popleft()
-                    # Remove from order index
-                    if resting_order.order_id in order_book.order_index:
-                        del order_book.order_index[resting_order.order_id]
+                # Remove filled order from queue and index
+                next_order = resting_order.next_order
+                if resting_order.remaining_lots == 0:
+                    price_level.remove_order(resting_order)
+                    order_index.pop(resting_order.order_id, None)
                 
                 # Log trade execution
-                if self.logger:
-                    self.logger.info(
+                if logger:
+                    logger.info(
                         "trade_executed",
                         trade_id=trade.trade_id,
                         symbol=trade.symbol,
@@ -429,15 +470,24 @@ class MatchingEngine:
                     )
                 
                 # Publish trade
-                if self.trade_publisher:
-                    asyncio.create_task(self.trade_publisher.publish_trade(trade))
+                if trade_publisher:
+                    asyncio.create_task(trade_publisher.publish_trade(trade))
+                
+                resting_order = next_order
             
             # Remove empty price level
-            if price_level.is_empty():
+            if price_level.head is None:
                 del price_levels[best_price]
         
+        order.remaining_lots = remaining
+        order.update_status()
+        
+        # Levels were consumed directly, so refresh the resting side's top
+        if trades:
+            order_book.refresh_bbo(Side.SELL if order.side == Side.BUY else Side.BUY)
+        
         # Publish BBO update if it changed
-        if trades and self.market_data_publisher:
+        if trades and self.market_data_publisher and not self._batching:
             new_bbo = order_book.calculate_bbo()
             if self._bbo_changed(old_bbo, new_bbo):
                 asyncio.create_task(self.market_data_publisher.publish_bbo_update(order.symbol, new_bbo))
@@ -445,38 +495,16 @@ class MatchingEngine:
         
         # Check stop orders after trades execute
         if trades:
-            last_trade_price = trades[-1].price
-            self.check_stop_orders(order.symbol, last_trade_price)
+            self.check_stop_orders(order.symbol, last_trade_ticks)
         
         return trades
     
-    def _can_match(self, order: Order, price: Decimal) -> bool:
-        """
-        Check if order can match at given price (trade-through prevention).
-        
-        Args:
-            order: Order to check
-            price: Price level to check
-            
-        Returns:
-            True if order can match at this price
-        """
-        if order.order_type == OrderType.MARKET:
-            return True
-        
-        if order.side == Side.BUY:
-            # Buy order can match if limit price >= ask price
-            return order.price >= price
-        else:
-            # Sell order can match if limit price <= bid price
-            return order.price <= price
-    
     def _create_trade(
         self,
         taker_order: Order,
         maker_order: Order,
-        price: Decimal,
-        quantity: Decimal
+        price_ticks: int,
+        qty_lots: int
     ) -> Trade:
         """
         Create trade execution record with fee calculation.
@@ -484,12 +512,15 @@ class MatchingEngine:
         Args:
             taker_order: Incoming order (aggressor)
             maker_order: Resting order (maker)
-            price: Execution price
-            quantity: Execution quantity
+            price_ticks: Execution price in ticks
+            qty_lots: Execution quantity in lots
             
         Returns:
             Trade object with fees
         """
+        price = from_ticks(price_ticks)
+        quantity = from_ticks(qty_lots, QTY_SCALE)
+        
         trade = Trade(
             trade_id=self.generate_trade_id(),
             symbol=taker_order.symbol,
@@ -524,9 +555,11 @@ class MatchingEngine:
         old_bbo = order_book.calculate_bbo()
         
         order_book.add_order(order)
+        if self.enable_persistence:
+            self._dirty_events.append(("add", order))
         
         # Publish BBO update if it changed
-        if self.market_data_publisher:
+        if self.market_data_publisher and not self._batching:
             new_bbo = order_book.calculate_bbo()
             if self._bbo_changed(old_bbo, new_bbo):
                 asyncio.create_task(self.market_data_publisher.publish_bbo_update(order.symbol, new_bbo))
@@ -555,6 +588,8 @@ class MatchingEngine:
         
         order = order_book.remove_order(order_id)
         order.status = OrderStatus.CANCELLED
+        if self.enable_persistence:
+            self._dirty_events.append(("cancel", symbol, order_id))
         
         # Log cancellation
         if self.logger:
@@ -585,6 +620,8 @@ class MatchingEngine:
         Returns:
             True if BBO changed
         """
+        if old_bbo is new_bbo:
+            return False
         return (
             old_bbo.best_bid != new_bbo.best_bid or
             old_bbo.best_ask != new_bbo.best_ask or
@@ -607,7 +644,7 @@ class MatchingEngine:
         
         if elapsed >= self.snapshot_interval:
             try:
-                filepath = self.snapshot_manager.save_engine_state(self)
+                filepath = self.snapshot_manager.save_delta(self)
                 self.last_snapshot_time = now
                 
                 if self.logger:
@@ -636,23 +673,29 @@ class MatchingEngine:
         
         return self.snapshot_manager.save_engine_state(self, filename)
     
-    def load_snapshot(self, filepath: str):
+    def load_snapshot(self, filepath: str, deltas: Optional[List[str]] = None):
         """
         Load engine state from snapshot.
         
         Args:
             filepath: Path to snapshot file
+            deltas: Delta snapshot paths to apply on top; defaults to the
+                delta chain written on this snapshot
         """
         if not self.snapshot_manager:
             from ..persistence.snapshot import OrderBookSnapshot
             self.snapshot_manager = OrderBookSnapshot()
         
-        self.snapshot_manager.load_engine_state(self, filepath)
+        if deltas is None:
+            deltas = self.snapshot_manager.get_delta_chain(filepath)
+        
+        self.snapshot_manager.load_engine_state(self, filepath, deltas=deltas)
         
         if self.logger:
             self.logger.info(
                 "snapshot_loaded",
                 filepath=filepath,
+                deltas=len(deltas),
                 order_books=len(self.order_books),
                 trade_id_counter=self.trade_id_counter,
                 order_id_counter=self.order_id_counter
@@ -24,3 +24,8 @@ class OrderNotFoundError(MatchingEngineError):
 class InvalidSymbolError(MatchingEngineError):
     """Raised when trading symbol is invalid or not supported."""
     pass
+
+
+class SnapshotCorruptedError(MatchingEngineError):
+    """Raised when a snapshot file fails its integrity check."""
+    pass
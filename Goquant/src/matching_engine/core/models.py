@@ -1,11 +1,85 @@
 """Core data models for the matching engine."""
 
+from collections import deque
 from enum import Enum
 from decimal import Decimal
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    from .order_book import PriceLevel
+
+
+# Fixed-point scales: prices and quantities carry up to 8 decimal places
+PRICE_SCALE = 10 ** 8
+QTY_SCALE = 10 ** 8
+
+
+def to_ticks(value, scale: int = PRICE_SCALE) -> int:
+    """
+    Convert a decimal amount to a fixed-point integer.
+    
+    Args:
+        value: Decimal (or str/int/float) amount
+        scale: Fixed-point scale factor
+        
+    Returns:
+        Amount as integer number of 1/scale units
+        
+    Raises:
+        ValueError: If the amount has more precision than the scale allows
+    """
+    amount = value if isinstance(value, Decimal) else Decimal(str(value))
+    scaled = amount * scale
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"Amount {value} exceeds supported precision")
+    return int(scaled)
+
+
+def from_ticks(ticks: int, scale: int = PRICE_SCALE) -> Decimal:
+    """
+    Convert a fixed-point integer back to a Decimal amount.
+    
+    Args:
+        ticks: Amount in 1/scale units
+        scale: Fixed-point scale factor
+        
+    Returns:
+        Decimal amount
+    """
+    return Decimal(ticks) / scale
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(timestamp: datetime) -> int:
+    """
+    Convert a naive UTC timestamp to integer microseconds since the epoch.
+    
+    Args:
+        timestamp: Naive UTC datetime
+        
+    Returns:
+        Microseconds since 1970-01-01
+    """
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(micros: int) -> datetime:
+    """
+    Convert integer microseconds since the epoch back to a naive UTC timestamp.
+    
+    Args:
+        micros: Microseconds since 1970-01-01
+        
+    Returns:
+        Naive UTC datetime
+    """
+    return _EPOCH + timedelta(microseconds=micros)
+
 
 class OrderType(str, Enum):
     """Order type enumeration."""
@@ -33,53 +107,197 @@ class OrderStatus(str, Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(init=False, slots=True)
 class Order:
-    """Represents a trading order."""
+    """
+    Represents a trading order.
+    
+    Prices and quantities are held as fixed-point integers (ticks and
+    lots, scaled by PRICE_SCALE and QTY_SCALE) so the matching path only
+    does integer arithmetic. Decimal accessors are kept for I/O.
+    
+    While resting, an order is linked into its price level's FIFO queue
+    through prev_order/next_order and points back at that level through
+    level; all three are None otherwise.
+    """
     
     order_id: str
     symbol: str
     order_type: OrderType
     side: Side
-    quantity: Decimal
-    price: Optional[Decimal]
+    qty_lots: int
+    price_ticks: Optional[int]
     timestamp: datetime
-    remaining_quantity: Decimal
-    status: OrderStatus = OrderStatus.NEW
-    stop_price: Optional[Decimal] = None  # Trigger price for stop orders
-    is_triggered: bool = False  # Whether stop order has been triggered
+    remaining_lots: int
+    status: OrderStatus
+    stop_price_ticks: Optional[int]  # Trigger price for stop orders
+    is_triggered: bool  # Whether stop order has been triggered
+    prev_order: Optional["Order"] = field(default=None, repr=False, compare=False)
+    next_order: Optional["Order"] = field(default=None, repr=False, compare=False)
+    level: Optional["PriceLevel"] = field(default=None, repr=False, compare=False)
+    
+    def __init__(
+        self,
+        order_id: str,
+        symbol: str,
+        order_type: OrderType,
+        side: Side,
+        quantity: Decimal,
+        price: Optional[Decimal],
+        timestamp: datetime,
+        remaining_quantity: Decimal,
+        status: OrderStatus = OrderStatus.NEW,
+        stop_price: Optional[Decimal] = None,
+        is_triggered: bool = False
+    ):
+        """
+        Initialize order, converting decimal amounts to fixed-point.
+        
+        Raises:
+            ValueError: If an amount is invalid or exceeds 8 decimal places
+        """
+        self.order_id = order_id
+        self.symbol = symbol
+        self.order_type = order_type
+        self.side = side
+        self.qty_lots = to_ticks(quantity, QTY_SCALE)
+        self.price_ticks = to_ticks(price) if price is not None else None
+        self.timestamp = timestamp
+        self.remaining_lots = to_ticks(remaining_quantity, QTY_SCALE)
+        self.status = status
+        self.stop_price_ticks = to_ticks(stop_price) if stop_price is not None else None
+        self.is_triggered = is_triggered
+        self.prev_order = None
+        self.next_order = None
+        self.level = None
+        self.__post_init__()
+    
+    @classmethod
+    def from_fixed_point(
+        cls,
+        order_id: str,
+        symbol: str,
+        order_type: OrderType,
+        side: Side,
+        qty_lots: int,
+        price_ticks: Optional[int],
+        timestamp: datetime,
+        remaining_lots: int,
+        status: OrderStatus = OrderStatus.NEW,
+        stop_price_ticks: Optional[int] = None,
+        is_triggered: bool = False
+    ) -> "Order":
+        """
+        Create order directly from fixed-point amounts (no Decimal parsing).
+        
+        Returns:
+            Validated Order instance
+        """
+        order = cls.__new__(cls)
+        order._assign(
+            order_id, symbol, order_type, side, qty_lots, price_ticks,
+            timestamp, remaining_lots, status, stop_price_ticks, is_triggered
+        )
+        return order
+    
+    def _assign(
+        self,
+        order_id: str,
+        symbol: str,
+        order_type: OrderType,
+        side: Side,
+        qty_lots: int,
+        price_ticks: Optional[int],
+        timestamp: datetime,
+        remaining_lots: int,
+        status: OrderStatus,
+        stop_price_ticks: Optional[int],
+        is_triggered: bool
+    ):
+        """Set every field in place from fixed-point amounts and validate."""
+        self.order_id = order_id
+        self.symbol = symbol
+        self.order_type = order_type
+        self.side = side
+        self.qty_lots = qty_lots
+        self.price_ticks = price_ticks
+        self.timestamp = timestamp
+        self.remaining_lots = remaining_lots
+        self.status = status
+        self.stop_price_ticks = stop_price_ticks
+        self.is_triggered = is_triggered
+        self.prev_order = None
+        self.next_order = None
+        self.level = None
+        self.__post_init__()
     
     def __post_init__(self):
         """Validate order after initialization."""
-        if self.quantity <= 0:
+        if self.qty_lots <= 0:
             raise ValueError("Quantity must be positive")
         
         if self.order_type in [OrderType.LIMIT, OrderType.IOC, OrderType.FOK]:
-            if self.price is None:
+            if self.price_ticks is None:
                 raise ValueError(f"Price required for {self.order_type.value} orders")
-            if self.price <= 0:
+            if self.price_ticks <= 0:
                 raise ValueError("Price must be positive")
         
         # Stop orders require stop_price
         if self.order_type in [OrderType.STOP_LOSS, OrderType.STOP_LIMIT, OrderType.TAKE_PROFIT]:
-            if self.stop_price is None:
+            if self.stop_price_ticks is None:
                 raise ValueError(f"Stop price required for {self.order_type.value} orders")
-            if self.stop_price <= 0:
+            if self.stop_price_ticks <= 0:
                 raise ValueError("Stop price must be positive")
         
         # Stop-limit also requires limit price
         if self.order_type == OrderType.STOP_LIMIT:
-            if self.price is None:
+            if self.price_ticks is None:
                 raise ValueError("Limit price required for stop-limit orders")
-            if self.price <= 0:
+            if self.price_ticks <= 0:
                 raise ValueError("Limit price must be positive")
         
-        if self.remaining_quantity < 0:
+        if self.remaining_lots < 0:
             raise ValueError("Remaining quantity cannot be negative")
         
-        if self.remaining_quantity > self.quantity:
+        if self.remaining_lots > self.qty_lots:
             raise ValueError("Remaining quantity cannot exceed total quantity")
     
+    @property
+    def quantity(self) -> Decimal:
+        """Total order quantity."""
+        return from_ticks(self.qty_lots, QTY_SCALE)
+    
+    @property
+    def remaining_quantity(self) -> Decimal:
+        """Unfilled order quantity."""
+        return from_ticks(self.remaining_lots, QTY_SCALE)
+    
+    @remaining_quantity.setter
+    def remaining_quantity(self, value: Decimal):
+        self.remaining_lots = to_ticks(value, QTY_SCALE)
+    
+    @property
+    def price(self) -> Optional[Decimal]:
+        """Limit price, None for market orders."""
+        if self.price_ticks is None:
+            return None
+        return from_ticks(self.price_ticks)
+    
+    @price.setter
+    def price(self, value: Optional[Decimal]):
+        self.price_ticks = to_ticks(value) if value is not None else None
+    
+    @property
+    def stop_price(self) -> Optional[Decimal]:
+        """Trigger price for stop orders."""
+        if self.stop_price_ticks is None:
+            return None
+        return from_ticks(self.stop_price_ticks)
+    
+    @stop_price.setter
+    def stop_price(self, value: Optional[Decimal]):
+        self.stop_price_ticks = to_ticks(value) if value is not None else None
+    
     def is_marketable(self, best_bid: Optional[Decimal], best_ask: Optional[Decimal]) -> bool:
         """
         Check if order can immediately match against the order book.
@@ -112,16 +330,90 @@ class Order:
     
     def is_filled(self) -> bool:
         """Check if order is completely filled."""
-        return self.remaining_quantity == 0
+        return self.remaining_lots == 0
     
     def update_status(self):
         """Update order status based on remaining quantity."""
-        if self.remaining_quantity == 0:
+        if self.remaining_lots == 0:
             self.status = OrderStatus.FILLED
-        elif self.remaining_quantity < self.quantity:
+        elif self.remaining_lots < self.qty_lots:
             self.status = OrderStatus.PARTIAL
 
 
+class OrderPool:
+    """
+    Free list of reusable Order instances.
+    
+    Bulk paths such as snapshot restore acquire orders here instead of
+    allocating a fresh object per order. An order is only reused after
+    it has been explicitly released, so orders still referenced elsewhere
+    are never overwritten.
+    """
+    
+    def __init__(self, size: int = 1024, max_free: int = 65536):
+        """
+        Initialize order pool.
+        
+        Args:
+            size: Number of Order instances to preallocate
+            max_free: Maximum number of released orders kept for reuse
+        """
+        self.max_free = max_free
+        self._free: deque[Order] = deque(Order.__new__(Order) for _ in range(size))
+    
+    def __len__(self) -> int:
+        """Number of orders available for reuse."""
+        return len(self._free)
+    
+    def acquire(
+        self,
+        order_id: str,
+        symbol: str,
+        order_type: OrderType,
+        side: Side,
+        qty_lots: int,
+        price_ticks: Optional[int],
+        timestamp: datetime,
+        remaining_lots: int,
+        status: OrderStatus = OrderStatus.NEW,
+        stop_price_ticks: Optional[int] = None,
+        is_triggered: bool = False
+    ) -> Order:
+        """
+        Take an order from the pool and fill it from fixed-point amounts.
+        
+        Returns:
+            Validated Order instance
+            
+        Raises:
+            ValueError: If the order fields are invalid
+        """
+        try:
+            order = self._free.pop()
+        except IndexError:
+            order = Order.__new__(Order)
+        
+        try:
+            order._assign(
+                order_id, symbol, order_type, side, qty_lots, price_ticks,
+                timestamp, remaining_lots, status, stop_price_ticks, is_triggered
+            )
+        except ValueError:
+            self._free.append(order)
+            raise
+        return order
+    
+    def release(self, order: Order):
+        """
+        Return an order to the pool for reuse.
+        
+        Args:
+            order: Order no longer referenced by any book or caller
+        """
+        if len(self._free) < self.max_free:
+            self._free.append(order)
+
+
 @dataclass
 class Trade:
     """Represents an executed trade."""
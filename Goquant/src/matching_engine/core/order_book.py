@@ -1,29 +1,67 @@
 """Order book implementation with price-time priority."""
 
-from collections import deque
+from collections.abc import MutableMapping
+from dataclasses import replace
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List, Tuple
-from sortedcontainers import SortedDict
+from math import gcd
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 
-from .models import Order, Side, BBO
+import numpy as np
+
+from .models import Order, Side, BBO, QTY_SCALE, from_ticks, to_epoch_micros
 from .exceptions import OrderNotFoundError
 
 
+# Largest occupancy grid (one byte per price slot) a book side will keep
+_MAX_GRID_SLOTS = 1 << 22
+
+
 class PriceLevel:
     """
     Represents a price level in the order book with FIFO queue of orders.
+    
+    The queue is an intrusive doubly-linked list threaded through the
+    orders' prev_order/next_order fields, and each queued order points
+    back at its level, so an order can be unlinked from anywhere in the
+    queue in O(1) without looking its level up. Price and aggregate quantity are
+    kept in fixed-point ticks/lots.
     """
     
-    def __init__(self, price: Decimal):
+    def __init__(self, price_ticks: int):
         """
         Initialize price level.
         
         Args:
-            price: Price for this level
+            price_ticks: Price for this level in ticks
         """
-        self.price = price
-        self.orders: deque[Order] = deque()
-        self.total_quantity = Decimal("0")
+        self.price_ticks = price_ticks
+        self.head: Optional[Order] = None
+        self.tail: Optional[Order] = None
+        self.count = 0
+        self.total_lots = 0
+    
+    def __iter__(self) -> Iterator[Order]:
+        """Iterate over orders in FIFO order."""
+        order = self.head
+        while order is not None:
+            yield order
+            order = order.next_order
+    
+    @property
+    def orders(self) -> List[Order]:
+        """Orders at this level in FIFO order (a snapshot copy)."""
+        return list(self)
+    
+    @property
+    def price(self) -> Decimal:
+        """Price for this level."""
+        return from_ticks(self.price_ticks)
+    
+    @property
+    def total_quantity(self) -> Decimal:
+        """Aggregate remaining quantity at this level."""
+        return from_ticks(self.total_lots, QTY_SCALE)
     
     def add_order(self, order: Order):
         """
@@ -32,40 +70,364 @@ class PriceLevel:
         Args:
             order: Order to add
         """
-        self.orders.append(order)
-        self.total_quantity += order.remaining_quantity
+        tail = self.tail
+        order.prev_order = tail
+        order.next_order = None
+        order.level = self
+        if tail is None:
+            self.head = order
+        else:
+            tail.next_order = order
+        self.tail = order
+        self.count += 1
+        self.total_lots += order.remaining_lots
+    
+    def extend(self, orders: List[Order]):
+        """
+        Append orders already in FIFO order.
+        
+        Args:
+            orders: Orders to add
+        """
+        for order in orders:
+            self.add_order(order)
     
     def remove_order(self, order: Order):
         """
         Remove order from this price level.
         
+        Complexity: O(1)
+        
         Args:
             order: Order to remove
+            
+        Raises:
+            ValueError: If order is not queued at this level
         """
-        self.orders.remove(order)
-        self.total_quantity -= order.remaining_quantity
+        if order.level is not self:
+            raise ValueError(f"Order {order.order_id} not in price level")
+        
+        prev_order = order.prev_order
+        next_order = order.next_order
+        
+        if prev_order is None:
+            self.head = next_order
+        else:
+            prev_order.next_order = next_order
+        
+        if next_order is None:
+            self.tail = prev_order
+        else:
+            next_order.prev_order = prev_order
+        
+        order.prev_order = None
+        order.next_order = None
+        order.level = None
+        self.count -= 1
+        self.total_lots -= order.remaining_lots
     
-    def update_quantity(self, old_qty: Decimal, new_qty: Decimal):
+    def update_quantity(self, old_lots: int, new_lots: int):
         """
         Update total quantity when an order's remaining quantity changes.
         
         Args:
-            old_qty: Previous remaining quantity
-            new_qty: New remaining quantity
+            old_lots: Previous remaining quantity in lots
+            new_lots: New remaining quantity in lots
         """
-        self.total_quantity = self.total_quantity - old_qty + new_qty
+        self.total_lots = self.total_lots - old_lots + new_lots
     
     def is_empty(self) -> bool:
         """Check if price level has no orders."""
-        return len(self.orders) == 0
+        return self.head is None
+    
+    def order_ids_as_array(self) -> np.ndarray:
+        """
+        Get order IDs at this level in FIFO order as a NumPy array.
+        
+        Lets callers compare large queues with a single vectorized
+        comparison instead of a Python-level loop.
+        
+        Returns:
+            Contiguous object array of order IDs
+        """
+        return np.fromiter(
+            (order.order_id for order in self),
+            dtype=object,
+            count=self.count
+        )
+    
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Export the orders at this level as parallel per-field columns.
+        
+        Columns are in FIFO order. Integer fields are contiguous NumPy
+        arrays, so a serializer can write each one as a single buffer
+        instead of encoding order by order. Price is left out because
+        every order here shares price_ticks.
+        
+        Returns:
+            Dict of column name to list (string/optional fields) or array
+        """
+        orders = self.orders
+        count = self.count
+        
+        return {
+            "order_ids": [order.order_id for order in orders],
+            "order_types": [order.order_type.value for order in orders],
+            "statuses": [order.status.value for order in orders],
+            "stop_price_ticks": [order.stop_price_ticks for order in orders],
+            "qty_lots": np.fromiter((order.qty_lots for order in orders), dtype=np.int64, count=count),
+            "remaining_lots": np.fromiter((order.remaining_lots for order in orders), dtype=np.int64, count=count),
+            "timestamps_us": np.fromiter(
+                (to_epoch_micros(order.timestamp) for order in orders),
+                dtype=np.int64,
+                count=count
+            ),
+            "is_triggered": np.fromiter((order.is_triggered for order in orders), dtype=np.bool_, count=count)
+        }
+
+
+class PriceLadder(MutableMapping):
+    """
+    Price levels for one side of the book, keyed by integer price ticks.
+    
+    Levels are held in a plain dict. A bytearray occupancy grid marks
+    which prices are populated, so the best price is a single C-level
+    find()/rfind() scan rather than a tree walk, and adding or removing
+    a level is O(1). The grid spacing is the gcd of the populated price
+    offsets, so no tick size has to be configured. If prices spread too
+    far apart for a bounded grid, the ladder falls back to scanning the
+    dict until it next empties. Iteration yields prices best-first.
+    """
+    
+    def __init__(self, descending: bool = False):
+        """
+        Initialize price ladder.
+        
+        Args:
+            descending: Best price is the highest (bids) rather than lowest (asks)
+        """
+        self.descending = descending
+        self._levels: dict[int, PriceLevel] = {}
+        self._occupied = bytearray()
+        self._base = 0
+        self._step = 0
+        self._gridded = True
+    
+    def __len__(self) -> int:
+        return len(self._levels)
+    
+    def __contains__(self, price_ticks) -> bool:
+        return price_ticks in self._levels
+    
+    def __getitem__(self, price_ticks: int) -> PriceLevel:
+        return self._levels[price_ticks]
+    
+    def get(self, price_ticks: int, default=None) -> Optional[PriceLevel]:
+        return self._levels.get(price_ticks, default)
+    
+    def __setitem__(self, price_ticks: int, level: PriceLevel):
+        if price_ticks not in self._levels and self._gridded:
+            self._mark(price_ticks)
+        self._levels[price_ticks] = level
+    
+    def __delitem__(self, price_ticks: int):
+        del self._levels[price_ticks]
+        if not self._levels:
+            # Start a fresh grid so old prices don't keep it wide
+            self._occupied = bytearray()
+            self._gridded = True
+        elif self._gridded:
+            self._occupied[self._slot(price_ticks)] = 0
+    
+    def __iter__(self) -> Iterator[int]:
+        if not self._gridded:
+            yield from sorted(self._levels, reverse=self.descending)
+            return
+        
+        occupied, base, step = self._occupied, self._base, self._step
+        if self.descending:
+            slot = occupied.rfind(1)
+            while slot >= 0:
+                yield base + slot * step
+                slot = occupied.rfind(1, 0, slot)
+        else:
+            slot = occupied.find(1)
+            while slot >= 0:
+                yield base + slot * step
+                slot = occupied.find(1, slot + 1)
+    
+    def best(self) -> int:
+        """
+        Get the best populated price.
+        
+        Complexity: O(1) amortized (one memchr over the grid)
+        
+        Returns:
+            Best price in ticks
+            
+        Raises:
+            ValueError: If the ladder is empty
+        """
+        if not self._levels:
+            raise ValueError("Price ladder is empty")
+        if not self._gridded:
+            return max(self._levels) if self.descending else min(self._levels)
+        
+        slot = self._occupied.rfind(1) if self.descending else self._occupied.find(1)
+        return self._base + slot * self._step
+    
+    def level_arrays(
+        self,
+        limit: Optional[int] = None,
+        depth: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Export populated levels as parallel int64 arrays, best first.
+        
+        Prices are decoded from the occupancy grid in one vectorized pass
+        and only the selected levels' aggregate lots are gathered, so
+        scans that need just price and size (depth, liquidity checks)
+        run over packed arrays instead of PriceLevel objects.
+        
+        Args:
+            limit: Only include levels at this price or better
+            depth: Only include the best `depth` levels
+            
+        Returns:
+            Tuple of (prices, lots) int64 arrays in priority order
+        """
+        prices = self.level_prices(limit=limit, depth=depth)
+        return prices, self.level_lots(prices)
+    
+    def level_prices(self, limit: Optional[int] = None, depth: Optional[int] = None) -> np.ndarray:
+        """
+        Get populated prices as an int64 array, best first.
+        
+        Args:
+            limit: Only include levels at this price or better
+            depth: Only include the best `depth` levels
+            
+        Returns:
+            Contiguous int64 array of prices in priority order
+        """
+        if self._gridded:
+            # Cut the grid at the limit's slot, so prices beyond it are
+            # never decoded or compared
+            occupied = np.frombuffer(self._occupied, dtype=np.uint8)
+            lo, hi = 0, len(occupied)
+            if limit is not None:
+                lo, hi = self._limit_slots(limit)
+            slots = lo + np.flatnonzero(occupied[lo:hi])
+            prices = self._base + slots.astype(np.int64) * self._step
+        else:
+            prices = np.sort(np.fromiter(self._levels, dtype=np.int64, count=len(self._levels)))
+            if limit is not None:
+                if self.descending:
+                    prices = prices[np.searchsorted(prices, limit, side="left"):]
+                else:
+                    prices = prices[:np.searchsorted(prices, limit, side="right")]
+        
+        # Prices are ascending here; put best first
+        if self.descending:
+            prices = prices[::-1]
+        
+        if depth is not None:
+            prices = prices[:depth]
+        return np.ascontiguousarray(prices)
+    
+    def level_lots(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Gather aggregate lots for populated prices.
+        
+        Args:
+            prices: Prices as returned by level_prices()
+            
+        Returns:
+            int64 array of total lots, aligned with prices
+        """
+        levels = self._levels
+        return np.fromiter(
+            (levels[price].total_lots for price in prices.tolist()),
+            dtype=np.int64,
+            count=len(prices)
+        )
+    
+    def _limit_slots(self, limit: int) -> Tuple[int, int]:
+        """Slot range [lo, hi) of grid prices at the limit or better."""
+        size = len(self._occupied)
+        offset = limit - self._base
+        if self.descending:
+            # At or above the limit: round the slot up
+            first = -(-offset // self._step) if self._step else (0 if offset <= 0 else size)
+            return min(max(first, 0), size), size
+        # At or below the limit: round the slot down
+        last = offset // self._step if self._step else (0 if offset >= 0 else -1)
+        return 0, min(max(last + 1, 0), size)
+    
+    def _slot(self, price_ticks: int) -> int:
+        """Grid slot for a price already on the grid."""
+        return (price_ticks - self._base) // self._step if self._step else 0
+    
+    def _mark(self, price_ticks: int):
+        """Mark a new price as occupied, growing or refining the grid as needed."""
+        if not self._occupied:
+            self._base, self._step = price_ticks, 0
+            self._occupied = bytearray(b"\x01")
+            return
+        
+        step = gcd(self._step, price_ticks - self._base)
+        if step != self._step:
+            # Off the current grid: rebuild on a finer spacing
+            self._rebuild(step, price_ticks)
+            return
+        
+        slot = (price_ticks - self._base) // step
+        size = len(self._occupied)
+        if slot < 0 or slot >= size:
+            # Grow by at least the current size so repeated growth is amortized
+            grow = max(-slot if slot < 0 else slot + 1 - size, size)
+            if size + grow > _MAX_GRID_SLOTS:
+                self._rebuild(step, price_ticks)
+                return
+            if slot < 0:
+                self._occupied[0:0] = bytes(grow)
+                self._base -= grow * step
+                slot += grow
+            else:
+                self._occupied.extend(bytes(grow))
+        
+        self._occupied[slot] = 1
+    
+    def _rebuild(self, step: int, price_ticks: int):
+        """Rebuild a tight grid over the current prices plus a new one."""
+        prices = [*self._levels, price_ticks]
+        base = min(prices)
+        slots = (max(prices) - base) // step + 1
+        
+        if slots > _MAX_GRID_SLOTS:
+            self._occupied = bytearray()
+            self._gridded = False
+            return
+        
+        self._base, self._step = base, step
+        self._occupied = bytearray(slots)
+        for price in prices:
+            self._occupied[(price - base) // step] = 1
 
 
 class OrderBook:
     """
     Order book maintaining buy and sell orders with price-time priority.
     
-    Uses SortedDict for O(log n) insertion/deletion and O(1) best price access.
-    Maintains FIFO queues at each price level for time priority.
+    Each side is a PriceLadder: O(1) level insertion/deletion and a
+    single grid scan for the best price. Maintains FIFO queues at each
+    price level for time priority. Price levels are keyed by integer
+    price ticks.
+    
+    The BBO is cached and only rebuilt when an update touches the top of
+    a side, so calculate_bbo() is a field read. Code that mutates price
+    levels directly (the matching loop) must call refresh_bbo() after.
     """
     
     def __init__(self, symbol: str):
@@ -76,18 +438,29 @@ class OrderBook:
             symbol: Trading pair symbol (e.g., "BTC-USDT")
         """
         self.symbol = symbol
-        # Bids sorted in descending order (highest first)
-        self.bids: SortedDict[Decimal, PriceLevel] = SortedDict(lambda x: -x)
-        # Asks sorted in ascending order (lowest first)
-        self.asks: SortedDict[Decimal, PriceLevel] = SortedDict()
+        # Bids iterate in descending order (highest first)
+        self.bids = PriceLadder(descending=True)
+        # Asks iterate in ascending order (lowest first)
+        self.asks = PriceLadder()
         # Order index for O(1) lookup by order ID
         self.order_index: dict[str, tuple[Order, Side]] = {}
+        # Cached top of book; replaced (never mutated) when it changes
+        self._best_bid_ticks: Optional[int] = None
+        self._best_ask_ticks: Optional[int] = None
+        self._cached_bbo = BBO(
+            symbol=symbol,
+            best_bid=None,
+            best_bid_quantity=Decimal("0"),
+            best_ask=None,
+            best_ask_quantity=Decimal("0"),
+            timestamp=datetime.utcnow()
+        )
     
     def add_order(self, order: Order):
         """
         Add order to the order book at appropriate price level.
         
-        Complexity: O(log n) for price level insertion
+        Complexity: O(1) amortized for price level insertion
         
         Args:
             order: Order to add to book
@@ -98,20 +471,56 @@ class OrderBook:
             price_levels = self.asks
         
         # Get or create price level
-        if order.price not in price_levels:
-            price_levels[order.price] = PriceLevel(order.price)
+        price_level = price_levels.get(order.price_ticks)
+        if price_level is None:
+            price_level = PriceLevel(order.price_ticks)
+            price_levels[order.price_ticks] = price_level
         
-        price_level = price_levels[order.price]
         price_level.add_order(order)
         
         # Add to order index
         self.order_index[order.order_id] = (order, order.side)
+        
+        # BBO only moves if the order joins or improves the top of its side
+        if order.side == Side.BUY:
+            if self._best_bid_ticks is None or order.price_ticks >= self._best_bid_ticks:
+                self._recompute_best_bid()
+        elif self._best_ask_ticks is None or order.price_ticks <= self._best_ask_ticks:
+            self._recompute_best_ask()
+    
+    def restore_levels(self, side: Side, levels: List[List[Order]]):
+        """
+        Bulk-load whole price levels, e.g. when replaying a snapshot.
+        
+        Each inner list holds the orders of one price level already in
+        FIFO order, so levels are built directly instead of going through
+        add_order once per order, and the sorted side is updated in a
+        single batch.
+        
+        Args:
+            side: Book side the levels belong to
+            levels: Orders grouped by price level, each group in FIFO order
+        """
+        price_levels = self.bids if side == Side.BUY else self.asks
+        
+        new_levels = {}
+        for orders in levels:
+            if not orders:
+                continue
+            price_level = PriceLevel(orders[0].price_ticks)
+            price_level.extend(orders)
+            new_levels[price_level.price_ticks] = price_level
+            self.order_index.update((order.order_id, (order, side)) for order in orders)
+        
+        price_levels.update(new_levels)
+        self.refresh_bbo(side)
     
     def remove_order(self, order_id: str) -> Order:
         """
         Remove order from the order book.
         
-        Complexity: O(log n) for price level deletion if level becomes empty
+        Complexity: O(1); the order's level is reached through its back
+        pointer, so neither side of the book is searched
         
         Args:
             order_id: ID of order to remove
@@ -127,76 +536,75 @@ class OrderBook:
         
         order, side = self.order_index[order_id]
         
-        # Get price levels
-        if side == Side.BUY:
-            price_levels = self.bids
-        else:
-            price_levels = self.asks
-        
-        # Remove from price level
-        price_level = price_levels[order.price]
+        # Unlink from the level the order is queued at
+        price_level = order.level
         price_level.remove_order(order)
         
         # Remove empty price level
         if price_level.is_empty():
-            del price_levels[order.price]
+            if side == Side.BUY:
+                del self.bids[price_level.price_ticks]
+            else:
+                del self.asks[price_level.price_ticks]
         
         # Remove from order index
         del self.order_index[order_id]
         
+        self._refresh_if_best(side, order.price_ticks)
+        
         return order
     
-    def update_order_quantity(self, order: Order, old_qty: Decimal):
+    def update_order_quantity(self, order: Order, old_lots: int):
         """
         Update order quantity in the order book.
         
         Args:
             order: Order with updated quantity
-            old_qty: Previous remaining quantity
+            old_lots: Previous remaining quantity in lots
         """
         if order.side == Side.BUY:
             price_levels = self.bids
         else:
             price_levels = self.asks
         
-        if order.price in price_levels:
-            price_level = price_levels[order.price]
-            price_level.update_quantity(old_qty, order.remaining_quantity)
+        if order.price_ticks in price_levels:
+            price_level = price_levels[order.price_ticks]
+            price_level.update_quantity(old_lots, order.remaining_lots)
             
             # Remove empty price level
             if price_level.is_empty():
-                del price_levels[order.price]
+                del price_levels[order.price_ticks]
+            
+            self._refresh_if_best(order.side, order.price_ticks)
     
-    def get_best_bid(self) -> Optional[Tuple[Decimal, PriceLevel]]:
+    def get_best_bid(self) -> Optional[Tuple[int, PriceLevel]]:
         """
         Get best (highest) bid price level.
         
         Complexity: O(1)
         
         Returns:
-            Tuple of (price, price_level) or None if no bids
+            Tuple of (price_ticks, price_level) or None if no bids
         """
         if not self.bids:
             return None
         
-        # SortedDict with reverse order - first key is highest
-        best_price = self.bids.keys()[0]
+        best_price = self.bids.best()
         return best_price, self.bids[best_price]
     
-    def get_best_ask(self) -> Optional[Tuple[Decimal, PriceLevel]]:
+    def get_best_ask(self) -> Optional[Tuple[int, PriceLevel]]:
         """
         Get best (lowest) ask price level.
         
         Complexity: O(1)
         
         Returns:
-            Tuple of (price, price_level) or None if no asks
+            Tuple of (price_ticks, price_level) or None if no asks
         """
         if not self.asks:
             return None
         
-        # SortedDict with normal order - first key is lowest
-        best_price = self.asks.keys()[0]
+        best_price = self.asks.best()
         return best_price, self.asks[best_price]
     
     def get_depth(self, levels: int = 10) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
@@ -211,57 +619,134 @@ class OrderBook:
         Returns:
             Tuple of (bids, asks) where each is list of (price, quantity) tuples
         """
-        # Get top bid levels (highest to lowest)
-        bids = []
-        for i, (price, level) in enumerate(self.bids.items()):
-            if i >= levels:
-                break
-            bids.append((str(price), str(level.total_quantity)))
+        # Top bid levels (highest to lowest), top ask levels (lowest to highest)
+        return self._depth_side(self.bids, levels), self._depth_side(self.asks, levels)
+    
+    def level_arrays(
+        self,
+        side: Side,
+        limit: Optional[int] = None,
+        depth: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get one side's levels as parallel int64 price/lots arrays, best first.
+        
+        Args:
+            side: Book side to export
+            limit: Only include levels at this price (ticks) or better
+            depth: Only include the best `depth` levels
+            
+        Returns:
+            Tuple of (prices, lots) int64 arrays in priority order
+        """
+        price_levels = self.bids if side == Side.BUY else self.asks
+        return price_levels.level_arrays(limit=limit, depth=depth)
+    
+    def can_fill_fok(self, side: Side, limit_ticks: Optional[int], qty_lots: int) -> bool:
+        """
+        Check whether resting liquidity can fill an order completely.
         
-        # Get top ask levels (lowest to highest)
-        asks = []
-        for i, (price, level) in enumerate(self.asks.items()):
-            if i >= levels:
-                break
-            asks.append((str(price), str(level.total_quantity)))
+        Acceptable prices are cut from the opposite side's packed price
+        array with a single searchsorted, and level sizes are summed
+        vectorized in chunks that double in size. Liquidity near the top
+        is confirmed without gathering the whole book, and a reject still
+        costs only a few array passes.
         
-        return bids, asks
+        Args:
+            side: Side of the incoming order
+            limit_ticks: Worst acceptable price in ticks (None for any price)
+            qty_lots: Quantity to fill in lots
+            
+        Returns:
+            True if the order can be completely filled
+        """
+        price_levels = self.asks if side == Side.BUY else self.bids
+        prices = price_levels.level_prices(limit=limit_ticks)
+        
+        available = 0
+        start, chunk = 0, 8
+        while start < len(prices):
+            available += int(price_levels.level_lots(prices[start:start + chunk]).sum())
+            if available >= qty_lots:
+                return True
+            start += chunk
+            chunk *= 2
+        
+        return available >= qty_lots
+    
+    @staticmethod
+    def _depth_side(price_levels: PriceLadder, levels: int) -> List[Tuple[str, str]]:
+        """Format the top levels of one side as (price, quantity) strings."""
+        prices, lots = price_levels.level_arrays(depth=levels)
+        return [
+            (str(from_ticks(price)), str(from_ticks(qty, QTY_SCALE)))
+            for price, qty in zip(prices.tolist(), lots.tolist())
+        ]
     
     def calculate_bbo(self) -> BBO:
         """
-        Calculate current Best Bid and Offer.
+        Get current Best Bid and Offer.
         
         Complexity: O(1)
         
         Returns:
-            BBO object with best bid and ask prices and quantities
+            Cached BBO object with best bid and ask prices and quantities.
+            A new object is produced whenever the BBO changes, so callers
+            may hold on to a previous one for comparison.
         """
-        from datetime import datetime
-        
-        best_bid = None
-        best_bid_qty = Decimal("0")
-        
-        best_bid_data = self.get_best_bid()
-        if best_bid_data:
-            best_bid, best_bid_level = best_bid_data
-            best_bid_qty = best_bid_level.total_quantity
-        
-        best_ask = None
-        best_ask_qty = Decimal("0")
-        
-        best_ask_data = self.get_best_ask()
-        if best_ask_data:
-            best_ask, best_ask_level = best_ask_data
-            best_ask_qty = best_ask_level.total_quantity
+        return self._cached_bbo
+    
+    def refresh_bbo(self, side: Side):
+        """
+        Rebuild the cached BBO for one side after its levels changed.
         
-        return BBO(
-            symbol=self.symbol,
-            best_bid=best_bid,
-            best_bid_quantity=best_bid_qty,
-            best_ask=best_ask,
-            best_ask_quantity=best_ask_qty,
-            timestamp=datetime.utcnow()
-        )
+        Args:
+            side: Book side whose top may have changed
+        """
+        if side == Side.BUY:
+            self._recompute_best_bid()
+        else:
+            self._recompute_best_ask()
+    
+    def _refresh_if_best(self, side: Side, price_ticks: int):
+        """Rebuild the cached BBO if price_ticks is the top of its side."""
+        if side == Side.BUY:
+            if price_ticks == self._best_bid_ticks:
+                self._recompute_best_bid()
+        elif price_ticks == self._best_ask_ticks:
+            self._recompute_best_ask()
+    
+    def _recompute_best_bid(self):
+        """Read the top bid level into the cached BBO."""
+        if self.bids:
+            self._best_bid_ticks = self.bids.best()
+            level = self.bids[self._best_bid_ticks]
+            price, quantity = level.price, level.total_quantity
+        else:
+            self._best_bid_ticks = None
+            price, quantity = None, Decimal("0")
+        
+        bbo = self._cached_bbo
+        if price != bbo.best_bid or quantity != bbo.best_bid_quantity:
+            self._cached_bbo = replace(
+                bbo, best_bid=price, best_bid_quantity=quantity, timestamp=datetime.utcnow()
+            )
+    
+    def _recompute_best_ask(self):
+        """Read the top ask level into the cached BBO."""
+        if self.asks:
+            self._best_ask_ticks = self.asks.best()
+            level = self.asks[self._best_ask_ticks]
+            price, quantity = level.price, level.total_quantity
+        else:
+            self._best_ask_ticks = None
+            price, quantity = None, Decimal("0")
+        
+        bbo = self._cached_bbo
+        if price != bbo.best_ask or quantity != bbo.best_ask_quantity:
+            self._cached_bbo = replace(
+                bbo, best_ask=price, best_ask_quantity=quantity, timestamp=datetime.utcnow()
+            )
     
     def has_order(self, order_id: str) -> bool:
         """
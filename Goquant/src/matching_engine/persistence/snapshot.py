@@ -1,28 +1,99 @@
 """Order book snapshot and persistence implementation."""
 
 import json
+import os
 import pickle
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from decimal import Decimal
 
+import numpy as np
+
 from ..core.order_book import OrderBook
-from ..core.models import Order, OrderType, Side, OrderStatus
+from ..core.exceptions import SnapshotCorruptedError
+from .udp_sink import UdpSnapshotSink
+from ..core.models import (
+    Order, OrderPool, OrderType, Side, OrderStatus, from_epoch_micros
+)
+
+
+# Shared memory layout: little-endian payload length followed by JSON payload
+_SHM_HEADER = struct.Struct("<Q")
+
+# Binary snapshot layout: magic, pickle header length, buffer count, one
+# length per out-of-band buffer, then the pickle header and raw buffers
+_BINARY_MAGIC = b"GQSNAP05"
+_BINARY_HEADER = struct.Struct("<QQ")
+_BUFFER_LENGTH = struct.Struct("<Q")
+
+# Integrity trailer on snapshot files: CRC-32 of the contents in the low
+# 32 bits and a fixed tag in the high 32 bits, so files written before
+# checksums were added (no tag) can still be loaded
+_CHECKSUM_TRAILER = struct.Struct("<Q")
+_CHECKSUM_TAG = 0x47514352
+
+# Filename prefix of delta snapshots; base checkpoints use engine_state_
+_DELTA_PREFIX = "engine_delta_"
+
+
+def _writev_all(fd: int, buffers: list):
+    """
+    Write buffers to a file descriptor with gathered writes.
+    
+    Buffers are handed to the kernel as-is (no joined bytes copy), and
+    partial writes are resumed from where they stopped.
+    
+    Args:
+        fd: Open file descriptor
+        buffers: Bytes-like objects to write in order
+    """
+    pending = deque(memoryview(buf).cast("B") for buf in buffers if len(buf))
+    
+    if not hasattr(os, "writev"):
+        for view in pending:
+            while view:
+                view = view[os.write(fd, view):]
+        return
+    
+    iov_max = os.sysconf("SC_IOV_MAX")
+    while pending:
+        written = os.writev(fd, list(islice(pending, iov_max)))
+        while written:
+            head = pending[0]
+            if written >= head.nbytes:
+                written -= head.nbytes
+                pending.popleft()
+            else:
+                pending[0] = head[written:]
+                written = 0
 
 
 class OrderBookSnapshot:
     """Handles order book state persistence and recovery."""
     
-    def __init__(self, snapshot_dir: str = "snapshots"):
+    def __init__(self, snapshot_dir: str = "snapshots", checkpoint_interval: int = 10):
         """
         Initialize snapshot manager.
         
         Args:
             snapshot_dir: Directory to store snapshots
+            checkpoint_interval: Number of delta snapshots between full
+                base checkpoints
         """
         self.snapshot_dir = Path(snapshot_dir)
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_interval = checkpoint_interval
+        
+        # Current delta chain: base checkpoint filename and deltas written on it
+        self._delta_base: Optional[str] = None
+        self._delta_count = 0
     
     def save_order_book(self, order_book: OrderBook, filename: Optional[str] = None) -> str:
         """
@@ -51,67 +122,298 @@ class OrderBookSnapshot:
         }
         
         # Write to file
-        with open(filepath, 'w') as f:
-            json.dump(snapshot_data, f, indent=2)
+        self._write_json(filepath, snapshot_data, indent=2)
         
         return str(filepath)
     
-    def load_order_book(self, filepath: str) -> OrderBook:
+    def load_order_book(self, filepath: str, pool: Optional[OrderPool] = None) -> OrderBook:
         """
         Load order book state from disk.
         
         Args:
             filepath: Path to snapshot file
+            pool: Optional order pool to draw restored orders from
             
         Returns:
             Restored OrderBook instance
         """
-        with open(filepath, 'r') as f:
-            snapshot_data = json.load(f)
+        snapshot_data = json.loads(str(self._read_verified(filepath), "utf-8"))
         
-        # Create new order book
-        order_book = OrderBook(snapshot_data["symbol"])
+        return self._replay_order_book(snapshot_data["symbol"], snapshot_data, pool)
+    
+    def save_engine_state(
+        self,
+        engine,
+        filename: Optional[str] = None,
+        binary: bool = False,
+        sink: Optional[UdpSnapshotSink] = None
+    ) -> str:
+        """
+        Save complete matching engine state.
         
-        # Restore orders from snapshot
-        orders_to_restore = []
+        Args:
+            engine: MatchingEngine instance
+            filename: Optional filename
+            binary: Write the columnar pickle (protocol 5) format instead
+                of JSON; order fields travel as out-of-band NumPy buffers
+            sink: Send the state to a replica over UDP instead of writing
+                a file
+            
+        Returns:
+            Path to saved state file, or udp://host:port when sent to a sink
+        """
+        if sink is not None:
+            sink.send_engine_state(engine)
+            host, port = sink.address
+            return f"udp://{host}:{port}"
         
-        # Restore bid orders
-        for price_str, orders_data in snapshot_data["bids"].items():
-            for order_data in orders_data:
-                order = self._deserialize_order(order_data)
-                orders_to_restore.append(order)
+        if filename is None:
+            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            filename = f"engine_state_{timestamp}." + ("snap" if binary else "json")
         
-        # Restore ask orders
-        for price_str, orders_data in snapshot_data["asks"].items():
-            for order_data in orders_data:
-                order = self._deserialize_order(order_data)
-                orders_to_restore.append(order)
+        filepath = self.snapshot_dir / filename
         
-        # Add orders to book in original time order
-        orders_to_restore.sort(key=lambda o: o.timestamp)
-        for order in orders_to_restore:
-            order_book.add_order(order)
+        if binary:
+            self._write_binary_state(filepath, self._serialize_engine_columns(engine))
+            return str(filepath)
         
-        return order_book
+        # Write to file
+        self._write_json(filepath, self._serialize_engine_state(engine), indent=2)
+        
+        return str(filepath)
     
-    def save_engine_state(self, engine, filename: Optional[str] = None) -> str:
+    def save_to_shm(self, engine, name: str) -> str:
         """
-        Save complete matching engine state.
+        Publish complete matching engine state into shared memory.
+        
+        Lets a consumer in the same host (tests, warm-standby engines)
+        restore state without touching the filesystem. An existing
+        segment with the same name is replaced.
+        
+        Args:
+            engine: MatchingEngine instance
+            name: Shared memory segment name
+            
+        Returns:
+            Name of the shared memory segment
+        """
+        payload = json.dumps(self._serialize_engine_state(engine)).encode("utf-8")
+        size = _SHM_HEADER.size + len(payload)
+        
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        
+        try:
+            _SHM_HEADER.pack_into(shm.buf, 0, len(payload))
+            shm.buf[_SHM_HEADER.size:size] = payload
+        finally:
+            shm.close()
+        
+        return name
+    
+    def save_delta(self, engine, filename: Optional[str] = None) -> str:
+        """
+        Save book mutations recorded since the previous snapshot.
+        
+        Only the engine's pending change events are written, so the cost
+        scales with activity rather than book size. The first call, and
+        every checkpoint_interval-th call after it, writes a full base
+        checkpoint instead.
         
         Args:
             engine: MatchingEngine instance
             filename: Optional filename
             
         Returns:
-            Path to saved state file
+            Path to saved delta (or base checkpoint) file
         """
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+        
+        if self._delta_base is None or self._delta_count >= self.checkpoint_interval:
+            filepath = self.save_engine_state(engine, filename or f"engine_state_{timestamp}.json")
+            engine._dirty_events.clear()
+            self._delta_base = Path(filepath).name
+            self._delta_count = 0
+            return filepath
+        
+        self._delta_count += 1
         if filename is None:
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"engine_state_{timestamp}.json"
+            filename = f"{_DELTA_PREFIX}{timestamp}_{self._delta_count:04d}.json"
         
         filepath = self.snapshot_dir / filename
         
-        # Serialize engine state
+        delta_data = {
+            "base": self._delta_base,
+            "sequence": self._delta_count,
+            "timestamp": datetime.utcnow().isoformat(),
+            "trade_id_counter": engine.trade_id_counter,
+            "order_id_counter": engine.order_id_counter,
+            "events": [self._serialize_event(event) for event in engine._dirty_events]
+        }
+        engine._dirty_events.clear()
+        
+        self._write_json(filepath, delta_data, separators=(",", ":"))
+        
+        return str(filepath)
+    
+    def load_engine_state(
+        self,
+        engine,
+        filepath: str,
+        deltas: Optional[List[str]] = None,
+        workers: Optional[int] = None
+    ):
+        """
+        Load matching engine state from disk.
+        
+        Args:
+            engine: MatchingEngine instance to restore into
+            filepath: Path to state file (base checkpoint)
+            deltas: Optional delta snapshot paths to apply on top, in order
+            workers: Number of threads used to rebuild order books
+            
+        Raises:
+            SnapshotCorruptedError: If a file fails its checksum
+        """
+        payload = self._read_verified(filepath)
+        if payload[:len(_BINARY_MAGIC)] == _BINARY_MAGIC:
+            state_data = self._read_binary_state(payload[len(_BINARY_MAGIC):])
+        else:
+            state_data = json.loads(str(payload, "utf-8"))
+        
+        self._restore_engine_state(engine, state_data, workers)
+        
+        for delta_path in deltas or []:
+            delta_data = json.loads(str(self._read_verified(delta_path), "utf-8"))
+            
+            if delta_data["base"] != Path(filepath).name:
+                raise ValueError(
+                    f"Delta {delta_path} was taken on {delta_data['base']}, not {filepath}"
+                )
+            
+            for event in delta_data["events"]:
+                self._apply_event(engine, event)
+            
+            engine.trade_id_counter = delta_data["trade_id_counter"]
+            engine.order_id_counter = delta_data["order_id_counter"]
+    
+    def get_delta_chain(self, filepath: str) -> List[str]:
+        """
+        Find the delta snapshots taken on a base checkpoint.
+        
+        Deltas are looked up next to the base checkpoint by their
+        engine_delta_ prefix and ordered by sequence number.
+        
+        Args:
+            filepath: Path to base checkpoint
+            
+        Returns:
+            Delta snapshot paths, in the order they must be applied
+            
+        Raises:
+            ValueError: If a delta in the chain is missing
+        """
+        base = Path(filepath)
+        chain = []
+        for delta_path in base.parent.glob(f"{_DELTA_PREFIX}*.json"):
+            delta_data = json.loads(str(self._read_verified(delta_path), "utf-8"))
+            if delta_data["base"] == base.name:
+                chain.append((delta_data["sequence"], str(delta_path)))
+        chain.sort()
+        
+        if [sequence for sequence, _ in chain] != list(range(1, len(chain) + 1)):
+            raise ValueError(f"Delta chain on {base.name} is missing a delta")
+        
+        return [delta_path for _, delta_path in chain]
+    
+    def load_from_shm(self, engine, name: str, unlink: bool = False):
+        """
+        Load matching engine state from a shared memory segment.
+        
+        The payload is decoded straight out of the mapped buffer.
+        
+        Args:
+            engine: MatchingEngine instance to restore into
+            name: Shared memory segment name written by save_to_shm
+            unlink: Remove the segment once it has been read
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            (length,) = _SHM_HEADER.unpack_from(shm.buf, 0)
+            payload = shm.buf[_SHM_HEADER.size:_SHM_HEADER.size + length]
+            try:
+                state_data = json.loads(str(payload, "utf-8"))
+            finally:
+                payload.release()
+        finally:
+            shm.close()
+            if unlink:
+                shm.unlink()
+        
+        self._restore_engine_state(engine, state_data)
+    
+    def load_from_datagrams(self, engine, datagrams: Iterable[bytes]):
+        """
+        Load matching engine state from datagrams sent by a UdpSnapshotSink.
+        
+        Args:
+            engine: MatchingEngine instance to restore into
+            datagrams: Every datagram of one snapshot, in any order
+            
+        Raises:
+            ValueError: If datagrams are missing or mix snapshots
+        """
+        frames = sorted(
+            (UdpSnapshotSink.decode(datagram) for datagram in datagrams),
+            key=lambda frame: frame[0]["fragment"]
+        )
+        
+        if not frames:
+            raise ValueError("No snapshot datagrams")
+        headers = [header for header, _ in frames]
+        if (
+            len({header["sequence"] for header in headers}) != 1
+            or [header["fragment"] for header in headers] != list(range(headers[0]["fragment_count"]))
+        ):
+            raise ValueError("Incomplete or mixed snapshot datagrams")
+        
+        book_orders: Dict[str, List[Order]] = {}
+        stop_orders: Dict[str, List[Order]] = {}
+        for header, orders in frames:
+            target = stop_orders if header["is_stop_orders"] else book_orders
+            target.setdefault(header["symbol"], []).extend(orders)
+        
+        engine.trade_id_counter = headers[-1]["trade_id_counter"]
+        engine.order_id_counter = headers[-1]["order_id_counter"]
+        
+        engine.order_books.clear()
+        for symbol, orders in book_orders.items():
+            order_book = OrderBook(symbol)
+            
+            # Orders arrive level by level in FIFO order; split on level changes
+            levels = {Side.BUY: [], Side.SELL: []}
+            previous = None
+            for order in orders:
+                if (order.side, order.price_ticks) != previous:
+                    levels[order.side].append([])
+                    previous = (order.side, order.price_ticks)
+                levels[order.side][-1].append(order)
+            
+            for side, side_levels in levels.items():
+                order_book.restore_levels(side, side_levels)
+            engine.order_books[symbol] = order_book
+        
+        engine.stop_orders.clear()
+        engine.stop_orders.update(stop_orders)
+        engine._dirty_events.clear()
+    
+    def _serialize_engine_state(self, engine) -> Dict[str, Any]:
+        """Serialize matching engine state to JSON-compatible format."""
         state_data = {
             "timestamp": datetime.utcnow().isoformat(),
             "trade_id_counter": engine.trade_id_counter,
@@ -134,64 +436,305 @@ class OrderBookSnapshot:
                 self._serialize_order(order) for order in stop_order_list
             ]
         
-        # Write to file
-        with open(filepath, 'w') as f:
-            json.dump(state_data, f, indent=2)
+        return state_data
+    
+    def _serialize_engine_columns(self, engine) -> Dict[str, Any]:
+        """Serialize matching engine state with each book side stored as columns."""
+        return {
+            "columnar": True,
+            "timestamp": datetime.utcnow().isoformat(),
+            "trade_id_counter": engine.trade_id_counter,
+            "order_id_counter": engine.order_id_counter,
+            "order_books": {
+                symbol: {
+                    "bids": self._serialize_price_level_columns(order_book.bids),
+                    "asks": self._serialize_price_level_columns(order_book.asks)
+                }
+                for symbol, order_book in engine.order_books.items()
+            },
+            "stop_orders": {
+                symbol: [self._serialize_order(order) for order in stop_order_list]
+                for symbol, stop_order_list in engine.stop_orders.items()
+            }
+        }
+    
+    def _serialize_price_level_columns(self, price_levels) -> Dict[str, Any]:
+        """
+        Serialize one book side as flat per-order columns.
         
-        return str(filepath)
+        Each level's column export is concatenated level by level, so
+        orders stay in FIFO order and level_sizes records where each level
+        ends. Price is stored once per level in level_prices. Integer
+        fields are contiguous arrays so protocol 5 can write them
+        out-of-band.
+        """
+        levels = [level.to_columns() for level in price_levels.values()]
+        
+        columns = {
+            "level_prices": np.fromiter(price_levels.keys(), dtype=np.int64, count=len(price_levels)),
+            "level_sizes": np.fromiter(
+                (len(level["order_ids"]) for level in levels),
+                dtype=np.int64,
+                count=len(levels)
+            )
+        }
+        for name in ("order_ids", "order_types", "statuses", "stop_price_ticks"):
+            columns[name] = [value for level in levels for value in level[name]]
+        for name, dtype in (
+            ("qty_lots", np.int64),
+            ("remaining_lots", np.int64),
+            ("timestamps_us", np.int64),
+            ("is_triggered", np.bool_)
+        ):
+            columns[name] = np.concatenate([level[name] for level in levels] or [np.empty(0, dtype)])
+        
+        return columns
+    
+    def _write_binary_state(self, filepath: Path, state_data: Dict[str, Any]):
+        """Write state as a protocol 5 pickle with out-of-band buffers."""
+        buffers = []
+        header = pickle.dumps(state_data, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buf.raw() for buf in buffers]
+        
+        prefix = bytearray(_BINARY_MAGIC)
+        prefix += _BINARY_HEADER.pack(len(header), len(raw_buffers))
+        for raw in raw_buffers:
+            prefix += _BUFFER_LENGTH.pack(raw.nbytes)
+        
+        parts = [prefix, header, *raw_buffers]
+        crc = 0
+        for part in parts:
+            crc = zlib.crc32(part, crc)
+        parts.append(_CHECKSUM_TRAILER.pack(_CHECKSUM_TAG << 32 | crc))
+        
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _writev_all(fd, parts)
+        finally:
+            os.close(fd)
     
-    def load_engine_state(self, engine, filepath: str):
+    def _read_binary_state(self, view: memoryview) -> Dict[str, Any]:
         """
-        Load matching engine state from disk.
+        Decode a binary snapshot whose magic has already been stripped.
+        
+        The pickled arrays are rebuilt as views over the file buffer
+        rather than copied again.
+        """
+        header_length, buffer_count = _BINARY_HEADER.unpack_from(view, 0)
+        offset = _BINARY_HEADER.size
+        lengths = []
+        for _ in range(buffer_count):
+            lengths.append(_BUFFER_LENGTH.unpack_from(view, offset)[0])
+            offset += _BUFFER_LENGTH.size
+        
+        header = view[offset:offset + header_length]
+        offset += header_length
+        
+        buffers = []
+        for length in lengths:
+            buffers.append(view[offset:offset + length])
+            offset += length
+        
+        return pickle.loads(header, buffers=buffers)
+    
+    def _write_json(self, filepath: Path, data: Dict[str, Any], **dump_kwargs):
+        """Write data as JSON followed by the checksum trailer."""
+        payload = json.dumps(data, **dump_kwargs).encode("utf-8")
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+            f.write(_CHECKSUM_TRAILER.pack(_CHECKSUM_TAG << 32 | zlib.crc32(payload)))
+    
+    def _read_verified(self, filepath) -> memoryview:
+        """
+        Read a snapshot file and check its CRC-32 trailer.
+        
+        Files without a trailer predate checksums and are returned as-is.
         
         Args:
-            engine: MatchingEngine instance to restore into
-            filepath: Path to state file
+            filepath: Path to snapshot file
+            
+        Returns:
+            File contents without the trailer
+            
+        Raises:
+            SnapshotCorruptedError: If the checksum does not match
         """
-        with open(filepath, 'r') as f:
-            state_data = json.load(f)
+        with open(filepath, 'rb') as f:
+            view = memoryview(f.read())
         
+        if len(view) >= _CHECKSUM_TRAILER.size:
+            (trailer,) = _CHECKSUM_TRAILER.unpack_from(view, len(view) - _CHECKSUM_TRAILER.size)
+            if trailer >> 32 == _CHECKSUM_TAG:
+                payload = view[:-_CHECKSUM_TRAILER.size]
+                if zlib.crc32(payload) != trailer & 0xFFFFFFFF:
+                    raise SnapshotCorruptedError(f"Snapshot {filepath} failed checksum verification")
+                return payload
+        
+        return view
+    
+    def _restore_engine_state(self, engine, state_data: Dict[str, Any], workers: Optional[int] = None):
+        """
+        Restore matching engine state from deserialized snapshot data.
+        
+        With workers > 1, order books are rebuilt on a thread pool. Each
+        book is written by exactly one thread, so no locking is needed;
+        the speedup depends on the interpreter releasing the GIL (e.g.
+        free-threaded builds).
+        """
         # Restore counters
         engine.trade_id_counter = state_data["trade_id_counter"]
         engine.order_id_counter = state_data["order_id_counter"]
         
         # Restore order books
+        replay = self._replay_columns if state_data.get("columnar") else self._replay_order_book
+        books_data = state_data["order_books"]
+        
+        def replay_book(symbol: str) -> OrderBook:
+            return replay(symbol, books_data[symbol], engine.order_pool)
+        
         engine.order_books.clear()
-        for symbol, book_data in state_data["order_books"].items():
-            order_book = OrderBook(symbol)
-            
-            # Restore orders
-            orders_to_restore = []
-            
-            for price_str, orders_data in book_data["bids"].items():
-                for order_data in orders_data:
-                    order = self._deserialize_order(order_data)
-                    orders_to_restore.append(order)
-            
-            for price_str, orders_data in book_data["asks"].items():
-                for order_data in orders_data:
-                    order = self._deserialize_order(order_data)
-                    orders_to_restore.append(order)
-            
-            # Add orders in time order
-            orders_to_restore.sort(key=lambda o: o.timestamp)
-            for order in orders_to_restore:
-                order_book.add_order(order)
-            
-            engine.order_books[symbol] = order_book
+        if workers and workers > 1 and len(books_data) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                engine.order_books.update(zip(books_data, executor.map(replay_book, books_data)))
+        else:
+            for symbol in books_data:
+                engine.order_books[symbol] = replay_book(symbol)
         
         # Restore stop orders
         engine.stop_orders.clear()
         for symbol, stop_orders_data in state_data.get("stop_orders", {}).items():
             engine.stop_orders[symbol] = [
-                self._deserialize_order(order_data) for order_data in stop_orders_data
+                self._deserialize_order(order_data, engine.order_pool)
+                for order_data in stop_orders_data
+            ]
+        
+        # Restored state already reflects every recorded change
+        engine._dirty_events.clear()
+    
+    def _replay_order_book(
+        self,
+        symbol: str,
+        book_data: Dict[str, Any],
+        pool: Optional[OrderPool] = None
+    ) -> OrderBook:
+        """
+        Rebuild an order book from serialized price levels.
+        
+        Levels are serialized in FIFO order, so each one is restored as a
+        whole rather than re-sorting every order by timestamp and adding
+        them one at a time.
+        """
+        order_book = OrderBook(symbol)
+        
+        for side, key in ((Side.BUY, "bids"), (Side.SELL, "asks")):
+            order_book.restore_levels(side, [
+                [self._deserialize_order(order_data, pool) for order_data in orders_data]
+                for orders_data in book_data[key].values()
+            ])
+        
+        return order_book
+    
+    def _replay_columns(
+        self,
+        symbol: str,
+        book_data: Dict[str, Any],
+        pool: Optional[OrderPool] = None
+    ) -> OrderBook:
+        """Rebuild an order book from columnar book sides."""
+        order_book = OrderBook(symbol)
+        make_order = pool.acquire if pool is not None else Order.from_fixed_point
+        
+        for side, key in ((Side.BUY, "bids"), (Side.SELL, "asks")):
+            columns = book_data[key]
+            if "level_prices" in columns:
+                price_ticks_column = np.repeat(columns["level_prices"], columns["level_sizes"])
+            else:
+                price_ticks_column = columns["price_ticks"]
+            
+            orders = [
+                make_order(
+                    order_id, symbol, OrderType(order_type), side, qty_lots, price_ticks,
+                    from_epoch_micros(timestamp_us), remaining_lots,
+                    OrderStatus(status), stop_price_ticks, is_triggered
+                )
+                for (
+                    order_id, order_type, status, stop_price_ticks, qty_lots,
+                    price_ticks, remaining_lots, timestamp_us, is_triggered
+                ) in zip(
+                    columns["order_ids"],
+                    columns["order_types"],
+                    columns["statuses"],
+                    columns["stop_price_ticks"],
+                    columns["qty_lots"].tolist(),
+                    price_ticks_column.tolist(),
+                    columns["remaining_lots"].tolist(),
+                    columns["timestamps_us"].tolist(),
+                    columns["is_triggered"].tolist()
+                )
+            ]
+            
+            ends = np.cumsum(columns["level_sizes"]).tolist()
+            order_book.restore_levels(side, [
+                orders[start:end] for start, end in zip([0] + ends[:-1], ends)
+            ])
+        
+        return order_book
+    
+    def _serialize_event(self, event: tuple) -> Dict[str, Any]:
+        """Serialize a recorded engine change event."""
+        op = event[0]
+        if op in ("add", "stop"):
+            return {"op": op, "order": self._serialize_order(event[1])}
+        if op == "fill":
+            _, symbol, order_id, remaining_lots = event
+            return {"op": op, "symbol": symbol, "order_id": order_id, "remaining_lots": remaining_lots}
+        # cancel / unstop
+        _, symbol, order_id = event
+        return {"op": op, "symbol": symbol, "order_id": order_id}
+    
+    def _apply_event(self, engine, event: Dict[str, Any]):
+        """Replay a serialized change event onto the engine state."""
+        op = event["op"]
+        
+        if op == "add":
+            order = self._deserialize_order(event["order"], engine.order_pool)
+            engine.get_or_create_order_book(order.symbol).add_order(order)
+        
+        elif op == "fill":
+            order_book = engine.order_books[event["symbol"]]
+            order = order_book.get_order(event["order_id"])
+            if order is None:
+                return
+            if event["remaining_lots"] == 0:
+                order_book.remove_order(order.order_id)
+                order.remaining_lots = 0
+            else:
+                old_lots = order.remaining_lots
+                order.remaining_lots = event["remaining_lots"]
+                order_book.update_order_quantity(order, old_lots)
+            order.update_status()
+        
+        elif op == "cancel":
+            order_book = engine.order_books[event["symbol"]]
+            if order_book.has_order(event["order_id"]):
+                order = order_book.remove_order(event["order_id"])
+                order.status = OrderStatus.CANCELLED
+        
+        elif op == "stop":
+            order = self._deserialize_order(event["order"], engine.order_pool)
+            engine.stop_orders.setdefault(order.symbol, []).append(order)
+        
+        elif op == "unstop":
+            engine.stop_orders[event["symbol"]] = [
+                order for order in engine.stop_orders.get(event["symbol"], [])
+                if order.order_id != event["order_id"]
             ]
     
     def _serialize_price_levels(self, price_levels) -> Dict[str, list]:
         """Serialize price levels to JSON-compatible format."""
         result = {}
-        for price, level in price_levels.items():
-            result[str(price)] = [
+        for price_ticks, level in price_levels.items():
+            result[str(price_ticks)] = [
                 self._serialize_order(order) for order in level.orders
             ]
         return result
@@ -207,23 +750,43 @@ class OrderBookSnapshot:
         return result
     
     def _serialize_order(self, order: Order) -> Dict[str, Any]:
-        """Serialize order to JSON-compatible format."""
+        """Serialize order to JSON-compatible format (fixed-point amounts)."""
         return {
             "order_id": order.order_id,
             "symbol": order.symbol,
             "order_type": order.order_type.value,
             "side": order.side.value,
-            "quantity": str(order.quantity),
-            "price": str(order.price) if order.price else None,
+            "qty_lots": order.qty_lots,
+            "price_ticks": order.price_ticks,
             "timestamp": order.timestamp.isoformat(),
-            "remaining_quantity": str(order.remaining_quantity),
+            "remaining_lots": order.remaining_lots,
             "status": order.status.value,
-            "stop_price": str(order.stop_price) if order.stop_price else None,
+            "stop_price_ticks": order.stop_price_ticks,
             "is_triggered": order.is_triggered
         }
     
-    def _deserialize_order(self, order_data: Dict[str, Any]) -> Order:
-        """Deserialize order from JSON format."""
+    def _deserialize_order(self, order_data: Dict[str, Any], pool: Optional[OrderPool] = None) -> Order:
+        """Deserialize order from JSON format, reusing pooled instances when given."""
+        if "qty_lots" not in order_data:
+            return self._deserialize_decimal_order(order_data)
+        
+        make_order = pool.acquire if pool is not None else Order.from_fixed_point
+        return make_order(
+            order_id=order_data["order_id"],
+            symbol=order_data["symbol"],
+            order_type=OrderType(order_data["order_type"]),
+            side=Side(order_data["side"]),
+            qty_lots=order_data["qty_lots"],
+            price_ticks=order_data["price_ticks"],
+            timestamp=datetime.fromisoformat(order_data["timestamp"]),
+            remaining_lots=order_data["remaining_lots"],
+            status=OrderStatus(order_data["status"]),
+            stop_price_ticks=order_data.get("stop_price_ticks"),
+            is_triggered=order_data.get("is_triggered", False)
+        )
+    
+    def _deserialize_decimal_order(self, order_data: Dict[str, Any]) -> Order:
+        """Deserialize order from the legacy decimal-string snapshot format."""
         return Order(
             order_id=order_data["order_id"],
             symbol=order_data["symbol"],
@@ -242,6 +805,9 @@ class OrderBookSnapshot:
         """
         List available snapshots.
         
+        Delta snapshots are left out; they are found through
+        get_delta_chain on their base checkpoint.
+        
         Args:
             symbol: Optional symbol to filter by
             
@@ -249,7 +815,10 @@ class OrderBookSnapshot:
             List of snapshot filenames
         """
         pattern = f"{symbol}_*.json" if symbol else "*.json"
-        return sorted([f.name for f in self.snapshot_dir.glob(pattern)])
+        return sorted([
+            f.name for f in self.snapshot_dir.glob(pattern)
+            if not f.name.startswith(_DELTA_PREFIX)
+        ])
     
     def get_latest_snapshot(self, symbol: Optional[str] = None) -> Optional[str]:
         """
@@ -259,7 +828,7 @@ class OrderBookSnapshot:
             symbol: Optional symbol to filter by
             
         Returns:
-            Path to latest snapshot or None
+            Path to latest snapshot (base checkpoint) or None
         """
         snapshots = self.list_snapshots(symbol)
         if snapshots:
@@ -0,0 +1,207 @@
+"""Binary-framed UDP emission of engine snapshots for live replicas."""
+
+import socket
+import struct
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ..core.models import (
+    Order, OrderType, Side, OrderStatus, to_epoch_micros, from_epoch_micros
+)
+
+
+# Datagram header (64 bytes): magic, snapshot sequence, fragment index,
+# fragment count, record count, record kind, engine counters, symbol
+_HEADER = struct.Struct("<8sQIIHHQQ16s4x")
+
+# Order record: order ID, qty lots, price ticks, remaining lots, timestamp
+# (microseconds since epoch), stop price ticks, side, type, status, triggered.
+# Missing prices are sent as -1.
+_RECORD = struct.Struct("<32sqqqqqBBB?")
+
+_MAGIC = b"GQUDP001"
+_KIND_BOOK = 0
+_KIND_STOP = 1
+
+_ID_SIZE = 32
+_SYMBOL_SIZE = 16
+
+# Enums travel as their position in the enum definition
+_SIDES = tuple(Side)
+_ORDER_TYPES = tuple(OrderType)
+_STATUSES = tuple(OrderStatus)
+_SIDE_CODES = {side: code for code, side in enumerate(_SIDES)}
+_ORDER_TYPE_CODES = {order_type: code for code, order_type in enumerate(_ORDER_TYPES)}
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+
+def _encode_field(value: str, size: int) -> bytes:
+    """Encode a string for a fixed-width field, refusing to truncate it."""
+    encoded = value.encode("utf-8")
+    if len(encoded) > size:
+        raise ValueError(f"{value!r} exceeds {size} bytes")
+    return encoded
+
+
+class UdpSnapshotSink:
+    """
+    Sends complete engine state to a replica as fixed-layout UDP datagrams.
+    
+    Each datagram carries a 64-byte header followed by packed order
+    records for one symbol. Records are emitted level by level in FIFO
+    order, so a replica can rebuild the books without sorting. Frames are
+    packed into a single preallocated buffer and sent straight from it.
+    """
+    
+    def __init__(self, host: str, port: int, max_datagram_size: int = 1472):
+        """
+        Initialize UDP snapshot sink.
+        
+        Args:
+            host: Replica host
+            port: Replica UDP port
+            max_datagram_size: Largest datagram to send (default fits a
+                1500-byte Ethernet MTU)
+                
+        Raises:
+            ValueError: If a datagram cannot hold at least one record
+        """
+        self.address = (host, port)
+        self.records_per_datagram = (max_datagram_size - _HEADER.size) // _RECORD.size
+        if self.records_per_datagram < 1:
+            raise ValueError(f"max_datagram_size must be at least {_HEADER.size + _RECORD.size}")
+        
+        self._buffer = bytearray(_HEADER.size + self.records_per_datagram * _RECORD.size)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sequence = 0
+    
+    def send_engine_state(self, engine) -> int:
+        """
+        Send complete matching engine state.
+        
+        Args:
+            engine: MatchingEngine instance
+            
+        Returns:
+            Number of datagrams sent
+        """
+        sent = 0
+        for frame in self._frames(engine):
+            self._socket.sendto(frame, self.address)
+            sent += 1
+        return sent
+    
+    def close(self):
+        """Close the underlying socket."""
+        self._socket.close()
+    
+    def _frames(self, engine) -> Iterator[memoryview]:
+        """
+        Pack engine state into datagrams.
+        
+        Yields views over the shared buffer; each view is only valid
+        until the next one is produced.
+        
+        Raises:
+            ValueError: If a symbol or order ID does not fit its field
+        """
+        chunks: List[Tuple[int, str, List[Order]]] = []
+        step = self.records_per_datagram
+        
+        for symbol, order_book in engine.order_books.items():
+            orders = [
+                order
+                for price_levels in (order_book.bids, order_book.asks)
+                for level in price_levels.values()
+                for order in level.orders
+            ]
+            # Always send one frame per book so empty books are replicated
+            for start in range(0, max(len(orders), 1), step):
+                chunks.append((_KIND_BOOK, symbol, orders[start:start + step]))
+        
+        for symbol, stop_orders in engine.stop_orders.items():
+            for start in range(0, len(stop_orders), step):
+                chunks.append((_KIND_STOP, symbol, stop_orders[start:start + step]))
+        
+        self._sequence += 1
+        view = memoryview(self._buffer)
+        
+        for index, (kind, symbol, orders) in enumerate(chunks):
+            _HEADER.pack_into(
+                self._buffer, 0, _MAGIC, self._sequence, index, len(chunks), len(orders),
+                kind, engine.trade_id_counter, engine.order_id_counter,
+                _encode_field(symbol, _SYMBOL_SIZE)
+            )
+            
+            offset = _HEADER.size
+            for order in orders:
+                _RECORD.pack_into(
+                    self._buffer, offset,
+                    _encode_field(order.order_id, _ID_SIZE),
+                    order.qty_lots,
+                    -1 if order.price_ticks is None else order.price_ticks,
+                    order.remaining_lots,
+                    to_epoch_micros(order.timestamp),
+                    -1 if order.stop_price_ticks is None else order.stop_price_ticks,
+                    _SIDE_CODES[order.side],
+                    _ORDER_TYPE_CODES[order.order_type],
+                    _STATUS_CODES[order.status],
+                    order.is_triggered
+                )
+                offset += _RECORD.size
+            
+            yield view[:offset]
+    
+    @staticmethod
+    def decode(datagram) -> Tuple[Dict[str, Any], List[Order]]:
+        """
+        Decode a datagram produced by send_engine_state.
+        
+        Args:
+            datagram: Received datagram bytes
+            
+        Returns:
+            Tuple of (header fields, orders in emission order)
+            
+        Raises:
+            ValueError: If the datagram is not a snapshot frame
+        """
+        (
+            magic, sequence, fragment, fragment_count, record_count, kind,
+            trade_id_counter, order_id_counter, symbol
+        ) = _HEADER.unpack_from(datagram, 0)
+        
+        if magic != _MAGIC:
+            raise ValueError("Not a snapshot datagram")
+        
+        header = {
+            "sequence": sequence,
+            "fragment": fragment,
+            "fragment_count": fragment_count,
+            "is_stop_orders": kind == _KIND_STOP,
+            "trade_id_counter": trade_id_counter,
+            "order_id_counter": order_id_counter,
+            "symbol": symbol.rstrip(b"\0").decode("utf-8")
+        }
+        
+        records = memoryview(datagram)[_HEADER.size:_HEADER.size + record_count * _RECORD.size]
+        orders = [
+            Order.from_fixed_point(
+                order_id=order_id.rstrip(b"\0").decode("utf-8"),
+                symbol=header["symbol"],
+                order_type=_ORDER_TYPES[order_type],
+                side=_SIDES[side],
+                qty_lots=qty_lots,
+                price_ticks=None if price_ticks == -1 else price_ticks,
+                timestamp=from_epoch_micros(timestamp_us),
+                remaining_lots=remaining_lots,
+                status=_STATUSES[status],
+                stop_price_ticks=None if stop_price_ticks == -1 else stop_price_ticks,
+                is_triggered=is_triggered
+            )
+            for (
+                order_id, qty_lots, price_ticks, remaining_lots, timestamp_us,
+                stop_price_ticks, side, order_type, status, is_triggered
+            ) in _RECORD.iter_unpack(records)
+        ]
+        
+        return header, orders
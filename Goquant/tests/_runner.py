@@ -0,0 +1,27 @@
+"""Helpers shared by the standalone __main__ test runners.
+
+The runners are run as modules from the project root, e.g.
+`python -m tests.unit.test_fees`.
+"""
+
+
+def collect_test_methods(test_classes):
+    """
+    Collect each class's test methods once, in definition order.
+    
+    Walks the class dict rather than dir(), so inherited attributes are
+    skipped and no per-class sort is done.
+    
+    Args:
+        test_classes: Test classes to collect from
+        
+    Returns:
+        List of (test class, list of test method names)
+    """
+    return [
+        (test_class, [
+            name for name, member in vars(test_class).items()
+            if name.startswith('test_') and callable(member)
+        ])
+        for test_class in test_classes
+    ]
@@ -1,5 +1,6 @@
 """Pytest configuration and shared fixtures."""
 
+import os
 import pytest
 from decimal import Decimal
 from datetime import datetime
@@ -15,3 +16,14 @@ def sample_symbol():
 def base_price():
     """Base price for test orders."""
     return Decimal("50000.00")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """
+    Worker count for `pytest -n auto` (only used when pytest-xdist is installed).
+    
+    The suite is many small tests, so past a handful of workers process
+    startup outweighs the gain.
+    """
+    return min(os.cpu_count() or 1, 8)
@@ -23,6 +23,8 @@ from matching_engine.publishers.market_data import MarketDataPublisher
 from matching_engine.publishers.trade import TradePublisher
 from matching_engine.api import dependencies
 
+from tests._runner import collect_test_methods
+
 
 @pytest.fixture
 def app():
@@ -523,12 +525,11 @@ def run_all_api_tests():
     total_tests = 0
     passed_tests = 0
     
-    for test_class in test_classes:
+    for test_class, test_methods in collect_test_methods(test_classes):
         print(f"\n{test_class.__doc__}")
         print("-" * 70)
         
         instance = test_class()
-        test_methods = [m for m in dir(instance) if m.startswith('test_')]
         
         for method_name in test_methods:
             total_tests += 1
@@ -15,6 +15,8 @@ from matching_engine.core.models import Order, OrderType, Side, OrderStatus, Tra
 from matching_engine.core.order_book import OrderBook
 from matching_engine.api.schemas import OrderRequest, OrderResponse, OrderBookResponse
 
+from tests._runner import collect_test_methods
+
 
 class TestOrderSubmissionAPIFormat:
     """Test Order Submission API format compliance."""
@@ -385,12 +387,11 @@ def run_all_tests():
     total_tests = 0
     passed_tests = 0
     
-    for test_class in test_classes:
+    for test_class, test_methods in collect_test_methods(test_classes):
         print(f"\n{test_class.__doc__}")
         print("-" * 70)
         
         instance = test_class()
-        test_methods = [m for m in dir(instance) if m.startswith('test_')]
         
         for method_name in test_methods:
             total_tests += 1
@@ -8,6 +8,8 @@ from matching_engine.core.engine import MatchingEngine
 from matching_engine.core.models import Order, OrderType, Side
 from matching_engine.utils.fees import FeeCalculator
 
+from tests._runner import collect_test_methods
+
 
 def create_order(order_id, order_type, side, quantity, price=None):
     """Helper to create orders."""
@@ -230,21 +232,20 @@ if __name__ == "__main__":
     total = 0
     passed = 0
     
-    for test_class in test_classes:
+    for test_class, method_names in collect_test_methods(test_classes):
         print(f"\n{test_class.__doc__}")
         print("-" * 70)
         
         instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith('test_'):
-                total += 1
-                try:
-                    getattr(instance, method_name)()
-                    passed += 1
-                except Exception as e:
-                    print(f"✗ {method_name} FAILED: {e}")
-                    import traceback
-                    traceback.print_exc()
+        for method_name in method_names:
+            total += 1
+            try:
+                getattr(instance, method_name)()
+                passed += 1
+            except Exception as e:
+                print(f"✗ {method_name} FAILED: {e}")
+                import traceback
+                traceback.print_exc()
     
     print("\n" + "="*70)
     print(f"RESULTS: {passed}/{total} tests passed")
@@ -1,11 +1,12 @@
 """Unit tests for order book functionality."""
 
 import pytest
+import numpy as np
 from decimal import Decimal
 from datetime import datetime
 
-from matching_engine.core.order_book import OrderBook, PriceLevel
-from matching_engine.core.models import Order, OrderType, Side, OrderStatus
+from matching_engine.core.order_book import OrderBook, PriceLevel, PriceLadder
+from matching_engine.core.models import Order, OrderType, Side, OrderStatus, QTY_SCALE, to_ticks, from_ticks
 from matching_engine.core.exceptions import OrderNotFoundError
 
 
@@ -51,7 +52,7 @@ class TestPriceLevel:
     def test_price_level_creation(self):
         """Test price level initialization."""
         price = Decimal("50000.00")
-        level = PriceLevel(price)
+        level = PriceLevel(to_ticks(price))
         
         assert level.price == price
         assert len(level.orders) == 0
@@ -60,7 +61,7 @@ class TestPriceLevel:
     
     def test_add_order_to_level(self, buy_order):
         """Test adding order to price level."""
-        level = PriceLevel(Decimal("50000.00"))
+        level = PriceLevel(to_ticks(Decimal("50000.00")))
         level.add_order(buy_order)
         
         assert len(level.orders) == 1
@@ -69,13 +70,158 @@ class TestPriceLevel:
     
     def test_remove_order_from_level(self, buy_order):
         """Test removing order from price level."""
-        level = PriceLevel(Decimal("50000.00"))
+        level = PriceLevel(to_ticks(Decimal("50000.00")))
         level.add_order(buy_order)
         level.remove_order(buy_order)
         
         assert len(level.orders) == 0
         assert level.total_quantity == Decimal("0")
         assert level.is_empty()
+    
+    def test_to_columns(self):
+        """Test exporting a price level as per-field columns."""
+        level = PriceLevel(to_ticks(Decimal("50000.00")))
+        for i in range(3):
+            level.add_order(Order(
+                order_id=f"ORD-{i}",
+                symbol="BTC-USDT",
+                order_type=OrderType.LIMIT,
+                side=Side.BUY,
+                quantity=Decimal("3.0"),
+                price=Decimal("50000.00"),
+                timestamp=datetime(2024, 1, 1, 0, 0, i),
+                remaining_quantity=Decimal(str(i + 1))
+            ))
+        
+        columns = level.to_columns()
+        
+        assert columns["order_ids"] == ["ORD-0", "ORD-1", "ORD-2"]
+        assert columns["qty_lots"].tolist() == [to_ticks(Decimal("3.0"), QTY_SCALE)] * 3
+        assert columns["remaining_lots"].tolist() == [to_ticks(Decimal(n), QTY_SCALE) for n in (1, 2, 3)]
+        assert np.diff(columns["timestamps_us"]).tolist() == [1_000_000, 1_000_000]
+        assert "price_ticks" not in columns
+    
+    def test_remove_order_keeps_fifo_links(self):
+        """Test unlinking orders from the middle and ends of the queue."""
+        level = PriceLevel(to_ticks(Decimal("50000.00")))
+        orders = [
+            Order(
+                order_id=f"ORD-{i}",
+                symbol="BTC-USDT",
+                order_type=OrderType.LIMIT,
+                side=Side.BUY,
+                quantity=Decimal("1.0"),
+                price=Decimal("50000.00"),
+                timestamp=datetime.utcnow(),
+                remaining_quantity=Decimal("1.0")
+            )
+            for i in range(4)
+        ]
+        level.extend(orders)
+        
+        level.remove_order(orders[1])
+        assert [o.order_id for o in level] == ["ORD-0", "ORD-2", "ORD-3"]
+        assert orders[1].prev_order is None and orders[1].next_order is None
+        assert orders[1].level is None and orders[2].level is level
+        
+        level.remove_order(orders[0])
+        level.remove_order(orders[3])
+        assert level.head is orders[2] and level.tail is orders[2]
+        assert level.count == 1
+        assert level.total_quantity == Decimal("1.0")
+        
+        with pytest.raises(ValueError):
+            level.remove_order(orders[0])
+
+
+
+class TestPriceLadder:
+    """Tests for PriceLadder class."""
+    
+    def test_best_and_iteration_order(self):
+        """Test best price and best-first iteration for both sides."""
+        prices = [to_ticks(Decimal(p)) for p in ("50000", "49990", "50010", "49980")]
+        bids = PriceLadder(descending=True)
+        asks = PriceLadder()
+        for price in prices:
+            bids[price] = PriceLevel(price)
+            asks[price] = PriceLevel(price)
+        
+        assert bids.best() == max(prices)
+        assert asks.best() == min(prices)
+        assert list(bids) == sorted(prices, reverse=True)
+        assert list(asks) == sorted(prices)
+        
+        del bids[max(prices)]
+        del asks[min(prices)]
+        assert bids.best() == to_ticks(Decimal("50000"))
+        assert asks.best() == to_ticks(Decimal("49990"))
+    
+    def test_off_grid_price_refines_grid(self):
+        """Test that a price between grid points is placed correctly."""
+        asks = PriceLadder()
+        for price in ("50000", "50100", "50200", "50050.5"):
+            asks[to_ticks(Decimal(price))] = PriceLevel(to_ticks(Decimal(price)))
+        
+        assert [from_ticks(p) for p in asks] == [
+            Decimal("50000"), Decimal("50050.5"), Decimal("50100"), Decimal("50200")
+        ]
+    
+    def test_wide_price_range_falls_back(self):
+        """Test that prices too far apart for a grid still order correctly."""
+        bids = PriceLadder(descending=True)
+        prices = [1, 10 ** 15, 7, 10 ** 15 + 3]
+        for price in prices:
+            bids[price] = PriceLevel(price)
+        
+        assert bids.best() == 10 ** 15 + 3
+        assert list(bids) == sorted(prices, reverse=True)
+        
+        # Emptying the ladder starts a fresh grid
+        for price in prices:
+            del bids[price]
+        bids[100] = PriceLevel(100)
+        assert bids.best() == 100
+        assert len(bids) == 1
+    
+    @pytest.mark.parametrize("spread", [1, 10 ** 15])
+    def test_level_arrays(self, spread):
+        """Test exporting levels as price/lots arrays, on and off the grid."""
+        prices = [100, 300, 200, 100 + spread * 1000]
+        bids = PriceLadder(descending=True)
+        asks = PriceLadder()
+        for lots, price in enumerate(prices, start=1):
+            for ladder in (bids, asks):
+                ladder[price] = PriceLevel(price)
+                ladder[price].total_lots = lots
+        
+        ask_prices, ask_lots = asks.level_arrays(limit=300)
+        assert ask_prices.dtype == np.int64
+        assert ask_prices.tolist() == [100, 200, 300]
+        assert ask_lots.tolist() == [1, 3, 2]
+        
+        bid_prices, bid_lots = bids.level_arrays(limit=200, depth=2)
+        assert bid_prices.tolist() == [100 + spread * 1000, 300]
+        assert bid_lots.tolist() == [4, 2]
+        
+        empty_prices, empty_lots = PriceLadder().level_arrays()
+        assert len(empty_prices) == 0 and len(empty_lots) == 0
+    
+    @pytest.mark.parametrize("limit", [50, 100, 150, 299, 300, 301, 500])
+    def test_level_prices_limit(self, limit):
+        """Test cutting levels at limits on, between and outside grid prices."""
+        bids = PriceLadder(descending=True)
+        asks = PriceLadder()
+        for price in (100, 200, 300):
+            bids[price] = PriceLevel(price)
+            asks[price] = PriceLevel(price)
+        
+        assert asks.level_prices(limit=limit).tolist() == [p for p in (100, 200, 300) if p <= limit]
+        assert bids.level_prices(limit=limit).tolist() == [p for p in (300, 200, 100) if p >= limit]
+        
+        single = PriceLadder(descending=True)
+        single[100] = PriceLevel(100)
+        assert single.level_prices(limit=limit).tolist() == ([100] if limit <= 100 else [])
 
 
 class TestOrderBook:
@@ -93,7 +239,7 @@ class TestOrderBook:
         order_book.add_order(buy_order)
         
         assert len(order_book.bids) == 1
-        assert buy_order.price in order_book.bids
+        assert buy_order.price_ticks in order_book.bids
         assert order_book.has_order(buy_order.order_id)
     
     def test_add_sell_order(self, order_book, sell_order):
@@ -101,7 +247,7 @@ class TestOrderBook:
         order_book.add_order(sell_order)
         
         assert len(order_book.asks) == 1
-        assert sell_order.price in order_book.asks
+        assert sell_order.price_ticks in order_book.asks
         assert order_book.has_order(sell_order.order_id)
     
     def test_add_multiple_orders_same_price(self, order_book):
@@ -124,7 +270,7 @@ class TestOrderBook:
             order_book.add_order(order)
         
         assert len(order_book.bids) == 1
-        price_level = order_book.bids[Decimal("50000.00")]
+        price_level = order_book.bids[to_ticks(Decimal("50000.00"))]
         assert len(price_level.orders) == 3
         assert price_level.total_quantity == Decimal("3.0")
     
@@ -170,7 +316,7 @@ class TestOrderBook:
             order_book.add_order(order)
         
         best_bid_price, best_bid_level = order_book.get_best_bid()
-        assert best_bid_price == Decimal("50000.00")  # Highest bid
+        assert best_bid_price == to_ticks(Decimal("50000.00"))  # Highest bid
     
     def test_get_best_ask(self, order_book):
         """Test getting best (lowest) ask."""
@@ -192,7 +338,7 @@ class TestOrderBook:
             order_book.add_order(order)
         
         best_ask_price, best_ask_level = order_book.get_best_ask()
-        assert best_ask_price == Decimal("50100.00")  # Lowest ask
+        assert best_ask_price == to_ticks(Decimal("50100.00"))  # Lowest ask
     
     def test_price_time_priority(self, order_book):
         """Test that orders at same price maintain FIFO order."""
@@ -213,7 +359,7 @@ class TestOrderBook:
         for order in orders:
             order_book.add_order(order)
         
-        price_level = order_book.bids[Decimal("50000.00")]
+        price_level = order_book.bids[to_ticks(Decimal("50000.00"))]
         
         # Check FIFO order
         for i, order in enumerate(price_level.orders):
@@ -241,6 +387,75 @@ class TestOrderBook:
         assert bbo.best_bid_quantity == Decimal("0")
         assert bbo.best_ask_quantity == Decimal("0")
     
+    def test_calculate_bbo_cached(self, order_book, buy_order, sell_order):
+        """Test BBO is only rebuilt when the top of book changes."""
+        order_book.add_order(buy_order)
+        order_book.add_order(sell_order)
+        bbo = order_book.calculate_bbo()
+        
+        # Orders behind the top leave the cached BBO untouched
+        deeper_bid = Order(
+            order_id="DEEP-BID",
+            symbol="BTC-USDT",
+            order_type=OrderType.LIMIT,
+            side=Side.BUY,
+            quantity=Decimal("2.0"),
+            price=Decimal("49000.00"),
+            timestamp=datetime.utcnow(),
+            remaining_quantity=Decimal("2.0")
+        )
+        order_book.add_order(deeper_bid)
+        assert order_book.calculate_bbo() is bbo
+        
+        # Joining the best level changes its quantity
+        joining_bid = Order(
+            order_id="JOIN-BID",
+            symbol="BTC-USDT",
+            order_type=OrderType.LIMIT,
+            side=Side.BUY,
+            quantity=Decimal("0.5"),
+            price=buy_order.price,
+            timestamp=datetime.utcnow(),
+            remaining_quantity=Decimal("0.5")
+        )
+        order_book.add_order(joining_bid)
+        bbo = order_book.calculate_bbo()
+        assert bbo.best_bid == buy_order.price
+        assert bbo.best_bid_quantity == buy_order.quantity + Decimal("0.5")
+        
+        # Emptying the best level falls back to the next one
+        order_book.remove_order(buy_order.order_id)
+        order_book.remove_order("JOIN-BID")
+        bbo = order_book.calculate_bbo()
+        assert bbo.best_bid == Decimal("49000.00")
+        assert bbo.best_bid_quantity == Decimal("2.0")
+        assert bbo.best_ask == sell_order.price
+        
+        order_book.remove_order(sell_order.order_id)
+        assert order_book.calculate_bbo().best_ask is None
+    
+    def test_can_fill_fok(self, order_book):
+        """Test FOK liquidity checks across many levels and price limits."""
+        for i in range(20):
+            order_book.add_order(Order(
+                order_id=f"ASK-{i}",
+                symbol="BTC-USDT",
+                order_type=OrderType.LIMIT,
+                side=Side.SELL,
+                quantity=Decimal("1.0"),
+                price=Decimal(50000 + i),
+                timestamp=datetime.utcnow(),
+                remaining_quantity=Decimal("1.0")
+            ))
+        
+        one = to_ticks(Decimal("1"), QTY_SCALE)
+        assert order_book.can_fill_fok(Side.BUY, to_ticks(Decimal("50019")), 20 * one)
+        assert not order_book.can_fill_fok(Side.BUY, to_ticks(Decimal("50019")), 21 * one)
+        assert order_book.can_fill_fok(Side.BUY, to_ticks(Decimal("50009.5")), 10 * one)
+        assert not order_book.can_fill_fok(Side.BUY, to_ticks(Decimal("50009.5")), 11 * one)
+        assert not order_book.can_fill_fok(Side.BUY, to_ticks(Decimal("49999")), one)
+        assert not order_book.can_fill_fok(Side.SELL, to_ticks(Decimal("1")), one)
+    
     def test_get_depth(self, order_book):
         """Test getting order book depth."""
         # Add multiple bid levels
@@ -289,7 +504,39 @@ class TestOrderBook:
     def test_remove_empty_price_level(self, order_book, buy_order):
         """Test that empty price levels are removed."""
         order_book.add_order(buy_order)
-        assert buy_order.price in order_book.bids
+        assert buy_order.price_ticks in order_book.bids
         
         order_book.remove_order(buy_order.order_id)
-        assert buy_order.price not in order_book.bids
+        assert buy_order.price_ticks not in order_book.bids
+    
+    def test_restore_levels(self, order_book):
+        """Test bulk-loading price levels keeps FIFO order and totals."""
+        levels = [
+            [
+                Order(
+                    order_id=f"ORD-{price}-{i}",
+                    symbol="BTC-USDT",
+                    order_type=OrderType.LIMIT,
+                    side=Side.BUY,
+                    quantity=Decimal("1.0"),
+                    price=Decimal(price),
+                    timestamp=datetime.utcnow(),
+                    remaining_quantity=Decimal("0.5")
+                )
+                for i in range(3)
+            ]
+            for price in ("49990", "50000")
+        ]
+        
+        order_book.restore_levels(Side.BUY, levels)
+        
+        best_bid_price, best_bid_level = order_book.get_best_bid()
+        assert best_bid_price == to_ticks(Decimal("50000"))
+        assert [o.order_id for o in best_bid_level.orders] == [
+            "ORD-50000-0", "ORD-50000-1", "ORD-50000-2"
+        ]
+        assert best_bid_level.total_quantity == Decimal("1.5")
+        assert len(order_book.order_index) == 6
+        
+        order_book.remove_order("ORD-49990-1")
+        assert len(order_book.bids[to_ticks(Decimal("49990"))].orders) == 2
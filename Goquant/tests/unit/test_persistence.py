@@ -1,21 +1,45 @@
 """Tests for order book persistence and recovery."""
 
 import pytest
+import copy
 import os
+import socket
+import sys
+import traceback
+import numpy as np
 from decimal import Decimal
 from datetime import datetime
 from pathlib import Path
 
 from matching_engine.core.engine import MatchingEngine
-from matching_engine.core.models import Order, OrderType, Side, OrderStatus
+from matching_engine.core.models import (
+    Order, OrderPool, OrderType, Side, OrderStatus, QTY_SCALE, to_ticks
+)
+from matching_engine.core.exceptions import SnapshotCorruptedError
 from matching_engine.persistence.snapshot import OrderBookSnapshot
+from matching_engine.persistence.udp_sink import UdpSnapshotSink
 
+from tests._runner import collect_test_methods
 
-def create_order(order_id, order_type, side, quantity, price=None):
-    """Helper to create orders."""
+
+def create_order(order_id, order_type, side, quantity, price=None, pool=None, symbol="BTC-USDT"):
+    """Helper to create orders, drawing from an order pool when given."""
+    if pool is not None:
+        qty_lots = to_ticks(quantity, QTY_SCALE)
+        return pool.acquire(
+            order_id=order_id,
+            symbol=symbol,
+            order_type=order_type,
+            side=side,
+            qty_lots=qty_lots,
+            price_ticks=to_ticks(price) if price else None,
+            timestamp=datetime.utcnow(),
+            remaining_lots=qty_lots
+        )
+    
     return Order(
         order_id=order_id,
-        symbol="BTC-USDT",
+        symbol=symbol,
         order_type=order_type,
         side=side,
         quantity=Decimal(str(quantity)),
@@ -25,13 +49,55 @@ def create_order(order_id, order_type, side, quantity, price=None):
     )
 
 
+def run_in_fork(check, *args):
+    """
+    Run check(*args) in a forked child process and assert it passed.
+    
+    The child works on a copy-on-write image of the caller's engines, so
+    it can mutate them freely without serializing anything and without
+    disturbing the parent's copies for the next check.
+    """
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            check(*args)
+            code = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+    
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0, f"{check.__name__} failed in forked child"
+
+
+def assert_same_fills(engine, restored_engine, orders):
+    """Feed identical orders to both engines and compare the resulting trades."""
+    for order in orders:
+        expected = engine.process_order(copy.copy(order))
+        actual = restored_engine.process_order(copy.copy(order))
+        
+        assert actual.status == expected.status
+        assert actual.remaining_quantity == expected.remaining_quantity
+        assert [
+            (t.trade_id, t.price, t.quantity, t.maker_order_id, t.taker_order_id)
+            for t in actual.trades
+        ] == [
+            (t.trade_id, t.price, t.quantity, t.maker_order_id, t.taker_order_id)
+            for t in expected.trades
+        ]
+
+
 class TestOrderBookPersistence:
     """Tests for order book snapshot and recovery."""
     
-    def test_save_and_load_order_book(self):
+    def test_save_and_load_order_book(self, tmp_path):
         """Test saving and loading order book state."""
         engine = MatchingEngine()
-        snapshot_mgr = OrderBookSnapshot(snapshot_dir="test_snapshots")
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
         
         # Add orders to book
         buy1 = create_order("BUY-1", OrderType.LIMIT, Side.BUY, 1.0, 50000)
@@ -59,16 +125,12 @@ class TestOrderBookPersistence:
         assert loaded_book.has_order("BUY-2")
         assert loaded_book.has_order("SELL-1")
         
-        # Cleanup
-        os.remove(filepath)
-        os.rmdir("test_snapshots")
-        
         print("✓ Order book save and load works correctly")
     
-    def test_save_and_load_engine_state(self):
+    def test_save_and_load_engine_state(self, tmp_path):
         """Test saving and loading complete engine state."""
         engine = MatchingEngine()
-        snapshot_mgr = OrderBookSnapshot(snapshot_dir="test_snapshots")
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
         
         # Process multiple orders
         for i in range(5):
@@ -96,20 +158,17 @@ class TestOrderBookPersistence:
         assert len(order_book.bids) == 5
         assert len(order_book.asks) == 3
         
-        # Cleanup
-        os.remove(filepath)
-        os.rmdir("test_snapshots")
-        
         print("✓ Engine state save and load works correctly")
     
-    def test_persistence_preserves_order_priority(self):
+    @pytest.mark.parametrize("n", [3, 1000, 100000])
+    def test_persistence_preserves_order_priority(self, tmp_path, n):
         """Test that persistence preserves price-time priority."""
         engine = MatchingEngine()
-        snapshot_mgr = OrderBookSnapshot(snapshot_dir="test_snapshots")
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
         
         # Add orders at same price in sequence
-        for i in range(3):
-            buy = create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000)
+        for i in range(n):
+            buy = create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000, pool=engine.order_pool)
             engine.process_order(buy)
         
         # Save and load
@@ -119,19 +178,293 @@ class TestOrderBookPersistence:
         
         # Verify FIFO order preserved
         order_book = new_engine.order_books["BTC-USDT"]
-        price_level = order_book.bids[Decimal("50000")]
+        price_level = order_book.bids[to_ticks(Decimal("50000"))]
+        
+        expected = np.array([f"BUY-{i}" for i in range(n)], dtype=object)
+        assert np.array_equal(price_level.order_ids_as_array(), expected)
+        
+        print("✓ Persistence preserves price-time priority")
+    
+    def test_binary_snapshot_roundtrip(self, tmp_path):
+        """Test the columnar protocol 5 snapshot format restores the same state."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(50):
+            engine.process_order(create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000 - i % 5))
+            engine.process_order(create_order(f"SELL-{i}", OrderType.LIMIT, Side.SELL, 1.0, 50100 + i % 5))
+        engine.process_order(create_order("TAKER-1", OrderType.MARKET, Side.SELL, 2.5))
+        
+        filepath = snapshot_mgr.save_engine_state(engine, "test_engine.snap", binary=True)
+        with open(filepath, "rb") as f:
+            assert f.read(8) == b"GQSNAP05"
+        
+        new_engine = MatchingEngine()
+        snapshot_mgr.load_engine_state(new_engine, filepath)
+        
+        assert new_engine.order_id_counter == engine.order_id_counter
+        assert new_engine.trade_id_counter == engine.trade_id_counter
+        
+        live_book = engine.order_books["BTC-USDT"]
+        order_book = new_engine.order_books["BTC-USDT"]
+        assert order_book.get_depth(levels=10) == live_book.get_depth(levels=10)
+        assert order_book.get_order("BUY-10").remaining_quantity == Decimal("0.5")
+        assert order_book.get_order("BUY-10").timestamp == live_book.get_order("BUY-10").timestamp
+        
+        for price_ticks, level in live_book.bids.items():
+            restored_ids = order_book.bids[price_ticks].order_ids_as_array()
+            assert np.array_equal(restored_ids, level.order_ids_as_array())
+        
+        print("✓ Binary snapshot round-trip works correctly")
+    
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_corrupted_snapshot_detected(self, tmp_path, binary):
+        """Test that a flipped byte in a snapshot file is rejected on load."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(5):
+            buy = create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000 - i)
+            engine.process_order(buy)
+        
+        filepath = snapshot_mgr.save_engine_state(engine, "test_crc.snap", binary=binary)
+        
+        # Intact file loads fine
+        snapshot_mgr.load_engine_state(MatchingEngine(), filepath)
+        
+        data = bytearray(Path(filepath).read_bytes())
+        data[len(data) // 2] ^= 0x01
+        Path(filepath).write_bytes(data)
+        
+        with pytest.raises(SnapshotCorruptedError):
+            snapshot_mgr.load_engine_state(MatchingEngine(), filepath)
+        
+        print("✓ Corrupted snapshot is detected")
+    
+    def test_parallel_load_matches_serial(self, tmp_path):
+        """Test that rebuilding books on worker threads gives the same state."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        symbols = ["BTC-USDT", "ETH-USDT", "SOL-USDT", "XRP-USDT"]
+        for symbol in symbols:
+            for i in range(20):
+                engine.process_order(create_order(
+                    f"{symbol}-BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 100 - i % 4, symbol=symbol
+                ))
+                engine.process_order(create_order(
+                    f"{symbol}-SELL-{i}", OrderType.LIMIT, Side.SELL, 1.0, 110 + i % 4, symbol=symbol
+                ))
+        
+        filepath = snapshot_mgr.save_engine_state(engine, "test_parallel.json")
+        
+        serial_engine = MatchingEngine()
+        snapshot_mgr.load_engine_state(serial_engine, filepath)
+        parallel_engine = MatchingEngine()
+        snapshot_mgr.load_engine_state(parallel_engine, filepath, workers=4)
+        
+        assert list(parallel_engine.order_books) == symbols
+        for symbol in symbols:
+            serial_book = serial_engine.order_books[symbol]
+            parallel_book = parallel_engine.order_books[symbol]
+            assert parallel_book.get_depth(levels=10) == serial_book.get_depth(levels=10)
+            for price_ticks, level in serial_book.bids.items():
+                assert np.array_equal(
+                    parallel_book.bids[price_ticks].order_ids_as_array(),
+                    level.order_ids_as_array()
+                )
+        
+        print("✓ Parallel load matches serial load")
+    
+    @pytest.mark.skipif(os.name == "nt", reason="requires os.fork")
+    def test_restored_engine_trades_like_original(self, tmp_path):
+        """Test that a restored engine matches incoming flow like the original."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(20):
+            engine.process_order(create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 0.5 + i % 3, 50000 - i % 4))
+            engine.process_order(create_order(f"SELL-{i}", OrderType.LIMIT, Side.SELL, 0.5 + i % 3, 50100 + i % 4))
+        engine.process_order(create_order("TAKER-0", OrderType.MARKET, Side.BUY, 1.2))
+        
+        filepath = snapshot_mgr.save_engine_state(engine, "test_equivalence.json")
+        restored_engine = MatchingEngine()
+        snapshot_mgr.load_engine_state(restored_engine, filepath)
+        
+        # Each scenario starts from the same pair of books in its own child
+        scenarios = [
+            [create_order("TAKER-1", OrderType.MARKET, Side.BUY, 7.5)],
+            [create_order("TAKER-2", OrderType.LIMIT, Side.SELL, 4.0, 49999)],
+            [
+                create_order("TAKER-3", OrderType.FOK, Side.BUY, 3.0, 50101),
+                create_order("TAKER-4", OrderType.IOC, Side.SELL, 100.0, 49998)
+            ]
+        ]
+        for orders in scenarios:
+            run_in_fork(assert_same_fills, engine, restored_engine, orders)
+        
+        print("✓ Restored engine trades like the original")
+    
+    def test_shm_roundtrip(self, tmp_path):
+        """Test saving and loading engine state through shared memory."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(3):
+            buy = create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000)
+            engine.process_order(buy)
+        sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.5, 50100)
+        engine.process_order(sell)
+        
+        # Publish and reload without touching the filesystem
+        name = snapshot_mgr.save_to_shm(engine, f"test_engine_{os.getpid()}")
+        new_engine = MatchingEngine()
+        snapshot_mgr.load_from_shm(new_engine, name, unlink=True)
+        
+        # Verify state
+        assert new_engine.order_id_counter == engine.order_id_counter
+        assert new_engine.trade_id_counter == engine.trade_id_counter
+        
+        order_book = new_engine.order_books["BTC-USDT"]
+        assert len(order_book.bids) == 1
+        assert len(order_book.asks) == 1
+        assert order_book.has_order("SELL-1")
         
+        price_level = order_book.bids[to_ticks(Decimal("50000"))]
         order_ids = [order.order_id for order in price_level.orders]
         assert order_ids == ["BUY-0", "BUY-1", "BUY-2"]
         
-        # Cleanup
-        os.remove(filepath)
-        os.rmdir("test_snapshots")
+        print("✓ Shared memory round-trip works correctly")
+    
+    def test_delta_snapshot(self, tmp_path, monkeypatch):
+        """Test that delta snapshots record only changes and replay onto the base."""
+        # Engine-owned snapshot manager writes relative to the working directory
+        monkeypatch.chdir(tmp_path)
         
-        print("✓ Persistence preserves price-time priority")
+        engine = MatchingEngine(enable_persistence=True, snapshot_interval=3600)
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(100):
+            engine.process_order(create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000 - i))
+            engine.process_order(create_order(f"SELL-{i}", OrderType.LIMIT, Side.SELL, 1.0, 50100 + i))
+        
+        # First call writes the full base checkpoint
+        base_path = snapshot_mgr.save_delta(engine, "test_base.json")
+        
+        # A few mutations: new order, cancel, partial fill
+        engine.process_order(create_order("BUY-NEW", OrderType.LIMIT, Side.BUY, 2.0, 49950))
+        engine.cancel_order("SELL-50", "BTC-USDT")
+        engine.process_order(create_order("TAKER-1", OrderType.MARKET, Side.BUY, 0.4))
+        
+        delta_path = snapshot_mgr.save_delta(engine, "test_delta.json")
+        assert len(engine._dirty_events) == 0
+        assert os.path.getsize(delta_path) < 0.1 * os.path.getsize(base_path)
+        
+        # Base + delta reproduces the live book
+        new_engine = MatchingEngine()
+        snapshot_mgr.load_engine_state(new_engine, base_path, deltas=[delta_path])
+        
+        order_book = new_engine.order_books["BTC-USDT"]
+        assert order_book.has_order("BUY-NEW")
+        assert not order_book.has_order("SELL-50")
+        assert order_book.get_order("SELL-0").remaining_quantity == Decimal("0.6")
+        assert new_engine.trade_id_counter == engine.trade_id_counter
+        
+        live_book = engine.order_books["BTC-USDT"]
+        assert order_book.get_depth(levels=200) == live_book.get_depth(levels=200)
+        
+        print("✓ Delta snapshots replay onto base checkpoint")
+    
+    def test_load_draws_from_order_pool(self, tmp_path):
+        """Test that engine state restore reuses pooled Order instances."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(10):
+            buy = create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000 - i)
+            engine.process_order(buy)
+        
+        filepath = snapshot_mgr.save_engine_state(engine, "test_pool.json")
+        
+        new_engine = MatchingEngine()
+        new_engine.order_pool = OrderPool(size=10)
+        pooled = set(map(id, new_engine.order_pool._free))
+        snapshot_mgr.load_engine_state(new_engine, filepath)
+        
+        # Every restored order came out of the preallocated free list
+        assert len(new_engine.order_pool) == 0
+        restored = new_engine.order_books["BTC-USDT"].order_index.values()
+        assert {id(order) for order, _ in restored} == pooled
+        
+        # Released orders are handed out again
+        order = new_engine.order_books["BTC-USDT"].remove_order("BUY-0")
+        new_engine.order_pool.release(order)
+        reused = create_order("BUY-X", OrderType.LIMIT, Side.BUY, 2.0, 49000, pool=new_engine.order_pool)
+        assert reused is order
+        assert reused.order_id == "BUY-X"
+        assert reused.remaining_quantity == Decimal("2.0")
+        
+        print("✓ Snapshot restore draws orders from the pool")
     
-    def test_manual_snapshot(self):
+    def test_udp_snapshot_roundtrip(self, tmp_path):
+        """Test sending engine state as UDP datagrams and rebuilding it."""
+        engine = MatchingEngine()
+        snapshot_mgr = OrderBookSnapshot(snapshot_dir=tmp_path)
+        
+        for i in range(30):
+            engine.process_order(create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000 - i % 3))
+            engine.process_order(create_order(f"SELL-{i}", OrderType.LIMIT, Side.SELL, 1.0, 50100 + i % 3))
+        engine.process_order(create_order("TAKER-1", OrderType.MARKET, Side.SELL, 1.5))
+        
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(5)
+        sink = UdpSnapshotSink("127.0.0.1", receiver.getsockname()[1], max_datagram_size=512)
+        
+        try:
+            # Small datagrams force the book to be split across frames
+            location = snapshot_mgr.save_engine_state(engine, sink=sink)
+            assert location.startswith("udp://127.0.0.1:")
+            
+            first = receiver.recv(65535)
+            header, orders = UdpSnapshotSink.decode(first)
+            datagrams = [first] + [receiver.recv(65535) for _ in range(header["fragment_count"] - 1)]
+        finally:
+            sink.close()
+            receiver.close()
+        
+        assert header["fragment_count"] > 1
+        assert header["symbol"] == "BTC-USDT"
+        assert header["trade_id_counter"] == engine.trade_id_counter
+        
+        # Records carry every order field unchanged
+        live_book = engine.order_books["BTC-USDT"]
+        for order in orders:
+            live_order = live_book.get_order(order.order_id)
+            assert order.side == live_order.side
+            assert order.price_ticks == live_order.price_ticks
+            assert order.remaining_lots == live_order.remaining_lots
+            assert order.timestamp == live_order.timestamp
+            assert order.status == live_order.status
+        
+        new_engine = MatchingEngine()
+        snapshot_mgr.load_from_datagrams(new_engine, reversed(datagrams))
+        
+        order_book = new_engine.order_books["BTC-USDT"]
+        assert order_book.get_depth(levels=10) == live_book.get_depth(levels=10)
+        assert order_book.get_order("BUY-3").remaining_quantity == Decimal("0.5")
+        for price_ticks, level in live_book.bids.items():
+            assert np.array_equal(
+                order_book.bids[price_ticks].order_ids_as_array(),
+                level.order_ids_as_array()
+            )
+        
+        print("✓ UDP snapshot round-trip works correctly")
+    
+    def test_manual_snapshot(self, tmp_path, monkeypatch):
         """Test manual snapshot creation."""
+        monkeypatch.chdir(tmp_path)
+        
         engine = MatchingEngine()
         
         # Add some orders
@@ -149,10 +482,6 @@ class TestOrderBookPersistence:
         assert "BTC-USDT" in new_engine.order_books
         assert new_engine.order_books["BTC-USDT"].has_order("BUY-1")
         
-        # Cleanup
-        os.remove(filepath)
-        Path("snapshots").rmdir()
-        
         print("✓ Manual snapshot works correctly")
 
 
@@ -168,17 +497,104 @@ class TestAutomaticSnapshots:
         
         print("✓ Automatic snapshots disabled by default")
     
-    def test_automatic_snapshot_enabled(self):
+    def test_automatic_snapshot_enabled(self, tmp_path, monkeypatch):
         """Test enabling automatic snapshots."""
+        monkeypatch.chdir(tmp_path)
+        
         engine = MatchingEngine(enable_persistence=True, snapshot_interval=1)
         
         assert engine.enable_persistence is True
         assert engine.snapshot_manager is not None
         
         print("✓ Automatic snapshots can be enabled")
+    
+    def test_automatic_snapshot_recovery(self, tmp_path, monkeypatch):
+        """Test that the latest automatic snapshot recovers changes written as deltas."""
+        monkeypatch.chdir(tmp_path)
+        
+        # Every order after the first triggers a snapshot
+        engine = MatchingEngine(enable_persistence=True, snapshot_interval=0)
+        engine.snapshot_manager.checkpoint_interval = 4
+        
+        for i in range(10):
+            engine.process_order(create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000 - i))
+            engine.process_order(create_order(f"SELL-{i}", OrderType.LIMIT, Side.SELL, 1.0, 50100 + i))
+        engine.cancel_order("SELL-5", "BTC-USDT")
+        engine.process_order(create_order("TAKER-1", OrderType.MARKET, Side.BUY, 0.4))
+        assert len(engine._dirty_events) == 0
+        
+        snapshot_mgr = engine.snapshot_manager
+        latest = snapshot_mgr.get_latest_snapshot()
+        assert Path(latest).name.startswith("engine_state_")
+        assert not any(name.startswith("engine_delta_") for name in snapshot_mgr.list_snapshots())
+        assert len(snapshot_mgr.get_delta_chain(latest)) > 0
+        
+        new_engine = MatchingEngine()
+        new_engine.load_snapshot(latest)
+        
+        order_book = new_engine.order_books["BTC-USDT"]
+        assert not order_book.has_order("SELL-5")
+        assert order_book.get_order("SELL-0").remaining_quantity == Decimal("0.6")
+        assert new_engine.trade_id_counter == engine.trade_id_counter
+        assert new_engine.order_id_counter == engine.order_id_counter
+        assert order_book.get_depth(levels=20) == engine.order_books["BTC-USDT"].get_depth(levels=20)
+        
+        print("✓ Latest automatic snapshot recovers delta chain")
+
+
+def _init_worker(scratch_dir):
+    """
+    Move a worker process into its own scratch directory.
+    
+    The directory is derived from the worker PID so the relative snapshot
+    directories used by the tests never race with other workers.
+    """
+    workdir = Path(scratch_dir) / str(os.getpid())
+    workdir.mkdir()
+    os.chdir(workdir)
+
+
+def _run_one(case):
+    """
+    Run a single test case in a worker process.
+    
+    Returns:
+        Tuple of (test name, passed, traceback string)
+    """
+    import inspect
+    import shutil
+    import tempfile
+    
+    test_class, method_name, kwargs = case
+    name = f"{test_class.__name__}.{method_name}"
+    if kwargs:
+        name += "[" + ",".join(str(v) for v in kwargs.values()) + "]"
+    
+    # Stand in for the pytest fixtures the tests request
+    method = getattr(test_class(), method_name)
+    params = inspect.signature(method).parameters
+    tmp_path = Path(tempfile.mkdtemp(dir=os.getcwd()))
+    monkeypatch = pytest.MonkeyPatch()
+    if "tmp_path" in params:
+        kwargs = {**kwargs, "tmp_path": tmp_path}
+    if "monkeypatch" in params:
+        kwargs = {**kwargs, "monkeypatch": monkeypatch}
+    
+    try:
+        method(**kwargs)
+        return name, True, ""
+    except Exception:
+        return name, False, traceback.format_exc()
+    finally:
+        monkeypatch.undo()
+        shutil.rmtree(tmp_path)
 
 
 if __name__ == "__main__":
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    
     print("\n" + "="*70)
     print("PERSISTENCE TESTS")
     print("="*70)
@@ -188,24 +604,39 @@ if __name__ == "__main__":
         TestAutomaticSnapshots
     ]
     
-    total = 0
+    # Collect (class, method, kwargs) cases, expanding parametrize marks
+    cases = []
+    for test_class, method_names in collect_test_methods(test_classes):
+        for method_name in method_names:
+            method = vars(test_class)[method_name]
+            params = [
+                {mark.args[0]: value}
+                for mark in getattr(method, "pytestmark", [])
+                if mark.name == "parametrize"
+                for value in mark.args[1]
+            ] or [{}]
+            for kwargs in params:
+                cases.append((test_class, method_name, kwargs))
+    
+    total = len(cases)
     passed = 0
     
-    for test_class in test_classes:
-        print(f"\n{test_class.__doc__}")
-        print("-" * 70)
-        
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith('test_'):
-                total += 1
-                try:
-                    getattr(instance, method_name)()
+    # Tests are self-contained, so run them across all cores
+    scratch_dir = tempfile.mkdtemp(prefix="test_persistence_")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(scratch_dir,)
+        ) as executor:
+            for name, ok, tb in executor.map(_run_one, cases):
+                if ok:
                     passed += 1
-                except Exception as e:
-                    print(f"✗ {method_name} FAILED: {e}")
-                    import traceback
-                    traceback.print_exc()
+                else:
+                    print(f"✗ {name} FAILED")
+                    print(tb)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
     
     print("\n" + "="*70)
     print(f"RESULTS: {passed}/{total} tests passed")
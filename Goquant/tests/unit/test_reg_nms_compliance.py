@@ -7,28 +7,74 @@ Tests verify:
 3. Order Type Handling (Market, Limit, IOC, FOK)
 """
 
+import itertools
 import pytest
 from decimal import Decimal
 from datetime import datetime
 
 from matching_engine.core.engine import MatchingEngine
-from matching_engine.core.models import Order, OrderType, Side, OrderStatus
+from matching_engine.core.models import (
+    OrderPool, OrderType, Side, OrderStatus, PRICE_SCALE, QTY_SCALE,
+    to_epoch_micros, from_epoch_micros
+)
+
+
+# Expected prices and quantities, built once instead of per assertion
+PRICES = {price: Decimal(price) for price in (49800, 49900, 50000, 50010, 50100, 50200)}
+QUANTITIES = {qty: Decimal(str(qty)) for qty in (0, 0.5, 1.0, 2.0, 3.0)}
+
+# Orders are drawn from a preallocated pool. Creation times come from a
+# microsecond counter rather than the clock, so they strictly increase in
+# submission order without a clock read per order
+ORDER_POOL = OrderPool(size=4096)
+SEQUENCE = itertools.count(to_epoch_micros(datetime.utcnow()))
+
+
+def ticks(price):
+    """Scale a price to fixed-point ticks."""
+    return int(round(price * PRICE_SCALE))
+
+
+def lots(quantity):
+    """Scale a quantity to fixed-point lots."""
+    return int(round(quantity * QTY_SCALE))
 
 
 def create_order(order_id, order_type, side, quantity, price=None):
-    """Helper to create orders."""
-    return Order(
+    """Helper to create pooled orders with fixed-point price and quantity."""
+    return ORDER_POOL.acquire(
         order_id=order_id,
         symbol="BTC-USDT",
         order_type=order_type,
         side=side,
-        quantity=Decimal(str(quantity)),
-        price=Decimal(str(price)) if price else None,
-        timestamp=datetime.utcnow(),
-        remaining_quantity=Decimal(str(quantity))
+        qty_lots=lots(quantity),
+        price_ticks=ticks(price) if price else None,
+        timestamp=from_epoch_micros(next(SEQUENCE)),
+        remaining_lots=lots(quantity)
     )
 
 
+def create_orders(n, order_type, side, quantity, price=None, prefix=None):
+    """
+    Helper to build n orders for batch submission.
+    
+    IDs are "<prefix>-<i>" numbered from 0 (prefix defaults to the side).
+    price may be a single price or a list with one price per order.
+    """
+    prefix = prefix or side.value.upper()
+    prices = price if isinstance(price, list) else [price] * n
+    return [
+        create_order(f"{prefix}-{i}", order_type, side, quantity, prices[i])
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def engine():
+    """Create a matching engine for testing."""
+    return MatchingEngine()
+
+
 class TestBBOCalculationAndDissemination:
     """
     Requirement 1: BBO Calculation and Dissemination
@@ -36,9 +82,8 @@ class TestBBOCalculationAndDissemination:
     - Accurately calculate and update BBO instantaneously
     """
     
-    def test_bbo_empty_book(self):
+    def test_bbo_empty_book(self, engine):
         """Test BBO calculation with empty order book."""
-        engine = MatchingEngine()
         order_book = engine.get_or_create_order_book("BTC-USDT")
         
         bbo = order_book.calculate_bbo()
@@ -46,13 +91,12 @@ class TestBBOCalculationAndDissemination:
         assert bbo.symbol == "BTC-USDT"
         assert bbo.best_bid is None
         assert bbo.best_ask is None
-        assert bbo.best_bid_quantity == Decimal("0")
-        assert bbo.best_ask_quantity == Decimal("0")
+        assert bbo.best_bid_quantity == QUANTITIES[0]
+        assert bbo.best_ask_quantity == QUANTITIES[0]
         print("✓ BBO correctly handles empty book")
     
-    def test_bbo_updates_on_order_add(self):
+    def test_bbo_updates_on_order_add(self, engine):
         """Test BBO updates when orders are added."""
-        engine = MatchingEngine()
         order_book = engine.get_or_create_order_book("BTC-USDT")
         
         # Add buy order
@@ -60,8 +104,8 @@ class TestBBOCalculationAndDissemination:
         engine.process_order(buy)
         
         bbo = order_book.calculate_bbo()
-        assert bbo.best_bid == Decimal("50000")
-        assert bbo.best_bid_quantity == Decimal("1.0")
+        assert bbo.best_bid == PRICES[50000]
+        assert bbo.best_bid_quantity == QUANTITIES[1.0]
         assert bbo.best_ask is None
         
         # Add sell order
@@ -69,23 +113,21 @@ class TestBBOCalculationAndDissemination:
         engine.process_order(sell)
         
         bbo = order_book.calculate_bbo()
-        assert bbo.best_bid == Decimal("50000")
-        assert bbo.best_bid_quantity == Decimal("1.0")
-        assert bbo.best_ask == Decimal("50100")
-        assert bbo.best_ask_quantity == Decimal("2.0")
+        assert bbo.best_bid == PRICES[50000]
+        assert bbo.best_bid_quantity == QUANTITIES[1.0]
+        assert bbo.best_ask == PRICES[50100]
+        assert bbo.best_ask_quantity == QUANTITIES[2.0]
         print("✓ BBO updates correctly when orders are added")
     
-    def test_bbo_updates_on_order_match(self):
+    def test_bbo_updates_on_order_match(self, engine):
         """Test BBO updates when orders are matched."""
-        engine = MatchingEngine()
-        
         # Add sell order
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50000)
         engine.process_order(sell)
         
         order_book = engine.order_books["BTC-USDT"]
         bbo_before = order_book.calculate_bbo()
-        assert bbo_before.best_ask == Decimal("50000")
+        assert bbo_before.best_ask == PRICES[50000]
         
         # Match with buy order
         buy = create_order("BUY-1", OrderType.MARKET, Side.BUY, 1.0)
@@ -95,10 +137,8 @@ class TestBBOCalculationAndDissemination:
         assert bbo_after.best_ask is None  # Ask removed after match
         print("✓ BBO updates correctly when orders are matched")
     
-    def test_bbo_updates_on_order_cancel(self):
+    def test_bbo_updates_on_order_cancel(self, engine):
         """Test BBO updates when orders are cancelled."""
-        engine = MatchingEngine()
-        
         # Add orders
         buy1 = create_order("BUY-1", OrderType.LIMIT, Side.BUY, 1.0, 50000)
         buy2 = create_order("BUY-2", OrderType.LIMIT, Side.BUY, 1.0, 49900)
@@ -107,19 +147,17 @@ class TestBBOCalculationAndDissemination:
         
         order_book = engine.order_books["BTC-USDT"]
         bbo_before = order_book.calculate_bbo()
-        assert bbo_before.best_bid == Decimal("50000")
+        assert bbo_before.best_bid == PRICES[50000]
         
         # Cancel best bid
         engine.cancel_order("BUY-1", "BTC-USDT")
         
         bbo_after = order_book.calculate_bbo()
-        assert bbo_after.best_bid == Decimal("49900")  # Next best bid
+        assert bbo_after.best_bid == PRICES[49900]  # Next best bid
         print("✓ BBO updates correctly when orders are cancelled")
     
-    def test_bbo_multiple_orders_same_price(self):
+    def test_bbo_multiple_orders_same_price(self, engine):
         """Test BBO aggregates quantity at same price level."""
-        engine = MatchingEngine()
-        
         # Add multiple orders at same price
         for i in range(3):
             buy = create_order(f"BUY-{i}", OrderType.LIMIT, Side.BUY, 1.0, 50000)
@@ -128,8 +166,8 @@ class TestBBOCalculationAndDissemination:
         order_book = engine.order_books["BTC-USDT"]
         bbo = order_book.calculate_bbo()
         
-        assert bbo.best_bid == Decimal("50000")
-        assert bbo.best_bid_quantity == Decimal("3.0")  # Aggregated
+        assert bbo.best_bid == PRICES[50000]
+        assert bbo.best_bid_quantity == QUANTITIES[3.0]  # Aggregated
         print("✓ BBO correctly aggregates quantity at same price level")
 
 
@@ -141,18 +179,12 @@ class TestPriceTimePriority:
     - Prevent internal trade-throughs
     """
     
-    def test_price_priority_buy_side(self):
+    def test_price_priority_buy_side(self, engine):
         """Test that higher bid prices are matched first."""
-        engine = MatchingEngine()
-        
-        # Add sell orders at different prices
-        sell1 = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50100)
-        sell2 = create_order("SELL-2", OrderType.LIMIT, Side.SELL, 1.0, 50000)  # Better price
-        sell3 = create_order("SELL-3", OrderType.LIMIT, Side.SELL, 1.0, 50200)
-        
-        engine.process_order(sell1)
-        engine.process_order(sell2)
-        engine.process_order(sell3)
+        # Add sell orders at different prices (50000 is the best)
+        engine.process_orders(
+            create_orders(3, OrderType.LIMIT, Side.SELL, 1.0, [50100, 50000, 50200])
+        )
         
         # Market buy should match best prices first
         buy = create_order("BUY-1", OrderType.MARKET, Side.BUY, 3.0)
@@ -160,23 +192,17 @@ class TestPriceTimePriority:
         
         # Verify execution order: 50000, 50100, 50200
         assert len(result.trades) == 3
-        assert result.trades[0].price == Decimal("50000")
-        assert result.trades[1].price == Decimal("50100")
-        assert result.trades[2].price == Decimal("50200")
+        assert result.trades[0].price == PRICES[50000]
+        assert result.trades[1].price == PRICES[50100]
+        assert result.trades[2].price == PRICES[50200]
         print("✓ Price priority enforced: better prices matched first")
     
-    def test_price_priority_sell_side(self):
+    def test_price_priority_sell_side(self, engine):
         """Test that higher bid prices are matched first on sell side."""
-        engine = MatchingEngine()
-        
-        # Add buy orders at different prices
-        buy1 = create_order("BUY-1", OrderType.LIMIT, Side.BUY, 1.0, 49900)
-        buy2 = create_order("BUY-2", OrderType.LIMIT, Side.BUY, 1.0, 50000)  # Better price
-        buy3 = create_order("BUY-3", OrderType.LIMIT, Side.BUY, 1.0, 49800)
-        
-        engine.process_order(buy1)
-        engine.process_order(buy2)
-        engine.process_order(buy3)
+        # Add buy orders at different prices (50000 is the best)
+        engine.process_orders(
+            create_orders(3, OrderType.LIMIT, Side.BUY, 1.0, [49900, 50000, 49800])
+        )
         
         # Market sell should match best prices first
         sell = create_order("SELL-1", OrderType.MARKET, Side.SELL, 3.0)
@@ -184,35 +210,63 @@ class TestPriceTimePriority:
         
         # Verify execution order: 50000, 49900, 49800
         assert len(result.trades) == 3
-        assert result.trades[0].price == Decimal("50000")
-        assert result.trades[1].price == Decimal("49900")
-        assert result.trades[2].price == Decimal("49800")
+        assert result.trades[0].price == PRICES[50000]
+        assert result.trades[1].price == PRICES[49900]
+        assert result.trades[2].price == PRICES[49800]
         print("✓ Price priority enforced on sell side")
     
-    def test_time_priority_fifo(self):
+    @pytest.mark.parametrize("resting, taken", [(5, 3), (3, 3), (20, 7)])
+    def test_time_priority_fifo(self, engine, resting, taken):
         """Test FIFO matching at same price level."""
-        engine = MatchingEngine()
-        
         # Add orders at same price in sequence
-        for i in range(5):
-            sell = create_order(f"SELL-{i}", OrderType.LIMIT, Side.SELL, 1.0, 50000)
-            engine.process_order(sell)
+        engine.process_orders(create_orders(resting, OrderType.LIMIT, Side.SELL, 1.0, 50000))
         
         # Match with buy order
-        buy = create_order("BUY-1", OrderType.MARKET, Side.BUY, 3.0)
+        buy = create_order("BUY-1", OrderType.MARKET, Side.BUY, float(taken))
         result = engine.process_order(buy)
         
         # Verify FIFO order
-        assert len(result.trades) == 3
-        assert result.trades[0].maker_order_id == "SELL-0"
-        assert result.trades[1].maker_order_id == "SELL-1"
-        assert result.trades[2].maker_order_id == "SELL-2"
+        assert [trade.maker_order_id for trade in result.trades] == [
+            f"SELL-{i}" for i in range(taken)
+        ]
+        
+        # Queue order agrees with creation order
+        level = engine.order_books["BTC-USDT"].get_best_ask()
+        if level:
+            timestamps = [order.timestamp for order in level[1]]
+            assert timestamps == sorted(timestamps)
         print("✓ Time priority (FIFO) enforced at same price level")
     
-    def test_no_trade_through_limit_order(self):
+    def test_batch_matches_sequential(self):
+        """Test that a batch gives the same results as one-by-one submission."""
+        def submit(batch):
+            engine = MatchingEngine()
+            orders = (
+                create_orders(3, OrderType.LIMIT, Side.SELL, 1.0, [50100, 50000, 50000])
+                + create_orders(2, OrderType.LIMIT, Side.BUY, 1.5, [50000, 49900])
+            )
+            if batch:
+                results = engine.process_orders(orders)
+            else:
+                results = [engine.process_order(order) for order in orders]
+            return results, engine.get_or_create_order_book("BTC-USDT").calculate_bbo()
+        
+        batch_results, batch_bbo = submit(batch=True)
+        sequential_results, sequential_bbo = submit(batch=False)
+        
+        assert [r.status for r in batch_results] == [r.status for r in sequential_results]
+        assert [
+            [(t.maker_order_id, t.price, t.quantity) for t in r.trades] for r in batch_results
+        ] == [
+            [(t.maker_order_id, t.price, t.quantity) for t in r.trades] for r in sequential_results
+        ]
+        assert batch_bbo.best_bid == sequential_bbo.best_bid == PRICES[49900]
+        assert batch_bbo.best_ask == sequential_bbo.best_ask == PRICES[50000]
+        assert batch_bbo.best_ask_quantity == sequential_bbo.best_ask_quantity == QUANTITIES[0.5]
+        print("✓ Batch submission matches sequential submission")
+    
+    def test_no_trade_through_limit_order(self, engine):
         """Test that limit orders don't trade through better prices."""
-        engine = MatchingEngine()
-        
         # Add sell orders at different prices
         sell1 = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50000)
         sell2 = create_order("SELL-2", OrderType.LIMIT, Side.SELL, 1.0, 50200)
@@ -226,14 +280,12 @@ class TestPriceTimePriority:
         
         # Should only match first order
         assert len(result.trades) == 1
-        assert result.trades[0].price == Decimal("50000")
-        assert result.remaining_quantity == Decimal("1.0")
+        assert result.trades[0].price == PRICES[50000]
+        assert result.remaining_quantity == QUANTITIES[1.0]
         print("✓ Trade-through prevention: limit order stops at price limit")
     
-    def test_partial_fill_at_better_price(self):
+    def test_partial_fill_at_better_price(self, engine):
         """Test partial fill at better price before moving to next level."""
-        engine = MatchingEngine()
-        
         # Add sell orders
         sell1 = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 0.5, 50000)
         sell2 = create_order("SELL-2", OrderType.LIMIT, Side.SELL, 1.0, 50100)
@@ -247,16 +299,14 @@ class TestPriceTimePriority:
         
         # Should fill 0.5 at 50000, then 1.0 at 50100
         assert len(result.trades) == 2
-        assert result.trades[0].price == Decimal("50000")
-        assert result.trades[0].quantity == Decimal("0.5")
-        assert result.trades[1].price == Decimal("50100")
-        assert result.trades[1].quantity == Decimal("1.0")
+        assert result.trades[0].price == PRICES[50000]
+        assert result.trades[0].quantity == QUANTITIES[0.5]
+        assert result.trades[1].price == PRICES[50100]
+        assert result.trades[1].quantity == QUANTITIES[1.0]
         print("✓ Partial fill at better price before moving to next level")
     
-    def test_no_trade_through_across_spread(self):
+    def test_no_trade_through_across_spread(self, engine):
         """Test that orders don't trade through the spread."""
-        engine = MatchingEngine()
-        
         # Create spread: bid at 49900, ask at 50100
         buy = create_order("BUY-1", OrderType.LIMIT, Side.BUY, 1.0, 49900)
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50100)
@@ -279,10 +329,8 @@ class TestMarketOrders:
     - Executes immediately at best available price(s)
     """
     
-    def test_market_order_full_execution(self):
+    def test_market_order_full_execution(self, engine):
         """Test market order executes at best available prices."""
-        engine = MatchingEngine()
-        
         # Add liquidity
         sell1 = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50000)
         sell2 = create_order("SELL-2", OrderType.LIMIT, Side.SELL, 1.0, 50010)
@@ -296,14 +344,12 @@ class TestMarketOrders:
         
         assert result.status == "filled"
         assert len(result.trades) == 2
-        assert result.trades[0].price == Decimal("50000")
-        assert result.trades[1].price == Decimal("50010")
+        assert result.trades[0].price == PRICES[50000]
+        assert result.trades[1].price == PRICES[50010]
         print("✓ Market order executes at best available prices")
     
-    def test_market_order_partial_liquidity(self):
+    def test_market_order_partial_liquidity(self, engine):
         """Test market order with insufficient liquidity."""
-        engine = MatchingEngine()
-        
         # Limited liquidity
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50000)
         engine.process_order(sell)
@@ -313,20 +359,18 @@ class TestMarketOrders:
         result = engine.process_order(buy)
         
         assert len(result.trades) == 1
-        assert result.trades[0].quantity == Decimal("1.0")
-        assert result.remaining_quantity == Decimal("1.0")
+        assert result.trades[0].quantity == QUANTITIES[1.0]
+        assert result.remaining_quantity == QUANTITIES[1.0]
         print("✓ Market order handles partial liquidity correctly")
     
-    def test_market_order_no_liquidity(self):
+    def test_market_order_no_liquidity(self, engine):
         """Test market order with no liquidity."""
-        engine = MatchingEngine()
-        
         # No liquidity
         buy = create_order("BUY-1", OrderType.MARKET, Side.BUY, 1.0)
         result = engine.process_order(buy)
         
         assert len(result.trades) == 0
-        assert result.remaining_quantity == Decimal("1.0")
+        assert result.remaining_quantity == QUANTITIES[1.0]
         print("✓ Market order handles no liquidity correctly")
 
 
@@ -337,10 +381,8 @@ class TestLimitOrders:
     - Rests on book if not immediately marketable
     """
     
-    def test_limit_order_immediate_execution(self):
+    def test_limit_order_immediate_execution(self, engine):
         """Test limit order executes at specified price or better."""
-        engine = MatchingEngine()
-        
         # Add sell at 50000
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50000)
         engine.process_order(sell)
@@ -350,13 +392,11 @@ class TestLimitOrders:
         result = engine.process_order(buy)
         
         assert result.status == "filled"
-        assert result.trades[0].price == Decimal("50000")  # Better than limit
+        assert result.trades[0].price == PRICES[50000]  # Better than limit
         print("✓ Limit order executes at better price when available")
     
-    def test_limit_order_rests_on_book(self):
+    def test_limit_order_rests_on_book(self, engine):
         """Test limit order rests on book when not marketable."""
-        engine = MatchingEngine()
-        
         # Limit buy below market
         buy = create_order("BUY-1", OrderType.LIMIT, Side.BUY, 1.0, 49000)
         result = engine.process_order(buy)
@@ -369,10 +409,8 @@ class TestLimitOrders:
         assert order_book.has_order("BUY-1")
         print("✓ Limit order rests on book when not marketable")
     
-    def test_limit_order_partial_fill_rest(self):
+    def test_limit_order_partial_fill_rest(self, engine):
         """Test limit order partial fill with remainder resting."""
-        engine = MatchingEngine()
-        
         # Partial liquidity
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 0.5, 50000)
         engine.process_order(sell)
@@ -383,18 +421,16 @@ class TestLimitOrders:
         
         assert result.status == "partial"
         assert len(result.trades) == 1
-        assert result.trades[0].quantity == Decimal("0.5")
+        assert result.trades[0].quantity == QUANTITIES[0.5]
         
         # Verify remainder on book
         order_book = engine.order_books["BTC-USDT"]
         order = order_book.get_order("BUY-1")
-        assert order.remaining_quantity == Decimal("0.5")
+        assert order.remaining_lots == lots(0.5)
         print("✓ Limit order partial fill with remainder resting")
     
-    def test_limit_order_price_protection(self):
+    def test_limit_order_price_protection(self, engine):
         """Test limit order doesn't execute worse than limit price."""
-        engine = MatchingEngine()
-        
         # Add sell at 50200
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50200)
         engine.process_order(sell)
@@ -416,10 +452,8 @@ class TestIOCOrders:
     - Must not trade through BBO
     """
     
-    def test_ioc_full_execution(self):
+    def test_ioc_full_execution(self, engine):
         """Test IOC order full execution."""
-        engine = MatchingEngine()
-        
         # Add liquidity
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50000)
         engine.process_order(sell)
@@ -432,10 +466,8 @@ class TestIOCOrders:
         assert len(result.trades) == 1
         print("✓ IOC order full execution")
     
-    def test_ioc_partial_fill_cancel_remainder(self):
+    def test_ioc_partial_fill_cancel_remainder(self, engine):
         """Test IOC order partial fill with remainder cancelled."""
-        engine = MatchingEngine()
-        
         # Partial liquidity
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 0.5, 50000)
         engine.process_order(sell)
@@ -445,30 +477,26 @@ class TestIOCOrders:
         result = engine.process_order(buy)
         
         assert len(result.trades) == 1
-        assert result.trades[0].quantity == Decimal("0.5")
-        assert result.remaining_quantity == Decimal("0.5")
+        assert result.trades[0].quantity == QUANTITIES[0.5]
+        assert result.remaining_quantity == QUANTITIES[0.5]
         
         # Verify NOT on book
         order_book = engine.order_books["BTC-USDT"]
         assert not order_book.has_order("BUY-1")
         print("✓ IOC order partial fill with remainder cancelled")
     
-    def test_ioc_no_match_cancelled(self):
+    def test_ioc_no_match_cancelled(self, engine):
         """Test IOC order cancelled when no match."""
-        engine = MatchingEngine()
-        
         # No liquidity
         buy = create_order("BUY-1", OrderType.IOC, Side.BUY, 1.0, 50000)
         result = engine.process_order(buy)
         
         assert len(result.trades) == 0
-        assert result.remaining_quantity == Decimal("1.0")
+        assert result.remaining_quantity == QUANTITIES[1.0]
         print("✓ IOC order cancelled when no match")
     
-    def test_ioc_no_trade_through(self):
+    def test_ioc_no_trade_through(self, engine):
         """Test IOC order doesn't trade through BBO."""
-        engine = MatchingEngine()
-        
         # Add sell at 50200
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50200)
         engine.process_order(sell)
@@ -488,10 +516,8 @@ class TestFOKOrders:
     - Must not trade through BBO
     """
     
-    def test_fok_full_execution(self):
+    def test_fok_full_execution(self, engine):
         """Test FOK order full execution when sufficient liquidity."""
-        engine = MatchingEngine()
-        
         # Add sufficient liquidity
         sell1 = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 0.5, 50000)
         sell2 = create_order("SELL-2", OrderType.LIMIT, Side.SELL, 0.5, 50010)
@@ -505,13 +531,11 @@ class TestFOKOrders:
         
         assert result.status == "filled"
         assert len(result.trades) == 2
-        assert buy.remaining_quantity == Decimal("0")
+        assert buy.remaining_lots == 0
         print("✓ FOK order full execution with sufficient liquidity")
     
-    def test_fok_cancelled_insufficient_liquidity(self):
+    def test_fok_cancelled_insufficient_liquidity(self, engine):
         """Test FOK order cancelled when insufficient liquidity."""
-        engine = MatchingEngine()
-        
         # Insufficient liquidity
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 0.5, 50000)
         engine.process_order(sell)
@@ -522,18 +546,16 @@ class TestFOKOrders:
         
         assert result.status == "cancelled"
         assert len(result.trades) == 0
-        assert result.remaining_quantity == Decimal("1.0")
+        assert result.remaining_quantity == QUANTITIES[1.0]
         
         # Verify sell order still on book (not partially filled)
         order_book = engine.order_books["BTC-USDT"]
         sell_order = order_book.get_order("SELL-1")
-        assert sell_order.remaining_quantity == Decimal("0.5")
+        assert sell_order.remaining_lots == lots(0.5)
         print("✓ FOK order cancelled with insufficient liquidity (atomic)")
     
-    def test_fok_no_trade_through(self):
+    def test_fok_no_trade_through(self, engine):
         """Test FOK order doesn't trade through BBO."""
-        engine = MatchingEngine()
-        
         # Add liquidity at worse price
         sell = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 1.0, 50200)
         engine.process_order(sell)
@@ -546,10 +568,8 @@ class TestFOKOrders:
         assert len(result.trades) == 0
         print("✓ FOK order doesn't trade through BBO")
     
-    def test_fok_atomic_execution(self):
+    def test_fok_atomic_execution(self, engine):
         """Test FOK order is truly atomic (all or nothing)."""
-        engine = MatchingEngine()
-        
         # Add liquidity across multiple price levels
         sell1 = create_order("SELL-1", OrderType.LIMIT, Side.SELL, 0.3, 50000)
         sell2 = create_order("SELL-2", OrderType.LIMIT, Side.SELL, 0.3, 50010)
@@ -569,53 +589,7 @@ class TestFOKOrders:
         
         # Verify all sell orders still intact
         order_book = engine.order_books["BTC-USDT"]
-        assert order_book.get_order("SELL-1").remaining_quantity == Decimal("0.3")
-        assert order_book.get_order("SELL-2").remaining_quantity == Decimal("0.3")
-        assert order_book.get_order("SELL-3").remaining_quantity == Decimal("0.3")
+        assert order_book.get_order("SELL-1").remaining_lots == lots(0.3)
+        assert order_book.get_order("SELL-2").remaining_lots == lots(0.3)
+        assert order_book.get_order("SELL-3").remaining_lots == lots(0.3)
         print("✓ FOK order is truly atomic (all-or-nothing)")
-
-
-def run_all_compliance_tests():
-    """Run all REG NMS compliance tests."""
-    print("\n" + "="*70)
-    print("REG NMS COMPLIANCE TEST SUITE")
-    print("="*70)
-    
-    test_classes = [
-        TestBBOCalculationAndDissemination,
-        TestPriceTimePriority,
-        TestMarketOrders,
-        TestLimitOrders,
-        TestIOCOrders,
-        TestFOKOrders
-    ]
-    
-    total_tests = 0
-    passed_tests = 0
-    
-    for test_class in test_classes:
-        print(f"\n{test_class.__doc__}")
-        print("-" * 70)
-        
-        instance = test_class()
-        test_methods = [m for m in dir(instance) if m.startswith('test_')]
-        
-        for method_name in test_methods:
-            total_tests += 1
-            try:
-                method = getattr(instance, method_name)
-                method()
-                passed_tests += 1
-            except Exception as e:
-                print(f"✗ {method_name} FAILED: {e}")
-    
-    print("\n" + "="*70)
-    print(f"RESULTS: {passed_tests}/{total_tests} tests passed")
-    print("="*70)
-    
-    return passed_tests == total_tests
-
-
-if __name__ == "__main__":
-    success = run_all_compliance_tests()
-    exit(0 if success else 1)
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models.functions import Substr
 from .models import User, Place, Review
 
 
@@ -36,7 +37,7 @@ class PlaceAdmin(admin.ModelAdmin):
     list_display = ['name', 'address_short', 'average_rating', 'created_at']
     list_filter = ['average_rating', 'created_at']
     search_fields = ['name', 'address']
-    readonly_fields = ['average_rating', 'created_at', 'updated_at']
+    readonly_fields = ['average_rating', 'review_count', 'rating_total', 'created_at', 'updated_at']
     ordering = ['-created_at']
     
     def address_short(self, obj):
@@ -56,7 +57,14 @@ class ReviewAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at']
     ordering = ['-created_at']
     
+    def get_queryset(self, request):
+        # fetch a 51-char preview for the list column instead of the full text
+        return super().get_queryset(request).annotate(
+            text_preview=Substr('text', 1, 51)
+        ).defer('text')
+    
     def text_short(self, obj):
         """Display shortened review text in list view."""
-        return obj.text[:50] + '...' if len(obj.text) > 50 else obj.text
+        preview = obj.text_preview
+        return preview[:50] + '...' if len(preview) > 50 else preview
     text_short.short_description = 'Review Text'
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = 'api'
+    
+    def ready(self):
+        from api import signals  # noqa: F401
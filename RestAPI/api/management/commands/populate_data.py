@@ -1,9 +1,14 @@
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from faker import Faker
 import random
 from api.models import User, Place, Review
 
 
+BATCH_SIZE = 500
+
+
 class Command(BaseCommand):
     help = 'Populate database with sample data'
     
@@ -23,43 +28,47 @@ class Command(BaseCommand):
             User.objects.filter(is_superuser=False).delete()
         
         self.stdout.write(f"Creating {options['users']} users...")
-        users = []
-        for i in range(options['users']):
-            try:
-                user = User.objects.create_user(
-                    phone_number=f"+1{fake.unique.numerify('##########')}",
-                    name=fake.name(),
-                    password='password123'
-                )
-                users.append(user)
-            except:
-                pass
+        # every sample user shares one password, so hash it once
+        password = make_password('password123')
+        phones = [f"+1{fake.unique.numerify('##########')}" for i in range(options['users'])]
+        with transaction.atomic():
+            # numbers already taken are skipped; re-read to get the saved rows
+            User.objects.bulk_create(
+                [User(phone_number=phone, name=fake.name(), password=password) for phone in phones],
+                batch_size=BATCH_SIZE,
+                ignore_conflicts=True
+            )
+            users = list(User.objects.filter(phone_number__in=phones))
         
         self.stdout.write(f"Creating {options['places']} places...")
-        places = []
         types = ['Restaurant', 'Cafe', 'Shop', 'Doctor', 'Salon', 'Gym', 'Pharmacy']
+        new_places = {}
         for i in range(options['places']):
-            try:
-                place = Place.objects.create(
-                    name=f"{fake.company()} {random.choice(types)}",
-                    address=fake.address()
-                )
-                places.append(place)
-            except:
-                pass
+            name, address = f"{fake.company()} {random.choice(types)}", fake.address()
+            new_places.setdefault((name.lower(), address.lower()), Place(name=name, address=address))
+        with transaction.atomic():
+            # duplicates of existing places are skipped; re-read to get the saved rows
+            Place.objects.bulk_create(new_places.values(), batch_size=BATCH_SIZE, ignore_conflicts=True)
+            places = [
+                place for place in Place.objects.filter(name__in={p.name for p in new_places.values()})
+                if (place.name.lower(), place.address.lower()) in new_places
+            ]
         
         self.stdout.write(f"Creating {options['reviews']} reviews...")
-        count = 0
-        for i in range(options['reviews']):
-            try:
-                Review.objects.create(
-                    user=random.choice(users),
-                    place=random.choice(places),
-                    rating=random.randint(1, 5),
-                    text=fake.paragraph()
-                )
-                count += 1
-            except:
-                pass
+        reviews = []
+        if users and places:
+            review_users = random.choices(users, k=options['reviews'])
+            review_places = random.choices(places, k=options['reviews'])
+            with transaction.atomic():
+                reviews = Review.objects.bulk_create_and_update_ratings([
+                    Review(
+                        user=user,
+                        place=place,
+                        rating=random.randint(1, 5),
+                        text=fake.paragraph()
+                    )
+                    for user, place in zip(review_users, review_places)
+                ], batch_size=BATCH_SIZE)
+        count = len(reviews)
         
         self.stdout.write(self.style.SUCCESS(f'Done! Created {len(users)} users, {len(places)} places, {count} reviews'))
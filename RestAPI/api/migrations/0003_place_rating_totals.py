@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_totals(apps, schema_editor):
+    Place = apps.get_model('api', 'Place')
+    places = Place.objects.annotate(n=Count('reviews'), total=Sum('reviews__rating'))
+    for place in places.iterator():
+        place.review_count = place.n
+        place.rating_total = place.total or 0
+        place.save(update_fields=['review_count', 'rating_total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_place_review'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='rating_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_totals, migrations.RunPython.noop),
+    ]
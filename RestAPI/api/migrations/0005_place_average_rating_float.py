@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_review_place_rating_cov'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='place',
+            name='average_rating',
+            field=models.FloatField(db_index=True, default=0.0),
+        ),
+    ]
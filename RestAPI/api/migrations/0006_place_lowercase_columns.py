@@ -0,0 +1,34 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_place_average_rating_float'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='place',
+            name='unique_place_name_address',
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='name_lower',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('name'), output_field=models.CharField(max_length=255)),
+        ),
+        migrations.AddField(
+            model_name='place',
+            name='address_lower',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('address'), output_field=models.TextField()),
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['name_lower'], name='places_name_lower_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='place',
+            constraint=models.UniqueConstraint(fields=('name_lower', 'address_lower'), name='unique_place_name_address'),
+        ),
+    ]
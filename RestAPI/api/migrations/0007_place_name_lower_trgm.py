@@ -0,0 +1,18 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_place_lowercase_columns'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='place',
+            index=GinIndex(fields=['name_lower'], name='places_name_lower_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_place_name_lower_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(fields=['-created_at', '-id'], name='places_created_id_idx'),
+        ),
+    ]
@@ -1,8 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models import Avg
-from django.db.models.functions import Lower
+from django.db.models import Avg, Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, Lower
 
 
 class UserManager(BaseUserManager):
@@ -53,7 +54,16 @@ class User(AbstractUser):
 class Place(models.Model):
     name = models.CharField(max_length=255)
     address = models.TextField()
-    average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.00, db_index=True)
+    # stored lowercase copies, so case-insensitive lookups hit plain indexes
+    name_lower = models.GeneratedField(
+        expression=Lower('name'), output_field=models.CharField(max_length=255), db_persist=True
+    )
+    address_lower = models.GeneratedField(
+        expression=Lower('address'), output_field=models.TextField(), db_persist=True
+    )
+    average_rating = models.FloatField(default=0.0, db_index=True)
+    review_count = models.PositiveIntegerField(default=0)
+    rating_total = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -61,21 +71,64 @@ class Place(models.Model):
         db_table = 'places'
         indexes = [
             models.Index(fields=['name']),
+            models.Index(fields=['name_lower'], name='places_name_lower_idx'),
+            # trigram index so substring search (LIKE '%term%') avoids a seq scan
+            GinIndex(fields=['name_lower'], opclasses=['gin_trgm_ops'], name='places_name_lower_trgm'),
             models.Index(fields=['average_rating']),
+            models.Index(fields=['-created_at', '-id'], name='places_created_id_idx'),
         ]
         constraints = [
-            models.UniqueConstraint(Lower('name'), Lower('address'), name='unique_place_name_address')
+            models.UniqueConstraint(fields=['name_lower', 'address_lower'], name='unique_place_name_address')
         ]
     
-    def update_average_rating(self):
-        avg = self.reviews.aggregate(Avg('rating'))['rating__avg']
-        self.average_rating = round(avg, 2) if avg else 0.00
-        self.save(update_fields=['average_rating'])
+    def add_rating(self, rating):
+        # in-memory only; the stored row is updated by api.tasks.recount_rating
+        self.review_count += 1
+        self.rating_total += rating
+        self.average_rating = self.rating_total / self.review_count
+    
+    @staticmethod
+    def rating_recount():
+        """UPDATE values that recount the rating fields from the reviews table."""
+        # correlated subqueries, so the recount is one atomic statement
+        # rather than a read followed by a write of stale absolute values
+        reviews = Review.objects.filter(place=OuterRef('pk')).order_by().values('place')
+        return {
+            'review_count': Coalesce(Subquery(reviews.annotate(c=Count('pk')).values('c')), 0),
+            'rating_total': Coalesce(Subquery(reviews.annotate(t=Sum('rating')).values('t')), 0),
+            'average_rating': Coalesce(Subquery(reviews.annotate(a=Avg('rating')).values('a')), 0.0),
+        }
     
     def __str__(self):
         return f"{self.name} - {self.address[:50]}"
 
 
+class ReviewManager(models.Manager):
+    def bulk_create_and_update_ratings(self, reviews, batch_size=None):
+        # bulk_create skips post_save, so the affected places are recounted
+        # on the rating queue, in order with the per-review updates
+        from api.tasks import enqueue, recount_rating
+        
+        reviews = self.bulk_create(reviews, batch_size=batch_size)
+        place_ids = {review.place_id for review in reviews}
+        enqueue(recount_rating, *place_ids)
+        
+        # one grouped aggregate so already-loaded places reflect the new reviews
+        stats = {
+            row['place_id']: row
+            for row in self.filter(place_id__in=place_ids).values('place_id').annotate(
+                count=Count('rating'), total=Sum('rating')
+            )
+        }
+        for review in reviews:
+            if Review.place.is_cached(review):
+                row = stats[review.place_id]
+                review.place.review_count = row['count']
+                review.place.rating_total = row['total']
+                review.place.average_rating = row['total'] / row['count']
+        return reviews
+
+
 class Review(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reviews')
     place = models.ForeignKey(Place, on_delete=models.CASCADE, related_name='reviews')
@@ -83,17 +136,17 @@ class Review(models.Model):
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = ReviewManager()
+    
     class Meta:
         db_table = 'reviews'
         indexes = [
             models.Index(fields=['place', '-created_at']),
             models.Index(fields=['user', '-created_at']),
+            # covering index so rating recounts are index-only scans (Postgres)
+            models.Index(fields=['place'], include=['rating'], name='review_place_rating_cov'),
         ]
         ordering = ['-created_at']
     
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        self.place.update_average_rating()
-    
     def __str__(self):
         return f"{self.user.name} - {self.place.name} ({self.rating}★)"
@@ -0,0 +1,32 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# DRF's encoder covers the types orjson doesn't know, e.g. Decimal and lazy strings
+_fallback = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson instead of the stdlib json module.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_fallback, option=orjson.OPT_NAIVE_UTC)
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser that decodes request bodies with orjson.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
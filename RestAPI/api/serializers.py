@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.db.models import Case, IntegerField, When
 from api.models import User, Place, Review
 
 
@@ -57,7 +58,15 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'date_joined']
 
 
+class RatingField(serializers.FloatField):
+    # ratings are stored unrounded; round to 2 places only when rendering
+    def to_representation(self, value):
+        return round(float(value), 2)
+
+
 class PlaceSerializer(serializers.ModelSerializer):
+    average_rating = RatingField(read_only=True)
+    
     class Meta:
         model = Place
         fields = ['id', 'name', 'address', 'average_rating', 'created_at']
@@ -98,6 +107,8 @@ class ReviewSerializer(serializers.ModelSerializer):
 
 
 class PlaceSearchSerializer(serializers.ModelSerializer):
+    average_rating = RatingField(read_only=True)
+    
     class Meta:
         model = Place
         fields = ['id', 'name', 'address', 'average_rating']
@@ -114,25 +125,40 @@ class ReviewDetailSerializer(serializers.ModelSerializer):
 
 
 class PlaceDetailSerializer(serializers.ModelSerializer):
+    average_rating = RatingField(read_only=True)
     reviews = serializers.SerializerMethodField()
     
+    # reviews are returned inline one page at a time (?reviews_page=N)
+    reviews_page_size = 20
+    
     class Meta:
         model = Place
-        fields = ['id', 'name', 'address', 'average_rating', 'reviews']
-        read_only_fields = ['id', 'average_rating']
+        fields = ['id', 'name', 'address', 'average_rating', 'review_count', 'reviews']
+        read_only_fields = ['id', 'average_rating', 'review_count']
     
     def get_reviews(self, obj):
         req = self.context.get('request')
         user = req.user if req else None
         
-        all_reviews = obj.reviews.select_related('user').all()
+        # only the columns ReviewDetailSerializer renders
+        reviews = obj.reviews.select_related('user').only(
+            'id', 'place_id', 'rating', 'text', 'created_at', 'user__name'
+        )
         
         if user and user.is_authenticated:
-            my_reviews = [r for r in all_reviews if r.user == user]
-            other_reviews = [r for r in all_reviews if r.user != user]
-            other_reviews = sorted(other_reviews, key=lambda r: r.created_at, reverse=True)
-            sorted_reviews = my_reviews + other_reviews
+            # user's own reviews first, then newest first; sorted in SQL
+            reviews = reviews.annotate(
+                is_mine=Case(When(user=user, then=0), default=1, output_field=IntegerField())
+            ).order_by('is_mine', '-created_at')
         else:
-            sorted_reviews = sorted(all_reviews, key=lambda r: r.created_at, reverse=True)
+            reviews = reviews.order_by('-created_at')
+        
+        page = 1
+        if req:
+            try:
+                page = max(int(req.query_params.get('reviews_page', 1)), 1)
+            except ValueError:
+                pass
+        start = (page - 1) * self.reviews_page_size
         
-        return ReviewDetailSerializer(sorted_reviews, many=True).data
+        return ReviewDetailSerializer(reviews[start:start + self.reviews_page_size], many=True).data
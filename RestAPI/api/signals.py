@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.models import Review
+from api.tasks import enqueue, recount_rating
+
+
+@receiver(post_save, sender=Review)
+def update_place_rating(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        # keeps the place returned in the response current; the stored
+        # row is recounted after commit
+        instance.place.add_rating(instance.rating)
+    enqueue(recount_rating, instance.place_id)
+
+
+@receiver(post_delete, sender=Review)
+def remove_place_rating(sender, instance, **kwargs):
+    # post_delete is sent even when the DELETE matched no row (the same
+    # review deleted twice), so recount rather than decrement
+    enqueue(recount_rating, instance.place_id)
@@ -0,0 +1,47 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from api.models import Place
+
+
+logger = logging.getLogger(__name__)
+
+# place-rating updates run here so review POSTs return once the INSERT commits
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='place-rating')
+
+
+def recount_rating(*place_ids):
+    # every rating update is this absolute recount, so updates from any
+    # number of processes can run in any order, or twice, and still agree
+    with transaction.atomic():
+        # lock the places first: a review INSERT holds a key-share lock on
+        # its place until it commits, so the UPDATE below, which takes its
+        # snapshot after the lock, sees every review written before it
+        list(Place.objects.select_for_update().filter(pk__in=place_ids).order_by('pk').values_list('pk'))
+        Place.objects.filter(pk__in=place_ids).update(**Place.rating_recount())
+
+
+def _run(task, *args):
+    # drop the worker's connection only if it is broken or past CONN_MAX_AGE
+    close_old_connections()
+    try:
+        task(*args)
+    except Exception:
+        logger.exception('Place-rating update %s%r failed', task.__name__, args)
+    finally:
+        close_old_connections()
+
+
+def enqueue(task, *args):
+    """Run task(*args) after the current transaction commits.
+    
+    Runs on a background worker unless RATING_UPDATES_EAGER is set, in
+    which case it runs inline (handy for tests and scripts).
+    """
+    if settings.RATING_UPDATES_EAGER:
+        transaction.on_commit(lambda: task(*args))
+    else:
+        transaction.on_commit(lambda: _executor.submit(_run, task, *args))
@@ -1,13 +1,14 @@
 from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.db.models.functions import Lower
+from django.db import transaction
+from django.db.models import Case, IntegerField, When
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 from api.serializers import *
-from api.models import Place
+from api.models import Place, Review
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -16,6 +17,14 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class PlaceCursorPagination(CursorPagination):
+    # seeks on the (created_at, id) index instead of OFFSET, so deep pages stay cheap
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+
 class RegisterView(generics.CreateAPIView):
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny]
@@ -55,30 +64,45 @@ class ReviewCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated]
     
     def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
+        # a list body creates all its reviews in one batch
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
         serializer.is_valid(raise_exception=True)
         
-        place_name = serializer.validated_data.pop('place_name')
-        place_address = serializer.validated_data.pop('place_address')
-        
-        # find or create place
-        place = Place.objects.annotate(
-            lower_name=Lower('name'),
-            lower_address=Lower('address')
-        ).filter(
-            lower_name=place_name.lower(),
-            lower_address=place_address.lower()
-        ).first()
-        
-        if not place:
-            place = Place.objects.create(name=place_name, address=place_address)
+        if not many:
+            place = self.get_place(
+                serializer.validated_data.pop('place_name'),
+                serializer.validated_data.pop('place_address')
+            )
+            review = serializer.save(user=request.user, place=place)
+            
+            return Response(
+                ReviewSerializer(review).data,
+                status=status.HTTP_201_CREATED
+            )
         
-        review = serializer.save(user=request.user, place=place)
+        with transaction.atomic():
+            reviews = []
+            for data in serializer.validated_data:
+                place = self.get_place(data.pop('place_name'), data.pop('place_address'))
+                reviews.append(Review(user=request.user, place=place, **data))
+            reviews = Review.objects.bulk_create_and_update_ratings(reviews)
         
         return Response(
-            ReviewSerializer(review).data,
+            ReviewSerializer(reviews, many=True).data,
             status=status.HTTP_201_CREATED
         )
+    
+    def get_place(self, place_name, place_address):
+        # find or create place; the unique (name_lower, address_lower)
+        # constraint settles concurrent creates, and get_or_create re-reads
+        # the winner instead of failing
+        place, _ = Place.objects.get_or_create(
+            name_lower__exact=place_name.lower(),
+            address_lower__exact=place_address.lower(),
+            defaults={'name': place_name, 'address': place_address}
+        )
+        return place
 
 
 class PlaceSearchView(generics.ListAPIView):
@@ -86,6 +110,17 @@ class PlaceSearchView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
     
+    @property
+    def paginator(self):
+        # name searches are ranked by match, so they keep page numbers;
+        # the plain listing uses a cursor, newest first
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('name'):
+                self._paginator = self.pagination_class()
+            else:
+                self._paginator = PlaceCursorPagination()
+        return self._paginator
+    
     def get_queryset(self):
         qs = Place.objects.all()
         name = self.request.query_params.get('name')
@@ -100,26 +135,22 @@ class PlaceSearchView(generics.ListAPIView):
         if name:
             term = name.strip().lower()
             
-            exact = qs.annotate(lower_name=Lower('name')).filter(lower_name=term)
-            partial = qs.annotate(lower_name=Lower('name')).filter(
-                lower_name__icontains=term
-            ).exclude(lower_name=term)
-            
-            combined = exact.union(partial)
-            ids = [p.id for p in combined]
-            qs = Place.objects.filter(id__in=ids)
-            
-            # sort exact first
-            qs = sorted(qs, key=lambda p: (p.name.lower() != term, p.name.lower()))
-            return qs
+            # one query, exact matches first; stays lazy so pagination applies LIMIT/OFFSET
+            return qs.filter(
+                name_lower__contains=term
+            ).annotate(
+                match_rank=Case(When(name_lower=term, then=0), default=1, output_field=IntegerField())
+            ).order_by('match_rank', 'name_lower')
         
-        return qs.order_by('name')
+        # ordered by PlaceCursorPagination
+        return qs
 
 
 class PlaceDetailView(generics.RetrieveAPIView):
     serializer_class = PlaceDetailSerializer
     permission_classes = [IsAuthenticated]
-    queryset = Place.objects.prefetch_related('reviews__user').all()
+    # reviews are fetched a page at a time by the serializer, not prefetched
+    queryset = Place.objects.all()
     
     def get_serializer_context(self):
         ctx = super().get_serializer_context()
@@ -1,29 +1,71 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional
 import os
+import numpy as np
 from dotenv import load_dotenv
 
+from services import forecast_windows
+from utils import DataFetcher
+
 # Load environment variables
 load_dotenv()
 
+# Shared fetcher: one pooled HTTP client for the life of the service
+data_fetcher = DataFetcher()
+
+# Days of price history the LSTM model reads per forecast
+LSTM_LOOKBACK = int(os.getenv("LSTM_LOOKBACK", 60))
+
+# Most tokens run through the model in one batch
+LSTM_MAX_BATCH = int(os.getenv("LSTM_MAX_BATCH", 32))
+
+# Request limits: each forecast day is one model call made while holding
+# the inference thread, and each token is one upstream price fetch
+FORECAST_MAX_DAYS = int(os.getenv("FORECAST_MAX_DAYS", 365))
+FORECAST_MAX_TOKENS = int(os.getenv("FORECAST_MAX_TOKENS", 50))
+
+# Model input buffer reused across requests; the lock keeps two forecasts
+# from filling it at the same time
+_input_buf = np.zeros((LSTM_MAX_BATCH, LSTM_LOOKBACK, 1), dtype=np.float32)
+_input_lock = asyncio.Lock()
+
+# Model calls block for a while, so they run here instead of on the event
+# loop. One thread: the model and input buffer are shared, and TensorFlow
+# already spreads each call across cores with its own intra-op threads
+_inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lstm-inference")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await data_fetcher.aclose()
+    _inference_executor.shutdown(wait=False)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Crypto Portfolio AI Service",
     description="AI-powered analytics for cryptocurrency portfolios",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS configuration
+# CORS configuration: explicit lists, so no wildcard handling per request
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure based on your needs
+    allow_origins=os.getenv("FRONTEND_ORIGIN", "http://localhost:5173").split(","),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
 )
 
+# Compress large responses only; small ones like /health go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Request/Response Models
 class TokenData(BaseModel):
     symbol: str
@@ -38,8 +80,10 @@ class PortfolioData(BaseModel):
     tokens: List[TokenData]
 
 class ForecastRequest(BaseModel):
-    tokens: List[str]
-    forecastDays: List[int] = [7, 30]
+    tokens: List[str] = Field(min_length=1, max_length=FORECAST_MAX_TOKENS)
+    forecastDays: List[Annotated[int, Field(ge=1, le=FORECAST_MAX_DAYS)]] = Field(
+        default=[7, 30], min_length=1, max_length=FORECAST_MAX_DAYS
+    )
 
 class DiversificationRequest(BaseModel):
     walletAddress: str
@@ -72,19 +116,56 @@ async def root():
         }
     }
 
-# Placeholder endpoints (to be implemented)
 @app.post("/api/forecast-prices")
 async def forecast_prices(request: ForecastRequest):
     """
     Generate price forecasts using LSTM model
     """
-    # TODO: Implement LSTM price forecasting
+    horizon = max(request.forecastDays)
+    
+    # fetch every token's history concurrently
+    histories = await data_fetcher.fetch_historical_prices_many(request.tokens, days=LSTM_LOOKBACK)
+    
+    tokens, windows, ranges, failed = [], [], [], []
+    for token, history in histories.items():
+        if len(history.prices) < LSTM_LOOKBACK:
+            failed.append(token)
+            continue
+        window, low, high = data_fetcher.normalize_with_range(history.prices[-LSTM_LOOKBACK:])
+        tokens.append(token)
+        windows.append(window)
+        ranges.append((low, high))
+    
+    forecasts = {}
+    if tokens:
+        loop = asyncio.get_running_loop()
+        results = []
+        async with _input_lock:
+            for start in range(0, len(windows), LSTM_MAX_BATCH):
+                # fill the (tokens, lookback, 1) batch in place
+                chunk = windows[start:start + LSTM_MAX_BATCH]
+                batch = _input_buf[:len(chunk)]
+                for row, window in zip(batch, chunk):
+                    row[:, 0] = window
+                
+                result = await loop.run_in_executor(_inference_executor, forecast_windows, batch, horizon)
+                if result is None:
+                    raise HTTPException(status_code=503, detail="LSTM model not available")
+                results.append(result)
+        normalized = np.concatenate(results)
+        
+        for token, series, (low, high) in zip(tokens, normalized, ranges):
+            prices = data_fetcher.denormalize_data(series, low, high)
+            forecasts[token] = {str(days): float(prices[days - 1]) for days in request.forecastDays}
+    
     return {
-        "message": "Price forecasting endpoint - to be implemented",
-        "tokens": request.tokens,
+        "forecasts": forecasts,
+        "failed": failed,
         "forecastDays": request.forecastDays
     }
 
+# Placeholder endpoints (to be implemented)
+
 @app.post("/api/analyze-diversification")
 async def analyze_diversification(request: DiversificationRequest):
     """
@@ -112,4 +193,13 @@ async def analyze_risk(request: RiskAnalysisRequest):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop event loop and C HTTP parser; no per-request access log
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", 2)),
+        access_log=False
+    )
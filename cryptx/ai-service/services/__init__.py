@@ -0,0 +1,3 @@
+from .lstm_forecast import forecast_windows
+
+__all__ = ['forecast_windows']
@@ -0,0 +1,37 @@
+import numpy as np
+from typing import Optional
+
+from utils.model_loader import model_loader
+
+
+def forecast_windows(windows: np.ndarray, horizon: int) -> Optional[np.ndarray]:
+    """
+    Roll the LSTM forward over a batch of normalized price windows
+    
+    Every token advances together, so each step is one batched model call
+    rather than one call per token. A float32 input is rolled forward in
+    place, so callers can pass a reused buffer without a copy being made.
+    
+    Args:
+        windows: Normalized prices shaped (tokens, lookback, 1); overwritten
+        horizon: Number of days to forecast
+    
+    Returns:
+        Normalized forecasts shaped (tokens, horizon), or None if no model is available
+    """
+    window = np.asarray(windows, dtype=np.float32)
+    forecasts = np.empty((window.shape[0], horizon), dtype=np.float32)
+    
+    for step in range(horizon):
+        prediction = model_loader.predict_lstm(window)
+        if prediction is None:
+            return None
+        
+        next_prices = prediction.reshape(window.shape[0], -1)[:, 0]
+        forecasts[:, step] = next_prices
+        
+        # slide the window forward by one day
+        window[:, :-1] = window[:, 1:]
+        window[:, -1, 0] = next_prices
+    
+    return forecasts
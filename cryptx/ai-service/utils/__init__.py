@@ -1,3 +1,3 @@
-from .data_fetcher import DataFetcher
+from .data_fetcher import DataFetcher, PriceSeries
 
-__all__ = ['DataFetcher']
+__all__ = ['DataFetcher', 'PriceSeries']
@@ -1,21 +1,68 @@
+import asyncio
+import collections
 import httpx
+import numpy as np
+import orjson
 import os
-from typing import List, Dict, Optional
+from cachetools import TTLCache
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from datetime import datetime, timedelta
 
+# Historical prices as parallel arrays: datetime64[ms] timestamps, float32 prices
+PriceSeries = collections.namedtuple('PriceSeries', 'timestamps prices')
+
+def _empty_series() -> PriceSeries:
+    return PriceSeries(np.empty(0, dtype='datetime64[ms]'), np.empty(0, dtype=np.float32))
+
+def _read_only(series: PriceSeries) -> PriceSeries:
+    # cached series are shared between callers, so they must not be mutated
+    series.timestamps.setflags(write=False)
+    series.prices.setflags(write=False)
+    return series
+
 class DataFetcher:
     """Utility class for fetching historical cryptocurrency data"""
     
     def __init__(self):
         self.base_url = os.getenv("DATA_SOURCE_URL", "https://api.coingecko.com/api/v3")
         self.api_key = os.getenv("COINGECKO_API_KEY", "")
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # daily history only changes once a day: serve repeats from memory,
+        # and keep ETags longer so expired entries can be revalidated
+        ttl = int(os.getenv("CACHE_TTL", 6 * 3600))
+        self._cache = TTLCache(maxsize=1024, ttl=ttl)
+        self._etags = TTLCache(maxsize=1024, ttl=ttl * 4)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client, created on first use so connections are reused"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                timeout=httpx.Timeout(30.0)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     async def fetch_historical_prices(
         self, 
         token_id: str, 
         days: int = 365,
         currency: str = "usd"
-    ) -> List[Dict]:
+    ) -> PriceSeries:
         """
         Fetch historical price data for a token
         
@@ -25,38 +72,81 @@ class DataFetcher:
             currency: Currency for prices (default: 'usd')
         
         Returns:
-            List of price data points
+            PriceSeries of read-only timestamp and price arrays (empty on error)
         """
+        key = (token_id, days, currency)
+        # single get(): an entry can expire between a membership test and a read
+        series = self._cache.get(key)
+        if series is not None:
+            return series
+        
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/coins/{token_id}/market_chart"
-                params = {
-                    "vs_currency": currency,
-                    "days": days,
-                    "interval": "daily"
-                }
-                
-                if self.api_key:
-                    params["x_cg_pro_api_key"] = self.api_key
-                
-                response = await client.get(url, params=params, timeout=30.0)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Format data
-                prices = []
-                for timestamp, price in data.get("prices", []):
-                    prices.append({
-                        "timestamp": datetime.fromtimestamp(timestamp / 1000),
-                        "price": price
-                    })
-                
-                return prices
-                
+            url = f"{self.base_url}/coins/{token_id}/market_chart"
+            params = {
+                "vs_currency": currency,
+                "days": days,
+                "interval": "daily"
+            }
+            
+            if self.api_key:
+                params["x_cg_pro_api_key"] = self.api_key
+            
+            # held locally so a 304 can still be served if the entry
+            # expires while the request is in flight
+            validator = self._etags.get(key)
+            headers = {}
+            if validator is not None:
+                headers["If-None-Match"] = validator[0]
+            
+            response = await self.client.get(url, params=params, headers=headers)
+            if response.status_code == 304 and validator is not None:
+                # unchanged upstream: reuse the series we already have
+                series = validator[1]
+                self._cache[key] = series
+                return series
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            
+            # [[timestamp_ms, price], ...] -> two columns
+            points = np.asarray(data.get("prices", []), dtype=np.float64).reshape(-1, 2)
+            series = _read_only(PriceSeries(
+                points[:, 0].astype('datetime64[ms]'),
+                points[:, 1].astype(np.float32)
+            ))
+            
+            self._cache[key] = series
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etags[key] = (etag, series)
+            return series
+            
         except Exception as e:
             print(f"Error fetching historical prices for {token_id}: {e}")
-            return []
+            return _empty_series()
+    
+    async def fetch_historical_prices_many(
+        self,
+        token_ids: List[str],
+        days: int = 365,
+        currency: str = "usd"
+    ) -> Dict[str, PriceSeries]:
+        """
+        Fetch historical price data for several tokens concurrently
+        
+        Args:
+            token_ids: List of CoinGecko token IDs
+            days: Number of days of historical data
+            currency: Currency for prices (default: 'usd')
+        
+        Returns:
+            Dictionary mapping token_id to its PriceSeries
+        """
+        results = await asyncio.gather(*(
+            self.fetch_historical_prices(token_id, days=days, currency=currency)
+            for token_id in token_ids
+        ))
+        return dict(zip(token_ids, results))
     
     async def fetch_current_price(
         self, 
@@ -74,73 +164,91 @@ class DataFetcher:
             Dictionary mapping token_id to current price
         """
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/simple/price"
-                params = {
-                    "ids": ",".join(token_ids),
-                    "vs_currencies": currency,
-                    "include_24hr_change": "true",
-                    "include_market_cap": "true"
-                }
-                
-                if self.api_key:
-                    params["x_cg_pro_api_key"] = self.api_key
-                
-                response = await client.get(url, params=params, timeout=30.0)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Extract prices
-                prices = {}
-                for token_id, token_data in data.items():
-                    prices[token_id] = token_data.get(currency, 0)
-                
-                return prices
-                
+            url = f"{self.base_url}/simple/price"
+            params = {
+                "ids": ",".join(token_ids),
+                "vs_currencies": currency,
+                "include_24hr_change": "true",
+                "include_market_cap": "true"
+            }
+            
+            if self.api_key:
+                params["x_cg_pro_api_key"] = self.api_key
+            
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            
+            # Extract prices
+            prices = {}
+            for token_id, token_data in data.items():
+                prices[token_id] = token_data.get(currency, 0)
+            
+            return prices
+            
         except Exception as e:
             print(f"Error fetching current prices: {e}")
             return {}
     
-    def normalize_data(self, prices: List[float]) -> List[float]:
+    def normalize_data(self, prices: Union[Sequence[float], np.ndarray]) -> np.ndarray:
         """
         Normalize price data for ML model input
         
         Args:
-            prices: List of price values
+            prices: Price values (list or array)
+        
+        Returns:
+            Normalized prices (0-1 range) as a float32 array
+        """
+        return self.normalize_with_range(prices)[0]
+    
+    def normalize_with_range(
+        self,
+        prices: Union[Sequence[float], np.ndarray]
+    ) -> Tuple[np.ndarray, float, float]:
+        """
+        Normalize price data and return the range used, for denormalize_data
+        
+        Args:
+            prices: Price values (list or array)
         
         Returns:
-            Normalized prices (0-1 range)
+            Tuple of (normalized float32 prices, original min, original max)
         """
-        if not prices:
-            return []
+        arr = np.ascontiguousarray(prices, dtype=np.float32)
+        if arr.size == 0:
+            return arr, 0.0, 0.0
         
-        min_price = min(prices)
-        max_price = max(prices)
+        min_price = arr.min()
+        max_price = arr.max()
         
         if max_price == min_price:
-            return [0.5] * len(prices)
+            return np.full_like(arr, 0.5), float(min_price), float(max_price)
         
-        return [(p - min_price) / (max_price - min_price) for p in prices]
+        # one temporary: subtract into a new array, then scale it in place
+        normalized = np.subtract(arr, min_price)
+        normalized *= np.float32(1.0) / (max_price - min_price)
+        return normalized, float(min_price), float(max_price)
     
     def denormalize_data(
         self, 
-        normalized_prices: List[float],
+        normalized_prices: Union[Sequence[float], np.ndarray],
         original_min: float,
         original_max: float
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Denormalize price data back to original scale
         
         Args:
-            normalized_prices: Normalized price values
+            normalized_prices: Normalized price values (list or array)
             original_min: Original minimum price
             original_max: Original maximum price
         
         Returns:
-            Denormalized prices
+            Denormalized prices as a float64 array
         """
-        return [
-            p * (original_max - original_min) + original_min 
-            for p in normalized_prices
-        ]
+        scale = original_max - original_min
+        prices = np.multiply(normalized_prices, scale, dtype=np.float64)
+        prices += original_min
+        return prices
@@ -1,21 +1,90 @@
 import os
+import mmap
 import pickle
-from typing import Optional
+import threading
+from typing import Callable, Iterable, Optional
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Models loaded in this process, keyed by (path, mtime), so every loader
+# shares one copy and a model is only reloaded when its file changes
+_model_cache = {}
+_model_cache_lock = threading.Lock()
+
+
+def _cached_load(path: str, load: Callable):
+    """Load a model file once per process, reusing it until the file changes"""
+    key = (os.path.abspath(path), os.path.getmtime(path))
+    with _model_cache_lock:
+        if key not in _model_cache:
+            # drop copies of older versions of this file
+            for stale in [k for k in _model_cache if k[0] == key[0]]:
+                del _model_cache[stale]
+            _model_cache[key] = load(path)
+        return _model_cache[key]
+
+
+def _load_keras(path: str):
+    from tensorflow import keras
+    # inference only: skip rebuilding the optimizer and losses
+    return keras.models.load_model(path, compile=False)
+
+
+def _load_npz(path: str):
+    # plain arrays only: allow_pickle=False means the file cannot run code
+    with np.load(path, allow_pickle=False) as archive:
+        return {name: archive[name] for name in archive.files}
+
+
+def _load_pickle(path: str):
+    # unpickle straight from the page cache instead of reading a copy first
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
+
+
+def _is_quantized(details: dict) -> bool:
+    # integer tensor with a real scale; dynamic-range models keep float32
+    # inputs and outputs with quantization (0.0, 0)
+    return np.issubdtype(details["dtype"], np.integer) and details["quantization"][0] != 0
+
+
+def _quantize(values: np.ndarray, details: dict) -> np.ndarray:
+    if not _is_quantized(details):
+        return values.astype(details["dtype"], copy=False)
+    scale, zero_point = details["quantization"]
+    limits = np.iinfo(details["dtype"])
+    return np.clip(np.round(values / scale + zero_point), limits.min, limits.max).astype(details["dtype"])
+
+
+def _dequantize(values: np.ndarray, details: dict) -> np.ndarray:
+    if not _is_quantized(details):
+        return values.astype(np.float32, copy=False)
+    scale, zero_point = details["quantization"]
+    return (values.astype(np.float32) - zero_point) * scale
+
+
 class ModelLoader:
     """Utility class for loading and managing ML models"""
     
     def __init__(self):
         self.lstm_model = None
+        self.lstm_quantized = False
         self.mpt_model = None
         self.lstm_path = os.getenv("LSTM_MODEL_PATH", "./models/lstm_price_forecast.h5")
+        self.quantized_lstm_path = os.getenv("LSTM_TFLITE_PATH", "./models/lstm_price_forecast_int8.tflite")
         self.mpt_path = os.getenv("MPT_MODEL_PATH", "./models/mpt_optimizer.pkl")
+        self.mpt_npz_path = os.getenv("MPT_NPZ_PATH", os.path.splitext(self.mpt_path)[0] + ".npz")
     
     def load_lstm_model(self):
-        """Load LSTM price forecasting model"""
+        """Load LSTM price forecasting model, preferring the INT8 TFLite build"""
+        if os.path.exists(self.quantized_lstm_path):
+            interpreter = self.load_quantized_lstm()
+            if interpreter is not None:
+                return interpreter
+        
         try:
             if not os.path.exists(self.lstm_path):
                 logger.warning(f"LSTM model not found at {self.lstm_path}")
@@ -23,8 +92,8 @@ class ModelLoader:
             
             # Import TensorFlow only when needed
             try:
-                from tensorflow import keras
-                self.lstm_model = keras.models.load_model(self.lstm_path)
+                self.lstm_model = _cached_load(self.lstm_path, _load_keras)
+                self.lstm_quantized = False
                 logger.info("✅ LSTM model loaded successfully")
                 return self.lstm_model
             except ImportError:
@@ -35,15 +104,104 @@ class ModelLoader:
             logger.error(f"Error loading LSTM model: {e}")
             return None
     
+    def load_quantized_lstm(self):
+        """Load the INT8 TFLite LSTM model into an interpreter"""
+        try:
+            if not os.path.exists(self.quantized_lstm_path):
+                logger.warning(f"Quantized LSTM model not found at {self.quantized_lstm_path}")
+                return None
+            
+            try:
+                import tensorflow as tf
+                interpreter = tf.lite.Interpreter(model_path=self.quantized_lstm_path)
+                interpreter.allocate_tensors()
+                self.lstm_model = interpreter
+                self.lstm_quantized = True
+                logger.info("✅ Quantized LSTM model loaded successfully")
+                return self.lstm_model
+            except ImportError:
+                logger.error("TensorFlow not installed. Cannot load quantized LSTM model.")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error loading quantized LSTM model: {e}")
+            return None
+    
+    def quantize_lstm_model(self, representative_data: Iterable[np.ndarray], path: Optional[str] = None):
+        """
+        Convert the Keras LSTM model to a full-integer INT8 TFLite model
+        
+        Args:
+            representative_data: Input batches of normalized historical prices,
+                shaped like the model input, used to calibrate activation ranges
+            path: Output path (default: LSTM_TFLITE_PATH)
+        """
+        try:
+            import tensorflow as tf
+            
+            keras_model = _cached_load(self.lstm_path, _load_keras)
+            
+            def representative_dataset():
+                for batch in representative_data:
+                    yield [np.asarray(batch, dtype=np.float32)]
+            
+            converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            converter.representative_dataset = representative_dataset
+            converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+            converter.inference_input_type = tf.int8
+            converter.inference_output_type = tf.int8
+            
+            save_path = path or self.quantized_lstm_path
+            with open(save_path, 'wb') as f:
+                f.write(converter.convert())
+            logger.info(f"✅ Quantized LSTM model saved to {save_path}")
+        except ImportError:
+            logger.error("TensorFlow not installed. Cannot quantize LSTM model.")
+        except Exception as e:
+            logger.error(f"Error quantizing LSTM model: {e}")
+    
+    def predict_lstm(self, inputs: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Run the LSTM model on a batch of normalized inputs
+        
+        Args:
+            inputs: Model-shaped batch of normalized prices
+        
+        Returns:
+            Model output as float32, or None if no model is available
+        """
+        model = self.get_lstm_model()
+        if model is None:
+            return None
+        
+        inputs = np.asarray(inputs, dtype=np.float32)
+        if not self.lstm_quantized:
+            return model.predict(inputs, verbose=0)
+        
+        input_details = model.get_input_details()[0]
+        output_details = model.get_output_details()[0]
+        if tuple(input_details["shape"]) != inputs.shape:
+            model.resize_tensor_input(input_details["index"], inputs.shape)
+            model.allocate_tensors()
+        
+        model.set_tensor(input_details["index"], _quantize(inputs, input_details))
+        model.invoke()
+        return _dequantize(model.get_tensor(output_details["index"]), output_details)
+    
     def load_mpt_model(self):
-        """Load MPT portfolio optimization model"""
+        """Load MPT portfolio optimization model, preferring the .npz arrays over pickle"""
         try:
+            if os.path.exists(self.mpt_npz_path):
+                self.mpt_model = _cached_load(self.mpt_npz_path, _load_npz)
+                logger.info("✅ MPT model loaded successfully")
+                return self.mpt_model
+            
             if not os.path.exists(self.mpt_path):
                 logger.warning(f"MPT model not found at {self.mpt_path}")
                 return None
             
-            with open(self.mpt_path, 'rb') as f:
-                self.mpt_model = pickle.load(f)
+            self.mpt_model = _cached_load(self.mpt_path, _load_pickle)
             
             logger.info("✅ MPT model loaded successfully")
             return self.mpt_model
@@ -74,14 +232,30 @@ class ModelLoader:
             logger.error(f"Error saving LSTM model: {e}")
     
     def save_mpt_model(self, model, path: Optional[str] = None):
-        """Save MPT model to disk"""
+        """Save MPT model to disk (.npz for a dict of arrays, pickle otherwise)"""
         try:
-            save_path = path or self.mpt_path
-            with open(save_path, 'wb') as f:
-                pickle.dump(model, f)
+            if isinstance(model, dict):
+                save_path = path or self.mpt_npz_path
+                with open(save_path, 'wb') as f:
+                    np.savez(f, **model)
+            else:
+                save_path = path or self.mpt_path
+                with open(save_path, 'wb') as f:
+                    pickle.dump(model, f)
             logger.info(f"✅ MPT model saved to {save_path}")
         except Exception as e:
             logger.error(f"Error saving MPT model: {e}")
+    
+    def convert_mpt_model(self):
+        """One-time conversion of the pickled MPT model to .npz"""
+        try:
+            model = _load_pickle(self.mpt_path)
+            if not isinstance(model, dict):
+                logger.error("MPT model is not a dict of arrays. Cannot convert to .npz.")
+                return
+            self.save_mpt_model(model)
+        except Exception as e:
+            logger.error(f"Error converting MPT model: {e}")
 
 # Global model loader instance
 model_loader = ModelLoader()